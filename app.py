@@ -3,9 +3,106 @@ AI Text Summarizer - Main Application
 A simple Streamlit app that summarizes text using AI
 """
 
+import time
+
 import streamlit as st
-from summarizer import summarize_text, validate_input
-from utils import count_words, count_characters, estimate_reading_time
+from logger import log_summarization
+from src.ai_summarizer import SummarizerService, SummaryCache, SummaryResult, settings
+from src.ai_summarizer.core.breaker import CircuitBreaker
+from src.ai_summarizer.core.codec import WireCodec
+from src.ai_summarizer.core.hedging import Hedger
+from src.ai_summarizer.core.routing import EndpointPool
+from src.ai_summarizer.health import health_checker
+from src.ai_summarizer.tracing import JsonLinesExporter, SlowRequestLog, get_tracer
+from src.ai_summarizer.utils.helpers import text_stats
+from src.ai_summarizer.utils.validators import normalize_text
+
+
+class SummaryFailed(Exception):
+    """Raised inside the data cache so failed summaries are not memoized."""
+
+
+@st.cache_resource
+def get_service() -> SummarizerService:
+    """One summarizer service (and connection pool) per server process."""
+    if settings.trace_file:
+        tracer = get_tracer()
+        tracer.add_exporter(JsonLinesExporter(settings.trace_file))
+        tracer.add_exporter(SlowRequestLog(settings.slow_request_seconds))
+    breaker = None
+    if settings.circuit_failure_threshold:
+        breaker = CircuitBreaker(
+            settings.circuit_failure_threshold, settings.circuit_reset_seconds
+        )
+    health_checker.breaker = breaker
+    return SummarizerService(
+        api_key=settings.huggingface_api_key,
+        api_url=settings.api_url,
+        timeout=settings.api_timeout,
+        cache=SummaryCache(),
+        fallback=True,
+        stream_url=settings.stream_url or None,
+        endpoints=EndpointPool(settings.api_urls) if settings.api_urls else None,
+        hedger=Hedger(max_fraction=settings.hedge_fraction) if settings.hedge_fraction else None,
+        breaker=breaker,
+        codec=WireCodec(compression=settings.request_compression or None)
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def summarize_cached(text: str, max_length: int, min_length: int) -> SummaryResult:
+    """Summarize text, memoized across reruns, sessions and browser tabs."""
+    started = time.perf_counter()
+    result = get_service().summarize_long(text, max_length, min_length)
+    elapsed = time.perf_counter() - started
+    if not result.success:
+        health_checker.record_error(elapsed, len(text))
+        raise SummaryFailed(result.error)
+    health_checker.record_request(elapsed, len(text))
+    log_summarization(
+        result.input_length, result.output_length, elapsed, result.cached, result.attempts
+    )
+    return result
+
+
+def render_summary(placeholder, summary: str, streaming: bool = False) -> None:
+    """Draw the summary box, with a cursor while more text is coming."""
+    cursor = "▌" if streaming else ""
+    placeholder.markdown(f"""
+    <div class="summary-box">
+        {summary}{cursor}
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def summarize_streaming(text: str, max_length: int, min_length: int) -> SummaryResult:
+    """Render a streamed summary segment by segment as it arrives."""
+    placeholder = st.empty()
+    started = time.perf_counter()
+    summary = ""
+    stream = get_service().summarize_stream(text, max_length, min_length)
+    with st.spinner("🔄 Generating summary..."):
+        first_segment = next(stream, None)
+    if first_segment is not None:
+        summary = first_segment
+        render_summary(placeholder, summary, streaming=True)
+        for segment in stream:
+            summary += segment
+            render_summary(placeholder, summary, streaming=True)
+    result = stream.read()
+    elapsed = time.perf_counter() - started
+    if result.success:
+        health_checker.record_request(elapsed, len(text))
+        log_summarization(
+            result.input_length, result.output_length, elapsed, result.cached, result.attempts
+        )
+        render_summary(placeholder, result.summary or "")
+    else:
+        health_checker.record_error(elapsed, len(text))
+        if not summary:
+            placeholder.empty()
+    return result
+
 
 # Page configuration
 st.set_page_config(
@@ -103,17 +200,15 @@ input_text = st.text_area(
 
 # Stats display
 if input_text:
-    word_count = count_words(input_text)
-    char_count = count_characters(input_text)
-    reading_time = estimate_reading_time(input_text)
+    stats = text_stats(input_text, settings.words_per_minute)
     
     col_stat1, col_stat2, col_stat3 = st.columns(3)
     with col_stat1:
-        st.metric("📊 Words", word_count)
+        st.metric("📊 Words", stats.words)
     with col_stat2:
-        st.metric("🔤 Characters", char_count)
+        st.metric("🔤 Characters", stats.characters_no_spaces)
     with col_stat3:
-        st.metric("⏱️ Reading Time", reading_time)
+        st.metric("⏱️ Reading Time", stats.reading_time)
 
 # Columns for buttons
 col1, col2, col3 = st.columns([1, 2, 1])
@@ -123,34 +218,61 @@ with col2:
 
 # Summarize action
 if summarize_btn:
-    if input_text.strip():
-        # Validate input first
-        validation = validate_input(input_text)
+    with get_tracer().span("app.request", input_chars=len(input_text)):
+        if input_text.strip():
+            # Validate and normalize input in one pass
+            normalized = normalize_text(
+                input_text,
+                min_length=settings.min_text_length,
+                max_length=settings.max_text_length
+            )
         
-        if not validation["valid"]:
-            st.warning(f"⚠️ {validation['error']}")
-        else:
-            with st.spinner("🔄 Generating summary..."):
-                result = summarize_text(input_text)
-                
-                if result["success"]:
-                    st.success("✅ Summary generated successfully!")
-                    st.markdown("### 📋 Summary")
-                    st.markdown(f"""
-                    <div class="summary-box">
-                        {result["summary"]}
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Show summary statistics
-                    summary_words = count_words(result["summary"])
-                    original_words = count_words(input_text)
-                    reduction = round((1 - summary_words / original_words) * 100, 1) if original_words > 0 else 0
-                    st.caption(f"📉 Reduced from {original_words} to {summary_words} words ({reduction}% reduction)")
+            if not normalized.is_valid:
+                st.warning(f"⚠️ {normalized.error}")
+            elif not settings.is_configured:
+                st.error("❌ API key not configured. Please set HUGGINGFACE_API_KEY in .env file.")
+            elif settings.stream_url:
+                st.markdown("### 📋 Summary")
+                result = summarize_streaming(
+                    input_text.strip(),
+                    settings.default_max_summary_length,
+                    settings.default_min_summary_length
+                )
+                if result.success:
+                    st.caption(
+                        f"📉 Reduced from {result.input_words} to {result.output_words} words "
+                        f"({result.word_reduction_percent}% reduction)"
+                    )
                 else:
-                    st.error(f"❌ {result['error']}")
-    else:
-        st.warning("⚠️ Please enter some text to summarize.")
+                    st.error(f"❌ {result.error}")
+            else:
+                with st.spinner("🔄 Generating summary..."):
+                    try:
+                        # Chunking splits on the paragraph breaks that
+                        # normalization collapses, so send the original text
+                        result = summarize_cached(
+                            input_text.strip(),
+                            settings.default_max_summary_length,
+                            settings.default_min_summary_length
+                        )
+                    except SummaryFailed as e:
+                        st.error(f"❌ {e}")
+                    else:
+                        st.success("✅ Summary generated successfully!")
+                        st.markdown("### 📋 Summary")
+                        st.markdown(f"""
+                        <div class="summary-box">
+                            {result.summary}
+                        </div>
+                        """, unsafe_allow_html=True)
+                    
+                        # Show summary statistics
+                        st.caption(
+                            f"📉 Reduced from {result.input_words} to {result.output_words} words "
+                            f"({result.word_reduction_percent}% reduction)"
+                        )
+        else:
+            st.warning("⚠️ Please enter some text to summarize.")
 
 # Footer
 st.divider()
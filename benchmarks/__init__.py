@@ -0,0 +1,3 @@
+"""
+Benchmarks package - Performance measurements for the summarizer.
+"""
@@ -0,0 +1,177 @@
+"""
+Hot Path Benchmarks - Microbenchmarks for text processing functions.
+
+Usage:
+    python -m benchmarks.hotpaths --output results.json
+    python -m benchmarks.hotpaths --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.ai_summarizer.core.codec import WireCodec
+from src.ai_summarizer.core.summarizer import SummarizerService
+from src.ai_summarizer.utils.helpers import count_words, sanitize_text, truncate_text
+from src.ai_summarizer.utils.validators import validate_text
+
+SIZES = (50, 500, 5000, 50000)
+KINDS = ("ascii", "unicode", "whitespace")
+DEFAULT_THRESHOLD = 0.25
+
+_SEEDS = {
+    "ascii": "The quick brown fox jumps over the lazy dog. ",
+    "unicode": "Ünïcödé text — naïve café façade, 東京 и Москва. ",
+    "whitespace": "word \t\n    \n\n\t   ",
+}
+
+_SERVICE = SummarizerService(api_key="benchmark")
+_GZIP = WireCodec(compression="gzip")
+
+FUNCTIONS: Dict[str, Callable[[str], Any]] = {
+    "count_words": count_words,
+    "sanitize_text": sanitize_text,
+    "validate_text": lambda text: validate_text(text, min_length=1, max_length=50000),
+    "truncate_text": lambda text: truncate_text(text, max_length=100),
+    "build_payload": lambda text: json.dumps(_SERVICE._build_payload(text, 150, 30)),
+    "encode_payload": lambda text: _GZIP.encode(_SERVICE._build_payload(text, 150, 30)),
+}
+
+
+def make_input(kind: str, size: int) -> str:
+    """
+    Build a benchmark input of an exact length.
+
+    Args:
+        kind: One of KINDS
+        size: Length in characters
+
+    Returns:
+        Input text
+    """
+    seed = _SEEDS[kind]
+    return (seed * (size // len(seed) + 1))[:size]
+
+
+def _time_call(
+    fn: Callable[[str], Any],
+    text: str,
+    repeat: int,
+    min_time: float
+) -> float:
+    """Return the best observed nanoseconds per call."""
+    timer = timeit.Timer(lambda: fn(text))
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def run(
+    functions: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.01
+) -> Dict[str, Any]:
+    """
+    Run the benchmark matrix.
+
+    Args:
+        functions: Names from FUNCTIONS to run; all if omitted
+        repeat: Timing repetitions per case; the fastest is kept
+        min_time: Minimum seconds per repetition
+
+    Returns:
+        Machine-readable results keyed by case name
+    """
+    results: Dict[str, float] = {}
+    for name in functions or FUNCTIONS:
+        fn = FUNCTIONS[name]
+        for kind in KINDS:
+            for size in SIZES:
+                case = f"{name}[{kind}-{size}]"
+                text = make_input(kind, size)
+                results[case] = round(_time_call(fn, text, repeat, min_time), 1)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "unit": "ns_per_call",
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Find cases that slowed down beyond a threshold.
+
+    Args:
+        baseline: Results from a previous run
+        current: Results from this run
+        threshold: Allowed relative slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        List of (case, baseline_ns, current_ns, slowdown) for regressions
+    """
+    regressions = []
+    for case, now in current["results"].items():
+        before = baseline["results"].get(case)
+        if not before:
+            continue
+        slowdown = now / before - 1
+        if slowdown > threshold:
+            regressions.append((case, before, now, slowdown))
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown before failing (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--function",
+        action="append",
+        choices=sorted(FUNCTIONS),
+        help="Only run this function (repeatable)"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    current = run(args.function, args.repeat)
+    for case, ns in current["results"].items():
+        print(f"{case:<40} {ns:>14,.1f} ns")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for case, before, now, slowdown in regressions:
+            print(
+                f"REGRESSION {case}: {before:,.1f} -> {now:,.1f} ns (+{slowdown:.0%})",
+                file=sys.stderr
+            )
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
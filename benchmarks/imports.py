@@ -0,0 +1,155 @@
+"""
+Import Time Benchmarks - Cold start of the package, CLI and Streamlit app.
+
+Usage:
+    python -m benchmarks.imports
+    python -m benchmarks.imports --target package --budget package=0.05
+"""
+
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds allowed on top of a bare interpreter start
+DEFAULT_BUDGETS: Dict[str, float] = {
+    "package": 0.1,
+    "cli": 0.15,
+    "app": 3.0,
+}
+
+_IMPORTTIME = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def app_imports(path: str = os.path.join(ROOT, "app.py")) -> str:
+    """
+    Collect the import statements of a script without running it.
+
+    Args:
+        path: Script to read
+
+    Returns:
+        Source code containing only the script's top-level imports
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    return "\n".join(
+        ast.get_source_segment(source, node) or ""
+        for node in ast.parse(source, path).body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
+def target_code(target: str) -> str:
+    """Return the code whose cold start is measured for a target."""
+    if target == "package":
+        return "import src.ai_summarizer"
+    if target == "cli":
+        return "from src.ai_summarizer.cli import build_parser; build_parser()"
+    if target == "app":
+        return app_imports()
+    raise ValueError(f"Unknown target: {target}")
+
+
+def _start(code: str, extra_args: Sequence[str] = ()) -> Tuple[float, str]:
+    """Run code in a fresh interpreter; return wall time and stderr."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, *extra_args, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return time.perf_counter() - started, completed.stderr
+
+
+def measure(target: str, repeat: int = 5) -> float:
+    """
+    Measure a target's cold start net of interpreter startup.
+
+    Args:
+        target: One of DEFAULT_BUDGETS
+        repeat: Interpreter starts per measurement; the fastest is kept
+
+    Returns:
+        Seconds spent beyond a bare ``python -c pass``
+    """
+    code = target_code(target)
+    baseline = min(_start("pass")[0] for _ in range(repeat))
+    elapsed = min(_start(code)[0] for _ in range(repeat))
+    return max(0.0, elapsed - baseline)
+
+
+def slowest_imports(target: str, top: int = 10) -> List[Tuple[str, float]]:
+    """
+    List the top-level imports of a target by cumulative import time.
+
+    Args:
+        target: One of DEFAULT_BUDGETS
+        top: Number of modules to return
+
+    Returns:
+        List of (module, seconds), slowest first
+    """
+    _, startup = _start("pass", ["-X", "importtime"])
+    preloaded = {match.group(3) for match in _IMPORTTIME.finditer(startup)}
+    _, stderr = _start(target_code(target), ["-X", "importtime"])
+    entries = []
+    for match in _IMPORTTIME.finditer(stderr):
+        cumulative, indent, module = match.groups()
+        if len(indent) == 1 and module not in preloaded:
+            entries.append((module, int(cumulative) / 1e6))
+    return sorted(entries, key=lambda entry: entry[1], reverse=True)[:top]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=sorted(DEFAULT_BUDGETS),
+        help="Only measure this target (repeatable)"
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="TARGET=SECONDS",
+        help="Override a target's budget"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=0,
+        help="Also list the N slowest top-level imports of each target"
+    )
+    args = parser.parse_args(argv)
+
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        name, _, seconds = item.partition("=")
+        budgets[name] = float(seconds)
+
+    over_budget = False
+    for target in args.target or sorted(DEFAULT_BUDGETS):
+        elapsed = measure(target, args.repeat)
+        budget = budgets[target]
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        over_budget = over_budget or elapsed > budget
+        print(f"{target:<10} {elapsed * 1000:>9.1f} ms  (budget {budget * 1000:.0f} ms) {status}")
+        for module, seconds in slowest_imports(target, args.top) if args.top else []:
+            print(f"    {module:<40} {seconds * 1000:>9.1f} ms")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+Load Test - Requests per CPU-second of the HTTP server and the Streamlit app.
+
+Usage:
+    python -m benchmarks.loadtest
+    python -m benchmarks.loadtest --connections 64 --duration 20 --unique
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000
+    python -m benchmarks.loadtest --streamlit 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from src.ai_summarizer.metrics import LatencyHistogram
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEXT = (
+    "Load testing measures how many requests a service sustains and how "
+    "latency degrades as concurrency grows. This paragraph is the payload. "
+)
+
+
+class _EchoUpstream(BaseHTTPRequestHandler):
+    """Instant stand-in for the inference endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        inputs = body["inputs"]
+        items = inputs if isinstance(inputs, list) else [inputs]
+        data = json.dumps([{"summary_text": text[:60]} for text in items]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _serve() -> None:
+    """Run the API server against an in-process upstream; print its port."""
+    from src.ai_summarizer.core.cache import SummaryCache
+    from src.ai_summarizer.core.concurrency import AdaptiveLimiter
+    from src.ai_summarizer.core.summarizer import SummarizerService
+    from src.ai_summarizer.server import SummaryServer
+
+    upstream = ThreadingHTTPServer(("127.0.0.1", 0), _EchoUpstream)
+    upstream.daemon_threads = True
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+    service = SummarizerService(
+        api_key="loadtest",
+        api_url=f"http://127.0.0.1:{upstream.server_address[1]}/",
+        cache=SummaryCache(),
+        limiter=AdaptiveLimiter(initial_limit=64, max_limit=256)
+    )
+    server = SummaryServer(service, max_concurrency=1024)
+
+    async def run() -> None:
+        await server.start("127.0.0.1", 0)
+        print(server.address[1], flush=True)
+        await server.serve_forever()
+
+    asyncio.run(run())
+
+
+def _cpu_seconds(pid: int) -> Optional[float]:
+    """User plus system CPU time of a process, where /proc is available."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def _client(
+    host: str,
+    port: int,
+    deadline: float,
+    unique: bool,
+    client_id: int,
+    histogram: LatencyHistogram,
+    statuses: Dict[int, int]
+) -> None:
+    """Send requests back to back on one keep-alive connection."""
+    reader, writer = await asyncio.open_connection(host, port)
+    sequence = 0
+    try:
+        while time.perf_counter() < deadline:
+            text = f"{TEXT} {client_id}-{sequence}" if unique else TEXT
+            sequence += 1
+            body = json.dumps({"text": text}).encode()
+            started = time.perf_counter()
+            writer.write(
+                f"POST /summarize HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                .encode() + body
+            )
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            histogram.observe(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def _load(
+    host: str,
+    port: int,
+    connections: int,
+    duration: float,
+    unique: bool
+) -> Tuple[LatencyHistogram, Dict[int, int]]:
+    histogram = LatencyHistogram()
+    statuses: Dict[int, int] = {}
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        _client(host, port, deadline, unique, i, histogram, statuses)
+        for i in range(connections)
+    ))
+    return histogram, statuses
+
+
+def run_server_load(
+    url: Optional[str],
+    connections: int,
+    duration: float,
+    unique: bool
+) -> Dict[str, float]:
+    """
+    Load the HTTP server with concurrent keep-alive clients.
+
+    Args:
+        url: Server to test, or None to start one against a local upstream
+        connections: Concurrent connections
+        duration: Seconds to run
+        unique: Send a distinct text per request so every one goes upstream
+
+    Returns:
+        Requests/sec, latency percentiles and, for a local server,
+        requests per CPU-second of the server process
+    """
+    process = None
+    if url is None:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.loadtest", "--serve"],
+            cwd=ROOT,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        assert process.stdout is not None
+        host, port = "127.0.0.1", int(process.stdout.readline())
+    else:
+        split = urlsplit(url)
+        host, port = split.hostname or "127.0.0.1", split.port or 80
+
+    try:
+        # Warm the connection pool and cache before measuring
+        asyncio.run(_load(host, port, 1, 0.2, False))
+        cpu_before = _cpu_seconds(process.pid) if process else None
+        started = time.perf_counter()
+        histogram, statuses = asyncio.run(_load(host, port, connections, duration, unique))
+        elapsed = time.perf_counter() - started
+        cpu_after = _cpu_seconds(process.pid) if process else None
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    result = {
+        "requests": float(histogram.count),
+        "requests_per_second": histogram.count / elapsed,
+        "p50_ms": histogram.quantile(0.5) * 1000,
+        "p99_ms": histogram.quantile(0.99) * 1000,
+        "errors": float(sum(n for status, n in statuses.items() if status != 200)),
+    }
+    if cpu_before is not None and cpu_after is not None and cpu_after > cpu_before:
+        result["requests_per_cpu_second"] = histogram.count / (cpu_after - cpu_before)
+    return result
+
+
+def run_streamlit_reruns(iterations: int) -> Dict[str, float]:
+    """
+    Time Streamlit script reruns that summarize a cached text.
+
+    Each click in the UI reruns app.py top to bottom, so this is the
+    least work the Streamlit process does per summary.
+
+    Args:
+        iterations: Reruns to time
+
+    Returns:
+        Reruns per wall-clock second and per CPU-second
+    """
+    os.environ.setdefault("HUGGINGFACE_API_KEY", "loadtest")
+    from unittest import mock
+
+    from streamlit.testing.v1 import AppTest
+
+    from src.ai_summarizer.core.summarizer import SummaryResult
+
+    cached = SummaryResult(success=True, summary=TEXT[:60], input_words=20, output_words=10)
+    with mock.patch(
+        "src.ai_summarizer.core.summarizer.SummarizerService.summarize_long",
+        return_value=cached
+    ):
+        app = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60).run()
+        app.text_area[0].input(TEXT)
+        cpu_started, started = time.process_time(), time.perf_counter()
+        for _ in range(iterations):
+            app.button[0].click().run()
+        cpu, elapsed = time.process_time() - cpu_started, time.perf_counter() - started
+    return {
+        "reruns": float(iterations),
+        "reruns_per_second": iterations / elapsed,
+        "reruns_per_cpu_second": iterations / cpu if cpu else 0.0,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--url", help="Test a running server instead of a local one")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="Send distinct texts so no request is a cache hit"
+    )
+    parser.add_argument(
+        "--streamlit",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also time N Streamlit reruns for comparison"
+    )
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        _serve()
+        return 0
+
+    rows: List[Tuple[str, Dict[str, float]]] = [(
+        "http server",
+        run_server_load(args.url, args.connections, args.duration, args.unique)
+    )]
+    if args.streamlit:
+        rows.append(("streamlit", run_streamlit_reruns(args.streamlit)))
+    for name, result in rows:
+        print(f"{name}:")
+        for key, value in result.items():
+            print(f"    {key:<26} {value:>12,.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
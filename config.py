@@ -3,18 +3,17 @@ Configuration Module
 Centralized configuration settings for the AI Text Summarizer
 """
 
-import os
-from dotenv import load_dotenv
+from src.ai_summarizer.config import get_settings
 
-# Load environment variables
-load_dotenv()
+# Environment variables are loaded once, by the package settings
+_settings = get_settings()
 
 
 class Config:
     """Application configuration class."""
     
     # API Settings
-    HUGGINGFACE_API_KEY = os.getenv("HUGGINGFACE_API_KEY", "")
+    HUGGINGFACE_API_KEY = _settings.huggingface_api_key
     API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
     API_TIMEOUT = 30  # seconds
     
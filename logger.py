@@ -3,18 +3,107 @@ Logger Module
 Logging configuration for the AI Text Summarizer
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
 
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime"
+}
 
-def setup_logger(name: str = "ai_summarizer", level: int = logging.INFO) -> logging.Logger:
+DEFAULT_QUEUE_SIZE = 10000
+
+_listeners: List[QueueListener] = []
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, with extra fields."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+@dataclass
+class QueueStats:
+    """Snapshot of queued logging counters."""
+    enqueued: int
+    dropped: int
+    queue_depth: int
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the logging thread.
+    
+    Records are handed to a bounded queue unformatted; the listener thread
+    builds the message. When the queue is full the record is dropped and
+    counted instead. Log arguments should therefore be immutable values.
+    """
+    
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through; formatting happens on the listener."""
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        else:
+            self.enqueued += 1
+    
+    @property
+    def stats(self) -> QueueStats:
+        """Current enqueue and drop counters."""
+        return QueueStats(
+            enqueued=self.enqueued,
+            dropped=self.dropped,
+            queue_depth=self.queue.qsize()
+        )
+
+
+def setup_logger(
+    name: str = "ai_summarizer",
+    level: int = logging.INFO,
+    json_lines: bool = False,
+    queued: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    stream: Any = None
+) -> logging.Logger:
     """
     Set up and configure a logger instance.
     
     Args:
         name: Name of the logger
         level: Logging level (default: INFO)
+        json_lines: Emit JSON lines with structured fields instead of text
+        queued: Write from a background thread through a bounded queue
+        queue_size: Maximum records waiting in the queue before dropping
+        stream: Output stream (default: sys.stdout)
     
     Returns:
         Configured logger instance
@@ -27,43 +116,107 @@ def setup_logger(name: str = "ai_summarizer", level: int = logging.INFO) -> logg
         return logger
     
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(stream or sys.stdout)
     console_handler.setLevel(level)
     
     # Format
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    if json_lines:
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(console_handler)
+    if queued:
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+        listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+        logger.addHandler(DroppingQueueHandler(log_queue))
+    else:
+        logger.addHandler(console_handler)
     
     return logger
 
 
+def queue_stats(target: Optional[logging.Logger] = None) -> Optional[QueueStats]:
+    """
+    Get the queue counters of a logger set up with ``queued=True``.
+    
+    Args:
+        target: Logger to inspect (default: the module logger)
+    
+    Returns:
+        QueueStats, or None if the logger is not queued
+    """
+    for handler in (target or logger).handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            return handler.stats
+    return None
+
+
+@atexit.register
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listeners."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
 # Create default logger instance
-logger = setup_logger()
+logger = setup_logger(
+    json_lines=os.getenv("LOG_FORMAT", "").lower() == "json",
+    queued=os.getenv("LOG_QUEUE", "").lower() in ("1", "true", "yes")
+)
 
 
 def log_api_request(endpoint: str, method: str = "POST"):
     """Log an API request."""
-    logger.info(f"API Request: {method} {endpoint}")
+    logger.info(
+        "API Request: %s %s", method, endpoint,
+        extra={"method": method, "endpoint": endpoint}
+    )
 
 
-def log_api_response(status_code: int, response_time: float = None):
+def log_api_response(status_code: int, response_time: float = None, attempts: int = None):
     """Log an API response."""
-    time_str = f" ({response_time:.2f}s)" if response_time else ""
-    logger.info(f"API Response: Status {status_code}{time_str}")
+    extra = {"status_code": status_code, "latency_seconds": response_time, "attempts": attempts}
+    if response_time:
+        logger.info("API Response: Status %s (%.2fs)", status_code, response_time, extra=extra)
+    else:
+        logger.info("API Response: Status %s", status_code, extra=extra)
 
 
 def log_error(error: Exception, context: str = None):
     """Log an error with optional context."""
-    context_str = f" [{context}]" if context else ""
-    logger.error(f"Error{context_str}: {type(error).__name__}: {str(error)}")
+    extra = {"error_type": type(error).__name__, "context": context}
+    if context:
+        logger.error("Error [%s]: %s: %s", context, type(error).__name__, error, extra=extra)
+    else:
+        logger.error("Error: %s: %s", type(error).__name__, error, extra=extra)
 
 
-def log_summarization(input_length: int, output_length: int):
+def log_summarization(
+    input_length: int,
+    output_length: int,
+    latency: float = None,
+    cache_hit: bool = None,
+    attempts: int = None
+):
     """Log summarization statistics."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     reduction = round((1 - output_length / input_length) * 100, 1) if input_length > 0 else 0
-    logger.info(f"Summarization: {input_length} -> {output_length} chars ({reduction}% reduction)")
+    logger.info(
+        "Summarization: %s -> %s chars (%s%% reduction)",
+        input_length, output_length, reduction,
+        extra={
+            "input_length": input_length,
+            "output_length": output_length,
+            "reduction_percent": reduction,
+            "latency_seconds": latency,
+            "cache_hit": cache_hit,
+            "attempts": attempts,
+        }
+    )
@@ -5,16 +5,48 @@ This package provides an AI-powered text summarization tool using
 Large Language Models through the Hugging Face Inference API.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "Vishwas Mehta"
 __email__ = "vishwas.mehta@example.com"
 
-# Public API exports
-from .core import SummarizerService
-from .config import settings
+# Public API exports, imported on first access so that importing the
+# package does not pull in requests and the HTTP stack
+_LAZY_EXPORTS = {
+    "SummarizerService": ".core",
+    "SummaryResult": ".core",
+    "SummaryCache": ".core",
+    "settings": ".config",
+    "get_settings": ".config",
+    "main": ".cli",
+}
+
+if TYPE_CHECKING:
+    from .cli import main
+    from .config import get_settings, settings
+    from .core import SummarizerService, SummaryCache, SummaryResult
 
 __all__ = [
     "__version__",
     "SummarizerService",
+    "SummaryResult",
+    "SummaryCache",
     "settings",
+    "get_settings",
+    "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
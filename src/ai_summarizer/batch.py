@@ -0,0 +1,605 @@
+"""
+Batch Module - Summarize large document collections with resumable output.
+"""
+
+import csv
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .core.batching import DEFAULT_BATCH_SIZE
+from .core.chunking import estimate_tokens
+from .core.scheduling import BATCH, carry_work, work_context
+from .utils.validators import normalize_text
+
+if TYPE_CHECKING:
+    from .core.summarizer import SummarizerService, SummaryResult
+
+FORMAT_JSONL = "jsonl"
+FORMAT_CSV = "csv"
+FORMAT_DIR = "dir"
+
+# Files picked up from an input directory
+TEXT_SUFFIXES = (".txt", ".md")
+
+# Seconds a partial group of short documents waits for more input
+DEFAULT_MAX_LINGER = 0.5
+
+# Returned by _DocumentReader.get() once the input is exhausted
+_END = object()
+
+
+@dataclass
+class Document:
+    """One input document; error is set if its source record was unreadable."""
+    id: str
+    text: str
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchStats:
+    """Counters for one batch run."""
+    succeeded: int = 0
+    failed: int = 0
+    duplicates: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        """Documents written during this run."""
+        return self.succeeded + self.failed
+
+    @property
+    def docs_per_second(self) -> float:
+        """Throughput of this run."""
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def detect_format(path: str) -> str:
+    """
+    Infer the input format from a path.
+
+    Args:
+        path: Input file or directory, or "-" for standard input
+
+    Returns:
+        FORMAT_DIR, FORMAT_CSV or FORMAT_JSONL
+    """
+    if path != "-" and os.path.isdir(path):
+        return FORMAT_DIR
+    if path.lower().endswith(".csv"):
+        return FORMAT_CSV
+    return FORMAT_JSONL
+
+
+def _open_input(path: str) -> IO[str]:
+    if path == "-":
+        return sys.stdin
+    return open(path, encoding="utf-8", newline="")
+
+
+def _directory_files(path: str) -> Iterator[str]:
+    """Yield text files under a directory in a stable order."""
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(TEXT_SUFFIXES):
+                yield os.path.join(root, name)
+
+
+def iter_documents(
+    path: str,
+    input_format: Optional[str] = None,
+    text_field: str = "text",
+    id_field: str = "id"
+) -> Iterator[Document]:
+    """
+    Stream documents from a JSONL file, CSV file or directory.
+
+    JSONL lines may be objects or bare JSON strings. Records without an
+    ID are identified by their line or row number, and files in a
+    directory by their relative path.
+
+    Args:
+        path: Input file or directory, or "-" for JSONL on standard input
+        input_format: FORMAT_JSONL, FORMAT_CSV or FORMAT_DIR; inferred
+            from the path if omitted
+        text_field: Field holding the text in JSONL and CSV records
+        id_field: Field holding the document ID in JSONL and CSV records
+
+    Returns:
+        Iterator of documents in input order
+    """
+    input_format = input_format or detect_format(path)
+    if input_format == FORMAT_DIR:
+        for file_path in _directory_files(path):
+            with open(file_path, encoding="utf-8", errors="replace") as f:
+                yield Document(id=os.path.relpath(file_path, path), text=f.read())
+        return
+
+    source = _open_input(path)
+    try:
+        if input_format == FORMAT_CSV:
+            csv.field_size_limit(sys.maxsize)
+            for row_number, row in enumerate(csv.DictReader(source), 1):
+                doc_id = row.get(id_field) or str(row_number)
+                if text_field not in row:
+                    yield Document(doc_id, "", error=f"Missing field: {text_field}")
+                else:
+                    yield Document(doc_id, row[text_field] or "")
+            return
+
+        for line_number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield Document(str(line_number), "", error="Invalid JSON")
+                continue
+            if isinstance(record, str):
+                yield Document(str(line_number), record)
+            elif isinstance(record, dict) and isinstance(record.get(text_field), str):
+                yield Document(str(record.get(id_field) or line_number), record[text_field])
+            else:
+                yield Document(str(line_number), "", error=f"Missing field: {text_field}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def count_documents(path: str, input_format: Optional[str] = None) -> Optional[int]:
+    """
+    Count the records of an input without parsing them.
+
+    Args:
+        path: Input file or directory
+        input_format: Input format; inferred from the path if omitted
+
+    Returns:
+        Record count, or None for standard input
+    """
+    if path == "-":
+        return None
+    input_format = input_format or detect_format(path)
+    if input_format == FORMAT_DIR:
+        return sum(1 for _ in _directory_files(path))
+    with open(path, encoding="utf-8", newline="") as f:
+        if input_format == FORMAT_CSV:
+            csv.field_size_limit(sys.maxsize)
+            return sum(1 for _ in csv.reader(f)) - 1
+        return sum(1 for line in f if line.strip())
+
+
+def load_checkpoint(path: str) -> Tuple[Set[str], Dict[str, Dict[str, Any]]]:
+    """
+    Read the output of an earlier run so it can be resumed.
+
+    A trailing partial line left by an interrupted write is truncated so
+    new records can be appended safely.
+
+    Args:
+        path: Output JSONL file
+
+    Returns:
+        IDs that already succeeded, and their records keyed by input digest
+    """
+    done: Set[str] = set()
+    by_digest: Dict[str, Dict[str, Any]] = {}
+    if not os.path.exists(path):
+        return done, by_digest
+
+    with open(path, "rb+") as f:
+        valid_end = 0
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            valid_end += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("success"):
+                done.add(record["id"])
+                by_digest.setdefault(record.get("digest", ""), record)
+        f.truncate(valid_end)
+    by_digest.pop("", None)
+    return done, by_digest
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per second on average."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained acquisitions per second; 0 disables limiting
+            burst: Acquisitions allowed back to back after an idle period
+            clock: Monotonic time source
+            sleep: Function used to wait
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting for it if necessary.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_seconds:
+            self._sleep(wait_seconds)
+        return wait_seconds
+
+
+class _DocumentReader:
+    """Read documents on a background thread so waiting for one can time out."""
+
+    def __init__(self, documents: Iterator[Document], size: int):
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=size)
+        self._closed = threading.Event()
+        thread = threading.Thread(target=self._read, args=(documents,), daemon=True)
+        thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read(self, documents: Iterator[Document]) -> None:
+        try:
+            for doc in documents:
+                if not self._put(doc):
+                    return
+        except Exception as e:
+            self._put(e)
+        else:
+            self._put(_END)
+
+    def get(self, timeout: Optional[float]) -> Any:
+        """
+        Wait for the next document.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            A Document, None if the timeout expired or wake() was called,
+            or _END after the last one
+        """
+        try:
+            item = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def wake(self) -> None:
+        """Make a waiting get() return None early."""
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def close(self) -> None:
+        """Stop the reader thread at its next document."""
+        self._closed.set()
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+class ProgressReporter:
+    """Periodically print throughput and ETA to a stream."""
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        stream: Optional[IO[str]] = None,
+        interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the reporter.
+
+        Args:
+            total: Documents in the input, if known
+            stream: Output stream (default: sys.stderr)
+            interval: Seconds between progress lines
+            clock: Monotonic time source
+        """
+        self.total = total
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self._clock = clock
+        self._started = clock()
+        self._last = self._started
+
+    def line(self, stats: BatchStats) -> str:
+        """Format one progress line."""
+        elapsed = self._clock() - self._started
+        rate = stats.processed / elapsed if elapsed > 0 else 0.0
+        done = stats.processed + stats.skipped
+        text = f"{done:,}"
+        if self.total:
+            text += f"/{self.total:,} ({done / self.total:.1%})"
+        text += f"  {rate:.1f} docs/s  failed={stats.failed}"
+        if self.total and rate > 0:
+            eta = max(0, self.total - done) / rate
+            text += f"  ETA {_format_duration(eta)}"
+        return text
+
+    def update(self, stats: BatchStats, force: bool = False) -> None:
+        """Print a progress line if the interval has passed."""
+        now = self._clock()
+        if force or now - self._last >= self.interval:
+            self._last = now
+            print(self.line(stats), file=self.stream, flush=True)
+
+
+def _record(
+    doc: Document,
+    digest: str,
+    result: "SummaryResult",
+    duplicate_of: Optional[str] = None
+) -> Dict[str, Any]:
+    return {
+        "id": doc.id,
+        "success": result.success,
+        "summary": result.summary,
+        "error": result.error,
+        "input_length": result.input_length,
+        "output_length": result.output_length,
+        "input_words": result.input_words,
+        "output_words": result.output_words,
+        "engine": result.engine,
+        "attempts": result.attempts,
+        "elapsed_seconds": round(result.elapsed_seconds, 3),
+        "bytes_sent": result.bytes_sent,
+        "bytes_received": result.bytes_received,
+        "digest": digest,
+        "duplicate_of": duplicate_of,
+    }
+
+
+class BatchRunner:
+    """
+    Summarize a stream of documents on a worker pool.
+
+    Each result is written as one JSON line as soon as it is ready, so
+    the output file doubles as the checkpoint for resuming. Identical
+    inputs (after whitespace normalization) are summarized once and the
+    result is written for every copy. Documents that fit in one chunk
+    are grouped and sent through summarize_many, so several share a
+    request; longer ones go through summarize_long on their own. A
+    partial group is sent after ``max_linger`` seconds, so a slow input
+    stream does not hold back documents already read.
+    """
+
+    def __init__(
+        self,
+        service: "SummarizerService",
+        workers: int = 8,
+        rate: float = 0.0,
+        max_length: int = 150,
+        min_length: int = 30,
+        dedupe: bool = True,
+        progress: Optional[ProgressReporter] = None,
+        priority: str = BATCH,
+        tenant: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_linger: float = DEFAULT_MAX_LINGER
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            service: Service used for each document
+            workers: Documents summarized concurrently
+            rate: Maximum documents started per second; 0 for no limit
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            dedupe: Summarize identical inputs only once
+            progress: Reporter for throughput and ETA lines
+            priority: Scheduling class of the run's upstream requests
+            tenant: Tenant the run's requests are queued under
+            batch_size: Single-chunk documents grouped per summarize_many call
+            max_linger: Seconds a partial group waits for more documents
+        """
+        self.service = service
+        self.workers = max(1, workers)
+        self.limiter = RateLimiter(rate, burst=self.workers)
+        self.max_length = max_length
+        self.min_length = min_length
+        self.dedupe = dedupe
+        self.progress = progress
+        self.priority = priority
+        self.tenant = tenant
+        self.batch_size = max(1, batch_size)
+        self.max_linger = max_linger
+
+    def run(
+        self,
+        documents: Iterator[Document],
+        output: IO[str],
+        done: Optional[Set[str]] = None,
+        finished: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> BatchStats:
+        """
+        Summarize documents and append a JSON line per result.
+
+        Args:
+            documents: Input documents
+            output: Text stream the JSON lines are written to
+            done: IDs to skip because an earlier run finished them
+            finished: Records of earlier runs keyed by input digest,
+                reused for duplicate inputs
+
+        Returns:
+            BatchStats for this run
+        """
+        stats = BatchStats()
+        started = time.monotonic()
+        done = done or set()
+        finished = dict(finished or {})
+        waiting: Dict[str, List[Document]] = {}
+        group: List[Tuple[Document, str]] = []
+        pending: Dict["Future[List[SummaryResult]]", List[Tuple[Document, str]]] = {}
+
+        def write(record: Dict[str, Any]) -> None:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            if record["success"]:
+                stats.succeeded += 1
+            else:
+                stats.failed += 1
+            if record["duplicate_of"] is not None:
+                stats.duplicates += 1
+
+        def collect(futures: Set["Future[List[SummaryResult]]"]) -> None:
+            for future in futures:
+                docs = pending.pop(future)
+                for (doc, digest), result in zip(docs, future.result()):
+                    record = _record(doc, digest, result)
+                    write(record)
+                    if record["success"] and self.dedupe:
+                        finished[digest] = record
+                    for copy in waiting.pop(digest, []):
+                        write({**record, "id": copy.id, "duplicate_of": doc.id})
+            stats.elapsed_seconds = time.monotonic() - started
+            if self.progress is not None:
+                self.progress.update(stats)
+
+        with work_context(self.priority, self.tenant):
+            summarize_many = carry_work(self.service.summarize_many)
+            summarize_long = carry_work(self.service.summarize_long)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+
+            def submit(
+                docs: List[Tuple[Document, str]], fn: Callable[..., Any], *args: Any
+            ) -> None:
+                while len(pending) >= self.workers * 2:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                future = pool.submit(fn, *args)
+                future.add_done_callback(lambda _: reader.wake())
+                pending[future] = docs
+
+            def summarize_group(texts: List[str]) -> List["SummaryResult"]:
+                # Batched results carry no timing of their own
+                group_started = time.perf_counter()
+                results = summarize_many(texts, self.max_length, self.min_length)
+                elapsed = time.perf_counter() - group_started
+                return [replace(result, elapsed_seconds=elapsed) for result in results]
+
+            def flush() -> None:
+                if group:
+                    submit(list(group), summarize_group, [doc.text for doc, _ in group])
+                    group.clear()
+
+            def summarize_one(text: str) -> List["SummaryResult"]:
+                return [summarize_long(text, self.max_length, self.min_length)]
+
+            reader = _DocumentReader(documents, self.workers * 2)
+            grouped_at = 0.0
+            try:
+                while True:
+                    ready = {future for future in pending if future.done()}
+                    if ready:
+                        collect(ready)
+                    if group and time.monotonic() - grouped_at >= self.max_linger:
+                        flush()
+                    timeout = None
+                    if group:
+                        timeout = max(0.0, grouped_at + self.max_linger - time.monotonic())
+                    doc = reader.get(timeout)
+                    if doc is _END:
+                        break
+                    if doc is None:
+                        continue
+                    if doc.id in done:
+                        stats.skipped += 1
+                        continue
+                    if doc.error is not None:
+                        write({
+                            "id": doc.id, "success": False, "error": doc.error,
+                            "digest": "", "duplicate_of": None
+                        })
+                        continue
+
+                    digest = normalize_text(doc.text).digest
+                    if self.dedupe:
+                        previous = finished.get(digest)
+                        if previous is not None:
+                            write({**previous, "id": doc.id, "duplicate_of": previous["id"]})
+                            continue
+                        if digest in waiting:
+                            waiting[digest].append(doc)
+                            continue
+                        waiting[digest] = []
+
+                    self.limiter.acquire()
+                    if estimate_tokens(doc.text) > self.service.chunk_tokens:
+                        submit([(doc, digest)], summarize_one, doc.text)
+                        continue
+                    if not group:
+                        grouped_at = time.monotonic()
+                    group.append((doc, digest))
+                    if len(group) >= self.batch_size:
+                        flush()
+
+                flush()
+                while pending:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+            except BaseException:
+                # Drop queued work; finished results are already on disk
+                for future in pending:
+                    future.cancel()
+                raise
+            finally:
+                reader.close()
+
+        stats.elapsed_seconds = time.monotonic() - started
+        if self.progress is not None:
+            self.progress.update(stats, force=True)
+        return stats
@@ -0,0 +1,162 @@
+"""
+Command Line Interface - Batch summarization for the ai-summarizer command.
+
+Usage:
+    ai-summarizer corpus.jsonl -o summaries.jsonl --workers 16 --rate 20
+    ai-summarizer articles/ -o summaries.jsonl --backend extractive
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from .batch import (
+    FORMAT_CSV,
+    FORMAT_DIR,
+    FORMAT_JSONL,
+    BatchRunner,
+    ProgressReporter,
+    count_documents,
+    iter_documents,
+    load_checkpoint,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the batch command."""
+    parser = argparse.ArgumentParser(
+        prog="ai-summarizer",
+        description="Summarize a JSONL file, CSV file or directory of text files."
+    )
+    parser.add_argument("input", help='Input file or directory; "-" reads JSONL from stdin')
+    parser.add_argument(
+        "-o", "--output",
+        required=True,
+        help='Output JSONL file, appended to and used to resume; "-" for stdout'
+    )
+    parser.add_argument(
+        "--format",
+        choices=[FORMAT_JSONL, FORMAT_CSV, FORMAT_DIR],
+        help="Input format (default: from the path)"
+    )
+    parser.add_argument("--text-field", default="text", help="JSONL/CSV field with the text")
+    parser.add_argument("--id-field", default="id", help="JSONL/CSV field with the document ID")
+    parser.add_argument("--workers", type=int, default=8, help="Documents in flight at once")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="Maximum documents started per second (default: no limit)"
+    )
+    parser.add_argument("--max-length", type=int, default=150)
+    parser.add_argument("--min-length", type=int, default=30)
+    parser.add_argument(
+        "--backend",
+        choices=["api", "extractive"],
+        default="api",
+        help="Inference API or the local extractive engine"
+    )
+    parser.add_argument("--api-url", help="Inference endpoint (default: from settings)")
+    parser.add_argument(
+        "--fallback",
+        action="store_true",
+        help="Use the extractive engine for documents the API fails on"
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Truncate the output instead of skipping finished documents"
+    )
+    parser.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="Summarize identical inputs separately"
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between progress lines on stderr"
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the batch command.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        0 if every document was summarized, 1 if any failed, 2 for
+        configuration errors and 130 if interrupted
+    """
+    args = build_parser().parse_args(argv)
+
+    from .config import get_settings
+    from .core.summarizer import SummarizerService
+
+    settings = get_settings()
+    if args.backend == "api" and not settings.is_configured:
+        print("HUGGINGFACE_API_KEY is not set; use --backend extractive to run offline",
+              file=sys.stderr)
+        return 2
+
+    to_stdout = args.output == "-"
+    done, finished = set(), {}
+    if not to_stdout and not args.no_resume:
+        done, finished = load_checkpoint(args.output)
+        if done:
+            print(f"Resuming: {len(done):,} documents already summarized", file=sys.stderr)
+
+    service = SummarizerService(
+        api_key=settings.huggingface_api_key,
+        api_url=args.api_url or settings.api_url,
+        timeout=settings.api_timeout,
+        max_workers=args.workers,
+        backend=args.backend,
+        fallback=args.fallback
+    )
+    runner = BatchRunner(
+        service,
+        workers=args.workers,
+        rate=args.rate,
+        max_length=args.max_length,
+        min_length=args.min_length,
+        dedupe=not args.no_dedupe,
+        progress=ProgressReporter(
+            total=count_documents(args.input, args.format),
+            interval=args.progress_interval
+        )
+    )
+
+    output = sys.stdout if to_stdout else open(
+        args.output, "w" if args.no_resume else "a", encoding="utf-8"
+    )
+    try:
+        stats = runner.run(
+            iter_documents(args.input, args.format, args.text_field, args.id_field),
+            output,
+            done=done,
+            finished=finished
+        )
+    except KeyboardInterrupt:
+        print("Interrupted; run the same command again to resume", file=sys.stderr)
+        return 130
+    finally:
+        if not to_stdout:
+            output.close()
+        service.close()
+
+    print(
+        f"Done: {stats.succeeded:,} succeeded, {stats.failed:,} failed, "
+        f"{stats.duplicates:,} duplicates, {stats.skipped:,} skipped "
+        f"in {stats.elapsed_seconds:.1f}s ({stats.docs_per_second:.1f} docs/s)",
+        file=sys.stderr
+    )
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
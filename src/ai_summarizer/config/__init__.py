@@ -2,6 +2,6 @@
 Configuration module - Application settings and constants.
 """
 
-from .settings import Settings, settings
+from .settings import Settings, get_settings, settings
 
-__all__ = ["Settings", "settings"]
+__all__ = ["Settings", "get_settings", "settings"]
@@ -4,14 +4,46 @@ Settings - Centralized application configuration.
 
 import os
 from dataclasses import dataclass, field
-from typing import Optional
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, TypeVar
 
-# Load environment variables
-load_dotenv()
+from ..exceptions import ConfigurationError
 
+_N = TypeVar("_N", int, float)
 
-@dataclass
+
+def _env_number(name: str, default: str, kind: Callable[[str], _N]) -> _N:
+    """Read a numeric environment variable, naming it if the value is malformed."""
+    value = os.getenv(name, default)
+    try:
+        return kind(value)
+    except ValueError:
+        expected = "an integer" if kind is int else "a number"
+        raise ConfigurationError(f"{name} must be {expected}, got {value!r}", name) from None
+
+
+def _parse_weights(value: str) -> Tuple[Tuple[str, float], ...]:
+    """Parse "tenant=weight,..." pairs; entries without a weight are skipped."""
+    weights = []
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if not (name.strip() and weight.strip()):
+            continue
+        try:
+            share = float(weight)
+        except ValueError:
+            share = 0.0
+        if not share > 0:
+            raise ConfigurationError(
+                f"TENANT_WEIGHTS: weight for {name.strip()!r} must be a positive number, "
+                f"got {weight.strip()!r}",
+                "TENANT_WEIGHTS"
+            )
+        weights.append((name.strip(), share))
+    return tuple(weights)
+
+
+@dataclass(frozen=True)
 class Settings:
     """Application settings loaded from environment variables."""
     
@@ -22,6 +54,43 @@ class Settings:
     api_url: str = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
     api_timeout: int = 30
     
+    # Equivalent inference endpoints to balance across; empty uses api_url
+    api_urls: Tuple[str, ...] = field(
+        default_factory=lambda: tuple(
+            url.strip() for url in os.getenv("API_URLS", "").split(",") if url.strip()
+        )
+    )
+    
+    # Fraction of requests that may be duplicated when they run slow; 0 disables hedging
+    hedge_fraction: float = field(
+        default_factory=lambda: _env_number("HEDGE_FRACTION", "0", float)
+    )
+    
+    # Circuit breaker: consecutive backend failures that open it (0 disables)
+    # and seconds it stays open before trial requests
+    circuit_failure_threshold: int = field(
+        default_factory=lambda: _env_number("CIRCUIT_FAILURE_THRESHOLD", "5", int)
+    )
+    circuit_reset_seconds: float = field(
+        default_factory=lambda: _env_number("CIRCUIT_RESET_SECONDS", "30", float)
+    )
+    
+    # Relative shares of upstream capacity per tenant ("acme=3,trial=0.5");
+    # unlisted tenants weigh 1
+    tenant_weights: Tuple[Tuple[str, float], ...] = field(
+        default_factory=lambda: _parse_weights(os.getenv("TENANT_WEIGHTS", ""))
+    )
+    
+    # Request body compression: "gzip", "deflate", or empty to send plain JSON
+    request_compression: str = field(
+        default_factory=lambda: os.getenv("REQUEST_COMPRESSION", "")
+    )
+    
+    # Text-generation endpoint that streams summaries; empty disables streaming
+    stream_url: str = field(
+        default_factory=lambda: os.getenv("STREAM_API_URL", "")
+    )
+    
     # Text Validation
     min_text_length: int = 50
     max_text_length: int = 50000
@@ -38,11 +107,36 @@ class Settings:
     # Reading Speed
     words_per_minute: int = 200
     
+    # Tracing
+    trace_file: str = field(
+        default_factory=lambda: os.getenv("TRACE_FILE", "")
+    )
+    slow_request_seconds: float = field(
+        default_factory=lambda: _env_number("SLOW_REQUEST_SECONDS", "5", float)
+    )
+    
     @property
     def is_configured(self) -> bool:
         """Check if the API key is configured."""
         return bool(self.huggingface_api_key)
 
 
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Load the settings once per process.
+    
+    The .env file is read on the first call; later calls return the same
+    immutable instance.
+    
+    Returns:
+        The process-wide Settings
+    """
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
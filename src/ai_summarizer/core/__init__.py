@@ -2,6 +2,60 @@
 Core module - Business logic for text summarization.
 """
 
-from .summarizer import SummarizerService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["SummarizerService"]
+# Exports are imported on first access; the service module pulls in
+# requests, which dominates package import time
+_LAZY_EXPORTS = {
+    "SummarizerService": ".summarizer",
+    "SummaryResult": ".summarizer",
+    "ReductionLevel": ".summarizer",
+    "SummaryCache": ".cache",
+    "CacheStats": ".cache",
+    "SummaryStream": ".streaming",
+    "EndpointPool": ".routing",
+    "Hedger": ".hedging",
+    "CircuitBreaker": ".breaker",
+    "WireCodec": ".codec",
+    "PriorityScheduler": ".scheduling",
+    "work_context": ".scheduling",
+}
+
+if TYPE_CHECKING:
+    from .breaker import CircuitBreaker
+    from .cache import CacheStats, SummaryCache
+    from .codec import WireCodec
+    from .hedging import Hedger
+    from .routing import EndpointPool
+    from .scheduling import PriorityScheduler, work_context
+    from .streaming import SummaryStream
+    from .summarizer import ReductionLevel, SummarizerService, SummaryResult
+
+__all__ = [
+    "SummarizerService",
+    "SummaryResult",
+    "ReductionLevel",
+    "SummaryCache",
+    "CacheStats",
+    "SummaryStream",
+    "EndpointPool",
+    "Hedger",
+    "CircuitBreaker",
+    "WireCodec",
+    "PriorityScheduler",
+    "work_context",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
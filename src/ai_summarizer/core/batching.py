@@ -0,0 +1,49 @@
+"""
+Batching - Packing documents into multi-input inference requests.
+"""
+
+from typing import List, Sequence
+
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_BATCH_TOKENS = 8192
+
+
+def pack_batches(
+    token_counts: Sequence[int],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_tokens: int = DEFAULT_BATCH_TOKENS
+) -> List[List[int]]:
+    """
+    Group documents into as few requests as the budgets allow.
+
+    Documents keep their input order within and across batches. A single
+    document larger than ``batch_tokens`` gets a batch of its own.
+
+    Args:
+        token_counts: Estimated tokens of each document
+        batch_size: Maximum documents per request
+        batch_tokens: Maximum estimated tokens per request
+
+    Returns:
+        List of batches, each a list of indexes into ``token_counts``
+    """
+    if batch_size <= 0 or batch_tokens <= 0:
+        raise ValueError("batch_size and batch_tokens must be positive")
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+
+    for index, tokens in enumerate(token_counts):
+        if current and (
+            len(current) >= batch_size or current_tokens + tokens > batch_tokens
+        ):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
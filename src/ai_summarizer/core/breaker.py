@@ -0,0 +1,158 @@
+"""
+Circuit Breaker - Fail fast while the inference backend is down.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from .outcomes import CANCELLED, ERROR
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class BreakerStats:
+    """Snapshot of circuit breaker state."""
+    state: str
+    consecutive_failures: int
+    opened: int
+    rejected: int
+    retry_after: float
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for upstream requests.
+
+    While closed, requests pass through and consecutive failures are
+    counted. ``failure_threshold`` of them in a row open the circuit, and
+    every request is then rejected without touching the network. After
+    ``reset_timeout`` seconds the circuit is half-open: up to
+    ``half_open_max_calls`` trial requests go through at a time, and
+    ``success_threshold`` successes close it again while any failure
+    reopens it.
+
+    Only failures that implicate the backend count: timeouts, connection
+    errors, 5xx responses and a model that is still loading. Bad input
+    and rate limits mean the backend answered.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before trials
+            half_open_max_calls: Trial requests allowed in flight at once
+            success_threshold: Trial successes needed to close the circuit
+            clock: Monotonic time source
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1 or success_threshold < 1:
+            raise ValueError("Breaker thresholds must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._trials = 0
+        self._opened_at = 0.0
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        """CLOSED, OPEN or HALF_OPEN."""
+        with self._lock:
+            return self._state_locked()
+
+    def _state_locked(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._successes = 0
+            self._trials = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent.
+
+        Every allowed request must be followed by a call to record().
+
+        Returns:
+            False if the request should fail fast
+        """
+        with self._lock:
+            state = self._state_locked()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record(self, outcome: str) -> None:
+        """
+        Report how an allowed request went.
+
+        Args:
+            outcome: OK; ERROR if the backend failed; or CANCELLED if
+                the caller gave up, which frees a trial slot and
+                records nothing else
+        """
+        with self._lock:
+            state = self._state_locked()
+            if state == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+            if outcome == CANCELLED or state == OPEN:
+                return
+            if outcome == ERROR:
+                self._failures += 1
+                if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                    self._open_locked()
+                return
+            self._failures = 0
+            if state == HALF_OPEN:
+                self._successes += 1
+                if self._successes >= self.success_threshold:
+                    self._state = CLOSED
+
+    def _open_locked(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._opened += 1
+
+    @property
+    def stats(self) -> BreakerStats:
+        """Current state and counters."""
+        with self._lock:
+            state = self._state_locked()
+            retry_after = 0.0
+            if state == OPEN:
+                retry_after = max(
+                    0.0, self._opened_at + self.reset_timeout - self._clock()
+                )
+            return BreakerStats(
+                state=state,
+                consecutive_failures=self._failures,
+                opened=self._opened,
+                rejected=self._rejected,
+                retry_after=retry_after
+            )
@@ -0,0 +1,199 @@
+"""
+Summary Cache - Content-addressed in-process cache for summaries.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple
+
+from ..utils.validators import normalize_text
+
+if TYPE_CHECKING:
+    from .summarizer import SummaryResult
+
+# Approximate per-entry bookkeeping cost: result object, list node, dict slot
+_ENTRY_OVERHEAD = 400
+
+
+def make_cache_key(
+    text: str,
+    max_length: int,
+    min_length: int,
+    api_url: str,
+    parameters: Optional[Mapping[str, Any]] = None,
+    text_digest: Optional[str] = None
+) -> str:
+    """
+    Build a cache key from normalized text and generation settings.
+
+    Texts that differ only in whitespace map to the same key.
+
+    Args:
+        text: The text being summarized
+        max_length: Maximum summary length
+        min_length: Minimum summary length
+        api_url: Model endpoint URL
+        parameters: Any other generation parameters
+        text_digest: Content hash from normalize_text(), if already known
+
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((text_digest or normalize_text(text).digest).encode("ascii"))
+    settings = {
+        "max_length": max_length,
+        "min_length": min_length,
+        "api_url": api_url,
+        "parameters": dict(parameters or {}),
+    }
+    digest.update(b"\0")
+    digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of cache counters."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    current_bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SummaryCache:
+    """
+    Thread-safe LRU cache of summaries with a byte budget and TTL.
+
+    Entries are evicted least-recently-used first once the estimated
+    memory of all entries exceeds ``max_bytes``, and are dropped on
+    lookup once older than ``ttl_seconds``.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_TTL_SECONDS = 3600.0
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for all entries
+            ttl_seconds: Entry lifetime, or None to never expire
+            clock: Monotonic time source
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[SummaryResult, int, float]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._stats: Dict[str, int] = {
+            "hits": 0, "misses": 0, "evictions": 0, "expirations": 0
+        }
+
+    @staticmethod
+    def _entry_size(key: str, result: "SummaryResult") -> int:
+        """Estimate the memory held by one entry."""
+        size = sys.getsizeof(key) + _ENTRY_OVERHEAD
+        for value in (result.summary, result.error):
+            if value is not None:
+                size += sys.getsizeof(value)
+        return size
+
+    def get(self, key: str) -> Optional["SummaryResult"]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_cache_key
+
+        Returns:
+            A copy of the cached result marked as cached, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            result, size, stored_at = entry
+            if self.ttl_seconds is not None and (
+                self._clock() - stored_at > self.ttl_seconds
+            ):
+                del self._entries[key]
+                self._bytes -= size
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        return replace(result, cached=True, bytes_sent=0, bytes_received=0)
+
+    def put(self, key: str, result: "SummaryResult") -> None:
+        """
+        Store a result, evicting least-recently-used entries as needed.
+
+        Args:
+            key: Key from make_cache_key
+            result: The result to cache
+        """
+        size = self._entry_size(key, result)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            # A copy, so callers that adjust their result leave the entry intact
+            self._entries[key] = (replace(result), size, self._clock())
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                entries=len(self._entries),
+                current_bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                **self._stats
+            )
@@ -0,0 +1,105 @@
+"""
+Chunking - Token-budgeted splitting of long documents.
+"""
+
+import re
+from typing import Iterator, List
+
+# Rough characters-per-token ratio for English text with the BART tokenizer
+CHARS_PER_TOKEN = 4
+
+# bart-large-cnn truncates its input at 1024 tokens; leave headroom for
+# special tokens and tokenizer variance.
+DEFAULT_CHUNK_TOKENS = 900
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in a text.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _split_words(text: str, max_chars: int) -> Iterator[str]:
+    """Hard-wrap a run of text that has no usable sentence boundary."""
+    words = text.split()
+    current: List[str] = []
+    current_len = 0
+    for word in words:
+        if current and current_len + len(word) + 1 > max_chars:
+            yield " ".join(current)
+            current = []
+            current_len = 0
+        # A single word longer than the budget is cut as-is
+        while len(word) > max_chars:
+            yield word[:max_chars]
+            word = word[max_chars:]
+        current.append(word)
+        current_len += len(word) + 1
+    if current:
+        yield " ".join(current)
+
+
+def _iter_units(text: str, max_chars: int) -> Iterator[str]:
+    """
+    Yield the largest natural units of text that fit the character budget.
+
+    Whole paragraphs are preferred, then sentences, then word runs.
+    """
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = _WHITESPACE.sub(" ", paragraph).strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            yield paragraph
+            continue
+        for sentence in _SENTENCE_END.split(paragraph):
+            if len(sentence) <= max_chars:
+                yield sentence
+            else:
+                yield from _split_words(sentence, max_chars)
+
+
+def split_into_chunks(text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> List[str]:
+    """
+    Split text into chunks that each fit a token budget.
+
+    Chunks break on paragraph and sentence boundaries where possible so
+    each one can be summarized on its own.
+
+    Args:
+        text: The text to split
+        max_tokens: Maximum estimated tokens per chunk
+
+    Returns:
+        List of chunk strings, in document order
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+
+    for unit in _iter_units(text, max_chars):
+        if current and current_len + len(unit) + 1 > max_chars:
+            chunks.append(" ".join(current))
+            current = []
+            current_len = 0
+        current.append(unit)
+        current_len += len(unit) + 1
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
@@ -0,0 +1,189 @@
+"""
+Codec - JSON encoding and body compression for inference requests.
+"""
+
+import gzip
+import json
+import threading
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+GZIP = "gzip"
+DEFLATE = "deflate"
+COMPRESSIONS = (GZIP, DEFLATE)
+
+# Response encodings every transport backend can decode
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Statuses that mean the endpoint did not understand a compressed body
+REJECTED_ENCODING_STATUSES = frozenset({400, 415})
+
+DEFAULT_MIN_COMPRESS_BYTES = 2048
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON.
+
+    orjson is used when installed. Text that cannot be encoded as UTF-8
+    (lone surrogates) is escaped the way the stdlib does by default.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        Encoded bytes
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(value)
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    except (TypeError, UnicodeEncodeError):
+        return json.dumps(value, separators=(",", ":")).encode("ascii")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON, with orjson when installed.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass
+class EncodedBody:
+    """A request body ready to send."""
+    content: bytes
+    json_size: int
+    encoding: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def compressed(self) -> bool:
+        """Whether the content is compressed."""
+        return self.encoding is not None
+
+
+@dataclass
+class WireStats:
+    """Snapshot of bytes sent and received by a codec's users."""
+    requests: int
+    compressed_requests: int
+    json_bytes: int
+    bytes_sent: int
+    bytes_received: int
+
+    @property
+    def compression_ratio(self) -> float:
+        """Request bytes on the wire per byte of JSON; 1.0 is no saving."""
+        return self.bytes_sent / self.json_bytes if self.json_bytes else 1.0
+
+
+class WireCodec:
+    """
+    Encode request bodies and count bytes on the wire.
+
+    Bodies of at least ``min_size`` bytes are compressed with
+    ``compression`` ("gzip" or "deflate"). An endpoint that answers a
+    compressed body with 400 or 415 but accepts the same body
+    uncompressed is remembered and sent plain bodies from then on.
+    """
+
+    def __init__(
+        self,
+        compression: Optional[str] = None,
+        min_size: int = DEFAULT_MIN_COMPRESS_BYTES,
+        level: int = 6
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            compression: "gzip", "deflate", or None to send plain JSON
+            min_size: Smallest JSON body worth compressing, in bytes
+            level: zlib compression level, 1 (fast) to 9 (small)
+        """
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.compression = compression
+        self.min_size = min_size
+        self.level = level
+        self._plain_urls: Set[str] = set()
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "compressed_requests": 0,
+            "json_bytes": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+        }
+
+    def encode(self, value: Any, url: str = "", compress: bool = True) -> EncodedBody:
+        """
+        Serialize a request body, compressing it if worthwhile.
+
+        Args:
+            value: JSON-serializable body
+            url: Destination, checked against endpoints that refused
+                compressed bodies
+            compress: False to force a plain body
+
+        Returns:
+            EncodedBody with the bytes and the headers describing them
+        """
+        data = dumps(value)
+        headers = {"Content-Type": "application/json"}
+        encoding = self.compression
+        if (
+            not compress
+            or encoding is None
+            or len(data) < self.min_size
+            or url in self._plain_urls
+        ):
+            return EncodedBody(data, len(data), headers=headers)
+        if encoding == GZIP:
+            content = gzip.compress(data, self.level, mtime=0)
+        else:
+            content = zlib.compress(data, self.level)
+        headers["Content-Encoding"] = encoding
+        return EncodedBody(content, len(data), encoding, headers)
+
+    def refused(self, body: EncodedBody, status_code: int) -> bool:
+        """Check whether a response may be a refusal of a compressed body."""
+        return body.compressed and status_code in REJECTED_ENCODING_STATUSES
+
+    def send_plain(self, url: str) -> None:
+        """Stop compressing bodies sent to an endpoint."""
+        with self._lock:
+            self._plain_urls.add(url)
+
+    def record(self, body: EncodedBody, bytes_received: int) -> None:
+        """
+        Count one request and its response.
+
+        Args:
+            body: Body that was sent
+            bytes_received: Response body bytes on the wire
+        """
+        with self._lock:
+            self._counters["requests"] += 1
+            self._counters["compressed_requests"] += body.compressed
+            self._counters["json_bytes"] += body.json_size
+            self._counters["bytes_sent"] += len(body.content)
+            self._counters["bytes_received"] += bytes_received
+
+    @property
+    def stats(self) -> WireStats:
+        """Totals since the codec was created."""
+        with self._lock:
+            return WireStats(**self._counters)
@@ -0,0 +1,306 @@
+"""
+Concurrency - Adaptive (AIMD) limit on in-flight upstream requests.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional
+
+# Outcomes reported when a permit is released
+SUCCESS = "success"
+OVERLOAD = "overload"
+FAILURE = "failure"
+
+
+@dataclass
+class LimiterStats:
+    """Snapshot of limiter state and counters."""
+    limit: int
+    in_flight: int
+    queue_depth: int
+    acquired: int
+    timed_out: int
+    increases: int
+    decreases: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average time spent waiting for a permit."""
+        return self.total_wait_seconds / self.acquired if self.acquired else 0.0
+
+
+class _ThreadWaiter:
+    """Wakes a thread blocked in acquire()."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def grant(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        return self._event.wait(timeout)
+
+
+class _AsyncWaiter:
+    """Wakes a coroutine awaiting acquire_async(), from any thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self.future: "asyncio.Future[None]" = loop.create_future()
+        self.granted = False
+
+    def grant(self) -> None:
+        self.granted = True
+        self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class Permit:
+    """A slot held for one upstream request."""
+
+    def __init__(self, limiter: "AdaptiveLimiter", started: float):
+        self._limiter = limiter
+        self.started = started
+        self._released = False
+
+    def release(self, outcome: str = SUCCESS) -> None:
+        """
+        Return the slot and report how the request went.
+
+        Args:
+            outcome: SUCCESS, OVERLOAD (429/503/timeout) or FAILURE
+        """
+        if not self._released:
+            self._released = True
+            self._limiter._release(self, outcome)
+
+
+class AdaptiveLimiter:
+    """
+    Additive-increase/multiplicative-decrease concurrency limiter.
+
+    The limit grows by roughly one slot per window of healthy requests
+    and is cut by ``decrease_factor`` on overload signals. Only requests
+    started after the last cut can trigger another, so a burst of
+    failures from one window cuts the limit once. Threads and asyncio
+    tasks share the same FIFO queue of waiters.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            decrease_factor: Multiplier applied to the limit on overload
+            latency_tolerance: Latency above this multiple of the best
+                observed latency holds the limit instead of growing it
+            clock: Monotonic time source
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Require 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[Any] = deque()
+        self._last_decrease = float("-inf")
+        self._best_latency: Optional[float] = None
+        self._counters = {"acquired": 0, "timed_out": 0, "increases": 0, "decreases": 0}
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def limit(self) -> int:
+        """Current number of allowed in-flight requests."""
+        return int(self._limit)
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[Permit]:
+        """
+        Block until a slot is free.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            A Permit, or None if the timeout expired
+        """
+        queued = self._clock()
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                return self._permit_locked(queued)
+            waiter = _ThreadWaiter()
+            self._waiters.append(waiter)
+
+        if not waiter.wait(timeout):
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    self._counters["timed_out"] += 1
+                    return None
+        # The slot was handed over by _grant_locked
+        with self._lock:
+            return self._permit_locked(queued)
+
+    def try_acquire(self) -> Optional[Permit]:
+        """
+        Take a slot only if one is free and nobody is queued for it.
+
+        Returns:
+            A Permit, or None without waiting
+        """
+        with self._lock:
+            if self._waiters or self._in_flight >= self.limit:
+                return None
+            self._in_flight += 1
+            return self._permit_locked(self._clock())
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Call ``callback`` after every released permit.
+
+        Queues kept outside the limiter use this to claim freed slots
+        with try_acquire(). The callback runs without the limiter's lock
+        held, on whichever thread released the permit.
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    async def acquire_async(self) -> Permit:
+        """
+        Wait for a slot without blocking the event loop.
+
+        Cancelling the awaiting task gives up its place in the queue.
+
+        Returns:
+            A Permit
+        """
+        queued = self._clock()
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                return self._permit_locked(queued)
+            waiter = _AsyncWaiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            listeners: List[Callable[[], None]] = []
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.granted:
+                    self._in_flight -= 1
+                    self._grant_locked()
+                    listeners = list(self._listeners)
+            for listener in listeners:
+                listener()
+            raise
+        with self._lock:
+            return self._permit_locked(queued)
+
+    def _permit_locked(self, queued: float) -> Permit:
+        """Record wait statistics and build a permit."""
+        now = self._clock()
+        wait = now - queued
+        self._counters["acquired"] += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        return Permit(self, now)
+
+    def _grant_locked(self) -> None:
+        """Hand free slots to queued waiters in FIFO order."""
+        while self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._waiters.popleft().grant()
+
+    def _release(self, permit: Permit, outcome: str) -> None:
+        """Apply the AIMD rule for a finished request and free its slot."""
+        now = self._clock()
+        latency = now - permit.started
+        with self._lock:
+            self._in_flight -= 1
+            if outcome == OVERLOAD:
+                if permit.started >= self._last_decrease:
+                    self._limit = max(
+                        float(self.min_limit), self._limit * self.decrease_factor
+                    )
+                    self._last_decrease = now
+                    self._counters["decreases"] += 1
+            elif outcome == SUCCESS:
+                # The baseline drifts up slowly so one unusually fast
+                # response cannot freeze growth forever
+                if self._best_latency is None or latency < self._best_latency:
+                    self._best_latency = latency
+                else:
+                    self._best_latency *= 1.01
+                healthy = latency <= self._best_latency * self.latency_tolerance
+                if healthy and self._limit < self.max_limit:
+                    self._limit = min(
+                        float(self.max_limit), self._limit + 1.0 / self._limit
+                    )
+                    self._counters["increases"] += 1
+            self._grant_locked()
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+
+    @property
+    def stats(self) -> LimiterStats:
+        """Current limit, queue depth and wait-time counters."""
+        with self._lock:
+            return LimiterStats(
+                limit=self.limit,
+                in_flight=self._in_flight,
+                queue_depth=len(self._waiters),
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+                **self._counters
+            )
+
+
+_default_limiter: Optional[AdaptiveLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_default_limiter() -> AdaptiveLimiter:
+    """
+    Return the limiter shared by every SummarizerService in the process.
+
+    Returns:
+        The process-wide AdaptiveLimiter
+    """
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = AdaptiveLimiter()
+        return _default_limiter
@@ -0,0 +1,168 @@
+"""
+Extractive Summarizer - Local TF-IDF/TextRank engine with no network use.
+"""
+
+import re
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from ..utils.helpers import text_stats
+from .chunking import CHARS_PER_TOKEN
+from .summarizer import SummaryResult
+
+ENGINE_NAME = "extractive"
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+_TOKEN = re.compile(r"\w+")
+
+_STOP_WORDS = frozenset(
+    "a an and are as at be been but by for from has have he her his i in is it "
+    "its of on or our she that the their them they this to was we were which "
+    "will with you your not no so if than then there these those also can into "
+    "more most such only other".split()
+)
+
+
+class ExtractiveSummarizer:
+    """
+    Summarize by selecting the most central sentences of a text.
+
+    Sentences are embedded as L2-normalized TF-IDF vectors, their cosine
+    similarity matrix is ranked with TextRank power iteration, and the
+    top-ranked sentences are returned in document order.
+    """
+
+    DAMPING = 0.85
+    MAX_ITERATIONS = 50
+    TOLERANCE = 1e-6
+
+    def summarize(
+        self,
+        text: str,
+        max_length: int = 150,
+        min_length: int = 30
+    ) -> SummaryResult:
+        """
+        Summarize the given text locally.
+
+        Args:
+            text: The text to summarize
+            max_length: Maximum summary length in model tokens
+            min_length: Minimum summary length in model tokens
+
+        Returns:
+            SummaryResult produced by the extractive engine
+        """
+        started = time.perf_counter()
+        sentences = self.split_sentences(text)
+        if not sentences:
+            return SummaryResult(
+                success=False,
+                error="Please enter some text to summarize.",
+                engine=ENGINE_NAME
+            )
+
+        scores = self.rank(sentences)
+        chosen = self._select(sentences, scores, max_length, min_length)
+        summary = " ".join(sentences[i] for i in chosen)
+
+        input_stats = text_stats(text)
+        output_stats = text_stats(summary)
+        input_len = input_stats.characters
+        reduction = (1 - len(summary) / input_len) * 100 if input_len > 0 else 0
+        return SummaryResult(
+            success=True,
+            summary=summary,
+            input_length=input_len,
+            output_length=len(summary),
+            reduction_percent=round(reduction, 1),
+            input_words=input_stats.words,
+            output_words=output_stats.words,
+            elapsed_seconds=time.perf_counter() - started,
+            engine=ENGINE_NAME
+        )
+
+    @staticmethod
+    def split_sentences(text: str) -> List[str]:
+        """Split text into whitespace-normalized sentences."""
+        return [
+            " ".join(part.split())
+            for part in _SENTENCE_SPLIT.split(text)
+            if part and not part.isspace()
+        ]
+
+    def rank(self, sentences: List[str]) -> np.ndarray:
+        """
+        Score sentences by TextRank centrality.
+
+        Args:
+            sentences: Sentences of one document
+
+        Returns:
+            Array of scores, one per sentence
+        """
+        count = len(sentences)
+        if count == 1:
+            return np.ones(1)
+
+        vocabulary: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, sentence in enumerate(sentences):
+            for token in _TOKEN.findall(sentence.lower()):
+                if token not in _STOP_WORDS:
+                    rows.append(row)
+                    cols.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        if not vocabulary:
+            return np.ones(count)
+
+        tf = np.zeros((count, len(vocabulary)), dtype=np.float32)
+        np.add.at(tf, (np.array(rows), np.array(cols)), 1.0)
+
+        document_frequency = np.count_nonzero(tf, axis=0)
+        idf = np.log((1.0 + count) / (1.0 + document_frequency)) + 1.0
+        vectors = tf * idf.astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1.0, norms)
+
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        transition = np.divide(
+            similarity, out_weight, out=np.zeros_like(similarity), where=out_weight > 0
+        )
+
+        scores = np.full(count, 1.0 / count, dtype=np.float32)
+        teleport = (1.0 - self.DAMPING) / count
+        for _ in range(self.MAX_ITERATIONS):
+            updated = teleport + self.DAMPING * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < self.TOLERANCE:
+                scores = updated
+                break
+            scores = updated
+        return scores
+
+    @staticmethod
+    def _select(
+        sentences: List[str],
+        scores: np.ndarray,
+        max_length: int,
+        min_length: int
+    ) -> List[int]:
+        """Pick top sentences within the length budget, in document order."""
+        max_chars = max_length * CHARS_PER_TOKEN
+        min_chars = min_length * CHARS_PER_TOKEN
+        chosen: List[int] = []
+        used = 0
+        for index in np.argsort(-scores, kind="stable"):
+            length = len(sentences[index]) + 1
+            if chosen and used + length > max_chars:
+                if used >= min_chars:
+                    break
+                continue
+            chosen.append(int(index))
+            used += length
+        return sorted(chosen)
@@ -0,0 +1,135 @@
+"""
+Hedging - Duplicate slow upstream requests to cut tail latency.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ..metrics import RollingHistogram
+
+
+@dataclass
+class HedgeStats:
+    """Snapshot of hedging counters."""
+    requests: int
+    hedges: int
+    hedge_wins: int
+    denied: int
+    delay: Optional[float]
+
+    @property
+    def hedge_ratio(self) -> float:
+        """Hedges sent per primary request."""
+        return self.hedges / self.requests if self.requests else 0.0
+
+
+class Hedger:
+    """
+    Decide when to send a second copy of a slow upstream request.
+
+    The hedge delay is a percentile of recent request latencies, so only
+    requests slower than, say, 95% of their peers are duplicated. Each
+    primary request adds ``max_fraction`` of a token to a budget capped
+    at ``burst`` tokens, and each hedge spends one, so hedges stay below
+    that fraction of traffic even when the upstream slows down as a
+    whole.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_fraction: float = 0.1,
+        burst: float = 5.0,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the hedger.
+
+        Args:
+            percentile: Latency quantile after which a request is hedged
+            max_fraction: Hedges allowed per primary request
+            burst: Most hedges that can be sent back to back
+            min_delay: Shortest hedge delay in seconds
+            min_samples: Latencies to observe before hedging starts
+            window_seconds: How far back latencies are considered
+            clock: Monotonic time source
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if not 0 <= max_fraction <= 1:
+            raise ValueError("max_fraction must be in [0, 1]")
+        self.percentile = percentile
+        self.max_fraction = max_fraction
+        self.burst = burst
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._latency = RollingHistogram(window_seconds, slice_seconds=window_seconds / 6)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._denied = 0
+
+    def observe(self, latency: float) -> None:
+        """Record how long a completed upstream request took."""
+        with self._lock:
+            self._latency.observe(latency, self._clock())
+
+    def delay(self) -> Optional[float]:
+        """
+        Count a primary request and return when to hedge it.
+
+        Returns:
+            Seconds to wait before hedging, or None until enough
+            latencies have been observed
+        """
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(self.burst, self._tokens + self.max_fraction)
+            return self._delay_locked()
+
+    def _delay_locked(self) -> Optional[float]:
+        window = self._latency.window(self.window_seconds, self._clock())
+        if window.count < self.min_samples:
+            return None
+        return max(self.min_delay, window.quantile(self.percentile))
+
+    def try_hedge(self) -> bool:
+        """
+        Spend budget on one hedge.
+
+        Returns:
+            True if the hedge may be sent
+        """
+        with self._lock:
+            if self._tokens < 1.0:
+                self._denied += 1
+                return False
+            self._tokens -= 1.0
+            self._hedges += 1
+            return True
+
+    def record_win(self) -> None:
+        """Count a hedge that answered before its primary."""
+        with self._lock:
+            self._hedge_wins += 1
+
+    @property
+    def stats(self) -> HedgeStats:
+        """Counters and the current hedge delay."""
+        with self._lock:
+            return HedgeStats(
+                requests=self._requests,
+                hedges=self._hedges,
+                hedge_wins=self._hedge_wins,
+                denied=self._denied,
+                delay=self._delay_locked()
+            )
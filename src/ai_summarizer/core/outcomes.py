@@ -0,0 +1,7 @@
+"""
+Outcomes - Request results reported to the endpoint pool and circuit breaker.
+"""
+
+OK = "ok"
+ERROR = "error"
+CANCELLED = "cancelled"
@@ -0,0 +1,125 @@
+"""
+Retry - Backoff policy for transient inference failures.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Mapping, Optional
+
+import requests
+
+from ..exceptions import APIError, ModelLoadingError, RateLimitError
+
+# Mirrors constants.MAX_RETRIES and constants.RETRY_DELAY
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = 2.0
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Read a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if the header is absent or invalid
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with jitter, bounded by attempts and a deadline.
+
+    Model-loading and rate-limit errors wait for the time the upstream
+    asks for instead of the computed backoff.
+    """
+    max_retries: int = DEFAULT_MAX_RETRIES
+    base_delay: float = DEFAULT_RETRY_DELAY
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 0.5
+    deadline: Optional[float] = 60.0
+    retry_on_status: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    rng: random.Random = field(default_factory=random.Random, compare=False)
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """A policy that never retries."""
+        return cls(max_retries=0)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Check whether an error is worth another attempt."""
+        if isinstance(error, (ModelLoadingError, RateLimitError)):
+            return True
+        if isinstance(error, (requests.exceptions.Timeout,
+                              requests.exceptions.ConnectionError)):
+            return True
+        if isinstance(error, APIError):
+            return error.status_code in self.retry_on_status
+        if isinstance(error, requests.exceptions.HTTPError):
+            response = error.response
+            return response is not None and (
+                response.status_code in self.retry_on_status
+            )
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the jittered backoff after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed, from 1
+
+        Returns:
+            Seconds to wait
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        spread = delay * self.jitter
+        return max(0.0, delay - spread + self.rng.random() * 2 * spread)
+
+    def next_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        elapsed: float
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            error: The error raised by the attempt
+            attempt: Number of the attempt that just failed, from 1
+            elapsed: Seconds spent on this request so far
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt > self.max_retries or not self.is_retryable(error):
+            return None
+
+        hint: Optional[float] = None
+        if isinstance(error, ModelLoadingError):
+            hint = error.estimated_time
+        elif isinstance(error, RateLimitError):
+            hint = error.retry_after
+        delay = hint if hint is not None else self.backoff(attempt)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
@@ -0,0 +1,265 @@
+"""
+Routing - Latency- and error-aware load balancing across equivalent endpoints.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from ..metrics import LatencyHistogram
+from .outcomes import CANCELLED, ERROR, OK
+
+
+@dataclass
+class EndpointStats:
+    """Snapshot of one endpoint's routing state."""
+    url: str
+    healthy: bool
+    outstanding: int
+    ewma_latency: float
+    error_rate: float
+    requests: int
+    errors: int
+    ejections: int
+    p50: float
+    p99: float
+    latency_count: int
+    total_latency_seconds: float
+
+
+class Endpoint:
+    """Routing state for one upstream URL. Guarded by the pool's lock."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.ewma_latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until: Optional[float] = None
+        self.eject_seconds = 0.0
+        self.probing = False
+        self.requests = 0
+        self.errors = 0
+        self.ejections = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until is None
+
+
+class EndpointPool:
+    """
+    Route requests to the endpoint with the lowest expected cost.
+
+    Each endpoint's cost is its latency EWMA scaled by the requests it
+    already has outstanding and inflated by its recent error rate, so a
+    slow or failing endpoint sheds traffic to the others. Endpoints that
+    have not answered yet cost nothing and are tried first.
+
+    After ``failure_threshold`` consecutive failures an endpoint is
+    ejected for ``eject_seconds``. Once that passes a single trial
+    request is routed to it: success restores it, failure ejects it
+    again for twice as long, up to ``max_eject_seconds``. If every
+    endpoint is ejected, the one due back soonest is used rather than
+    failing the request outright.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        decay: float = 0.3,
+        failure_threshold: int = 3,
+        eject_seconds: float = 10.0,
+        max_eject_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            urls: Equivalent endpoint URLs, in order of preference on ties
+            decay: Weight of the newest sample in the latency and error
+                rate averages
+            failure_threshold: Consecutive failures that eject an endpoint
+            eject_seconds: First ejection period
+            max_eject_seconds: Longest ejection period
+            clock: Monotonic time source
+            rng: Random source used to break ties
+        """
+        if not urls:
+            raise ValueError("EndpointPool needs at least one URL")
+        if not 0 < decay <= 1:
+            raise ValueError("decay must be in (0, 1]")
+        self.endpoints = [Endpoint(url) for url in dict.fromkeys(urls)]
+        self.decay = decay
+        self.failure_threshold = failure_threshold
+        self.initial_eject_seconds = eject_seconds
+        self.max_eject_seconds = max_eject_seconds
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        """Endpoint URLs in configuration order."""
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def _cost(self, endpoint: Endpoint) -> float:
+        if endpoint.ewma_latency is None:
+            return 0.0
+        return (
+            endpoint.ewma_latency
+            * (endpoint.outstanding + 1)
+            / max(1.0 - endpoint.error_rate, 0.01)
+        )
+
+    def acquire(self) -> Endpoint:
+        """
+        Pick an endpoint for one request and count it as outstanding.
+
+        Returns:
+            The chosen Endpoint; pass it to release() when done
+        """
+        with self._lock:
+            now = self._clock()
+            candidates = [e for e in self.endpoints if e.healthy]
+            for endpoint in self.endpoints:
+                due = endpoint.ejected_until is not None and endpoint.ejected_until <= now
+                if due and not endpoint.probing:
+                    # Route one trial request to the recovering endpoint
+                    endpoint.probing = True
+                    chosen = endpoint
+                    break
+            else:
+                if candidates:
+                    best = min(self._cost(e) for e in candidates)
+                    chosen = self._rng.choice(
+                        [e for e in candidates if self._cost(e) == best]
+                    )
+                else:
+                    chosen = min(self.endpoints, key=lambda e: e.ejected_until or 0.0)
+            chosen.outstanding += 1
+            chosen.requests += 1
+            return chosen
+
+    def release(self, endpoint: Endpoint, latency: float, outcome: str = OK) -> None:
+        """
+        Record how a request to an endpoint went.
+
+        Args:
+            endpoint: Endpoint returned by acquire()
+            latency: Seconds the request took
+            outcome: OK; ERROR for failures that implicate the endpoint
+                (timeouts, connection errors, 5xx and 429 responses); or
+                CANCELLED if the caller gave up, which records nothing
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if outcome == CANCELLED:
+                endpoint.requests -= 1
+                endpoint.probing = False
+                return
+            failed = outcome == ERROR
+            if endpoint.ewma_latency is None:
+                endpoint.ewma_latency = latency
+            else:
+                endpoint.ewma_latency += self.decay * (latency - endpoint.ewma_latency)
+            endpoint.error_rate += self.decay * (float(failed) - endpoint.error_rate)
+            endpoint.latency.observe(latency)
+
+            if not failed:
+                endpoint.consecutive_failures = 0
+                if endpoint.probing or not endpoint.healthy:
+                    endpoint.ejected_until = None
+                    endpoint.eject_seconds = 0.0
+                    endpoint.error_rate = 0.0
+                endpoint.probing = False
+                return
+
+            endpoint.errors += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.probing or (
+                endpoint.healthy and endpoint.consecutive_failures >= self.failure_threshold
+            ):
+                endpoint.eject_seconds = min(
+                    self.max_eject_seconds,
+                    endpoint.eject_seconds * 2 or self.initial_eject_seconds
+                )
+                endpoint.ejected_until = self._clock() + endpoint.eject_seconds
+                endpoint.ejections += 1
+                endpoint.probing = False
+
+    @property
+    def stats(self) -> List[EndpointStats]:
+        """Per-endpoint routing state and counters."""
+        with self._lock:
+            return [
+                EndpointStats(
+                    url=e.url,
+                    healthy=e.healthy,
+                    outstanding=e.outstanding,
+                    ewma_latency=e.ewma_latency or 0.0,
+                    error_rate=e.error_rate,
+                    requests=e.requests,
+                    errors=e.errors,
+                    ejections=e.ejections,
+                    p50=e.latency.quantile(0.5),
+                    p99=e.latency.quantile(0.99),
+                    latency_count=e.latency.count,
+                    total_latency_seconds=e.latency.sum
+                )
+                for e in self.endpoints
+            ]
+
+    def render_prometheus(self, prefix: str) -> List[str]:
+        """
+        Render per-endpoint metrics in Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix, e.g. "summarizer"
+
+        Returns:
+            Exposition lines, without a trailing newline
+        """
+        name = f"{prefix}_endpoint"
+        metrics = (
+            ("requests_total", "counter", "Requests routed to the endpoint.",
+             lambda s: s.requests),
+            ("errors_total", "counter", "Failed requests to the endpoint.",
+             lambda s: s.errors),
+            ("ejections_total", "counter", "Times the endpoint was ejected.",
+             lambda s: s.ejections),
+            ("healthy", "gauge", "1 if the endpoint is in rotation.",
+             lambda s: int(s.healthy)),
+            ("outstanding", "gauge", "Requests in flight to the endpoint.",
+             lambda s: s.outstanding),
+            ("latency_ewma_seconds", "gauge", "Smoothed endpoint latency.",
+             lambda s: round(s.ewma_latency, 6)),
+            ("error_rate", "gauge", "Smoothed endpoint error rate.",
+             lambda s: round(s.error_rate, 6)),
+        )
+        snapshot = self.stats
+        lines: List[str] = []
+        for suffix, kind, help_text, value in metrics:
+            lines.append(f"# HELP {name}_{suffix} {help_text}")
+            lines.append(f"# TYPE {name}_{suffix} {kind}")
+            for stats in snapshot:
+                lines.append(f'{name}_{suffix}{{endpoint="{stats.url}"}} {value(stats)}')
+        lines.append(f"# HELP {name}_latency_seconds Endpoint latency percentiles.")
+        lines.append(f"# TYPE {name}_latency_seconds summary")
+        for stats in snapshot:
+            label = f'endpoint="{stats.url}"'
+            for quantile, seconds in (("0.5", stats.p50), ("0.99", stats.p99)):
+                lines.append(
+                    f'{name}_latency_seconds{{{label},quantile="{quantile}"}} '
+                    f"{round(seconds, 6)}"
+                )
+            total = round(stats.total_latency_seconds, 6)
+            lines.append(f"{name}_latency_seconds_sum{{{label}}} {total}")
+            lines.append(f"{name}_latency_seconds_count{{{label}}} {stats.latency_count}")
+        return lines
@@ -0,0 +1,424 @@
+"""
+Scheduling - Priority classes and per-tenant fair queuing for upstream slots.
+"""
+
+import asyncio
+import functools
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from ..exceptions import DeadlineExceededError
+from ..metrics import LatencyHistogram, LatencySummary
+from .concurrency import FAILURE, AdaptiveLimiter, Permit, get_default_limiter
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Priority classes, highest first
+INTERACTIVE = "interactive"
+BATCH = "batch"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BATCH, BACKGROUND)
+
+DEFAULT_TENANT = "default"
+
+
+@dataclass(frozen=True)
+class WorkContext:
+    """Who an upstream request is for and how long its caller will wait."""
+    priority: str = INTERACTIVE
+    tenant: str = DEFAULT_TENANT
+    deadline: Optional[float] = None
+
+    def remaining(self, now: float) -> Optional[float]:
+        """Seconds left before the deadline, or None without one."""
+        return None if self.deadline is None else self.deadline - now
+
+
+_current_work: "ContextVar[WorkContext]" = ContextVar(
+    "ai_summarizer_work", default=WorkContext()
+)
+
+
+def current_work() -> WorkContext:
+    """
+    Return the work context upstream requests are tagged with.
+
+    Returns:
+        The innermost context set by work_context(), or an interactive
+        request for the default tenant with no deadline
+    """
+    return _current_work.get()
+
+
+@contextmanager
+def work_context(
+    priority: Optional[str] = None,
+    tenant: Optional[str] = None,
+    timeout: Optional[float] = None
+) -> Iterator[WorkContext]:
+    """
+    Tag the upstream requests made inside a block.
+
+    Unset fields are inherited from the enclosing context, and a timeout
+    can only bring an inherited deadline closer.
+
+    Args:
+        priority: INTERACTIVE, BATCH or BACKGROUND
+        tenant: Name requests are shared fairly between
+        timeout: Seconds from now after which queued requests are dropped
+
+    Yields:
+        The WorkContext in effect
+    """
+    if priority is not None and priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority: {priority}")
+    outer = current_work()
+    deadline = outer.deadline
+    if timeout is not None:
+        ends = time.monotonic() + timeout
+        deadline = ends if deadline is None else min(deadline, ends)
+    work = WorkContext(priority or outer.priority, tenant or outer.tenant, deadline)
+    token = _current_work.set(work)
+    try:
+        yield work
+    finally:
+        _current_work.reset(token)
+
+
+def carry_work(fn: F) -> F:
+    """
+    Carry the current work context into calls made on worker threads.
+
+    Args:
+        fn: Function to be run by a thread pool
+
+    Returns:
+        Wrapper that restores the caller's context around each call
+    """
+    work = current_work()
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _current_work.set(work)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current_work.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@dataclass
+class PriorityStats:
+    """Snapshot of one priority class."""
+    priority: str
+    queue_depth: int
+    dispatched: int
+    dropped: int
+    wait: LatencySummary
+    total_wait_seconds: float
+    tenants: Dict[str, int]
+
+
+class _Waiter:
+    """A queued request and how to wake it."""
+
+    def __init__(
+        self,
+        work: WorkContext,
+        queued: float,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> None:
+        self.work = work
+        self.queued = queued
+        self.permit: Optional[Permit] = None
+        self.done = False
+        self._loop = loop
+        self._event = threading.Event()
+        self.future: Optional["asyncio.Future[None]"] = (
+            loop.create_future() if loop is not None else None
+        )
+
+    def wake(self) -> None:
+        self.done = True
+        if self._loop is None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if self.future is not None and not self.future.done():
+            self.future.set_result(None)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        return self._event.wait(timeout)
+
+
+class _PriorityQueue:
+    """Waiters of one priority class, ordered by weighted fair queuing."""
+
+    def __init__(self) -> None:
+        self.heap: List[Tuple[float, int, _Waiter]] = []
+        self.depth: Dict[str, int] = {}
+        self.finish: Dict[str, float] = {}
+        self.virtual_time = 0.0
+        self.dispatched = 0
+        self.dropped = 0
+        self.wait = LatencyHistogram()
+
+    def __len__(self) -> int:
+        return sum(self.depth.values())
+
+    def push(self, waiter: _Waiter, weight: float, seq: int) -> None:
+        tenant = waiter.work.tenant
+        start = max(self.virtual_time, self.finish.get(tenant, 0.0))
+        self.finish[tenant] = start + 1.0 / weight
+        heapq.heappush(self.heap, (self.finish[tenant], seq, waiter))
+        self.depth[tenant] = self.depth.get(tenant, 0) + 1
+
+    def peek(self) -> Optional[_Waiter]:
+        while self.heap and self.heap[0][2].done:
+            heapq.heappop(self.heap)
+        return self.heap[0][2] if self.heap else None
+
+    def pop(self) -> _Waiter:
+        tag, _, waiter = heapq.heappop(self.heap)
+        self.virtual_time = tag
+        self.discard(waiter)
+        return waiter
+
+    def discard(self, waiter: _Waiter) -> None:
+        tenant = waiter.work.tenant
+        self.depth[tenant] -= 1
+        if not self.depth[tenant]:
+            del self.depth[tenant]
+        if not self.depth:
+            # Nobody is backlogged, so finish tags no longer matter
+            self.heap.clear()
+            self.finish.clear()
+
+
+class PriorityScheduler:
+    """
+    Order requests waiting for an upstream slot.
+
+    Requests wait here instead of in the limiter's FIFO queue and each
+    freed slot goes to the highest priority class with work queued, so
+    interactive requests never wait behind batch ones. Within a class,
+    tenants share slots by weighted fair queuing: each request gets a
+    virtual finish time of 1/weight after its tenant's previous one, and
+    the earliest finish is served first, so a tenant with 1000 queued
+    requests cannot starve one with a single request.
+
+    A request whose deadline passes while it is queued is dropped with
+    DeadlineExceededError, as is an async request whose task is
+    cancelled, so no slot is spent on work nobody is waiting for.
+    """
+
+    def __init__(
+        self,
+        limiter: Optional[AdaptiveLimiter] = None,
+        tenant_weights: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            limiter: Limiter whose slots are handed out; defaults to the
+                one shared by every SummarizerService
+            tenant_weights: Relative share of each tenant within a
+                priority class; unlisted tenants weigh 1
+            clock: Monotonic time source, also used for deadlines
+        """
+        if tenant_weights and min(tenant_weights.values()) <= 0:
+            raise ValueError("Tenant weights must be positive")
+        self.limiter = limiter or get_default_limiter()
+        self.tenant_weights = dict(tenant_weights or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queues = {priority: _PriorityQueue() for priority in PRIORITIES}
+        self._seq = itertools.count()
+        self.limiter.add_listener(self._dispatch)
+
+    def acquire(self, work: Optional[WorkContext] = None) -> Permit:
+        """
+        Block until the request's turn for an upstream slot.
+
+        Args:
+            work: Request to schedule; defaults to current_work()
+
+        Returns:
+            A Permit from the limiter
+
+        Raises:
+            DeadlineExceededError: If the deadline passed while queued
+        """
+        work = work or current_work()
+        permit, waiter = self._enter(work, None)
+        if permit is not None:
+            return permit
+        assert waiter is not None
+        waiter.wait(work.remaining(self._clock()))
+        with self._lock:
+            if not waiter.done:
+                self._drop_locked(waiter)
+        if waiter.permit is None:
+            raise DeadlineExceededError(work.priority)
+        return waiter.permit
+
+    async def acquire_async(self, work: Optional[WorkContext] = None) -> Permit:
+        """
+        Wait for the request's turn without blocking the event loop.
+
+        Cancelling the awaiting task drops the request.
+
+        Args:
+            work: Request to schedule; defaults to current_work()
+
+        Returns:
+            A Permit from the limiter
+
+        Raises:
+            DeadlineExceededError: If the deadline passed while queued
+        """
+        work = work or current_work()
+        permit, waiter = self._enter(work, asyncio.get_running_loop())
+        if permit is not None:
+            return permit
+        assert waiter is not None and waiter.future is not None
+        try:
+            await asyncio.wait_for(waiter.future, work.remaining(self._clock()))
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if not waiter.done:
+                    self._drop_locked(waiter)
+            if waiter.permit is not None:
+                # Granted as the wait ended; FAILURE leaves the limit alone
+                waiter.permit.release(FAILURE)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise DeadlineExceededError(work.priority) from None
+        if waiter.permit is None:
+            raise DeadlineExceededError(work.priority)
+        return waiter.permit
+
+    def _enter(
+        self,
+        work: WorkContext,
+        loop: Optional[asyncio.AbstractEventLoop]
+    ) -> Tuple[Optional[Permit], Optional[_Waiter]]:
+        """Take a free slot directly, or queue the request."""
+        if work.priority not in self._queues:
+            raise ValueError(f"Unknown priority: {work.priority}")
+        now = self._clock()
+        with self._lock:
+            queue = self._queues[work.priority]
+            if work.deadline is not None and now >= work.deadline:
+                queue.dropped += 1
+                raise DeadlineExceededError(work.priority)
+            if not any(self._queues.values()):
+                permit = self.limiter.try_acquire()
+                if permit is not None:
+                    queue.dispatched += 1
+                    queue.wait.observe(0.0)
+                    return permit, None
+            waiter = _Waiter(work, now, loop)
+            weight = self.tenant_weights.get(work.tenant, 1.0)
+            queue.push(waiter, weight, next(self._seq))
+        # A slot may have been freed, or the limit raised, meanwhile
+        self._dispatch()
+        return None, waiter
+
+    def _dispatch(self) -> None:
+        """Hand free limiter slots to queued requests, best first."""
+        with self._lock:
+            now = self._clock()
+            for queue in self._queues.values():
+                while True:
+                    waiter = queue.peek()
+                    if waiter is None:
+                        break
+                    deadline = waiter.work.deadline
+                    if deadline is not None and now >= deadline:
+                        self._drop_locked(waiter)
+                        continue
+                    permit = self.limiter.try_acquire()
+                    if permit is None:
+                        return
+                    queue.pop()
+                    queue.dispatched += 1
+                    queue.wait.observe(now - waiter.queued)
+                    waiter.permit = permit
+                    waiter.wake()
+
+    def _drop_locked(self, waiter: _Waiter) -> None:
+        queue = self._queues[waiter.work.priority]
+        queue.discard(waiter)
+        queue.dropped += 1
+        waiter.wake()
+
+    @property
+    def stats(self) -> List[PriorityStats]:
+        """Queue depth, counters and wait times per priority class."""
+        with self._lock:
+            return [
+                PriorityStats(
+                    priority=priority,
+                    queue_depth=len(queue),
+                    dispatched=queue.dispatched,
+                    dropped=queue.dropped,
+                    wait=queue.wait.summary(),
+                    total_wait_seconds=queue.wait.sum,
+                    tenants=dict(queue.depth)
+                )
+                for priority, queue in self._queues.items()
+            ]
+
+    def render_prometheus(self, prefix: str) -> List[str]:
+        """
+        Render per-class metrics in Prometheus text exposition format.
+
+        Tenants are left out to keep the number of series bounded.
+
+        Args:
+            prefix: Metric name prefix, e.g. "summarizer"
+
+        Returns:
+            Exposition lines, without a trailing newline
+        """
+        name = f"{prefix}_scheduler"
+        metrics = (
+            ("queue_depth", "gauge", "Requests waiting for an upstream slot.",
+             lambda s: s.queue_depth),
+            ("dispatched_total", "counter", "Requests given an upstream slot.",
+             lambda s: s.dispatched),
+            ("dropped_total", "counter", "Requests dropped after their caller gave up.",
+             lambda s: s.dropped),
+        )
+        snapshot = self.stats
+        lines: List[str] = []
+        for suffix, kind, help_text, value in metrics:
+            lines.append(f"# HELP {name}_{suffix} {help_text}")
+            lines.append(f"# TYPE {name}_{suffix} {kind}")
+            for stats in snapshot:
+                lines.append(f'{name}_{suffix}{{priority="{stats.priority}"}} {value(stats)}')
+        lines.append(f"# HELP {name}_wait_seconds Time queued for an upstream slot.")
+        lines.append(f"# TYPE {name}_wait_seconds summary")
+        for stats in snapshot:
+            label = f'priority="{stats.priority}"'
+            for quantile, seconds in (("0.5", stats.wait.p50), ("0.99", stats.wait.p99)):
+                lines.append(
+                    f'{name}_wait_seconds{{{label},quantile="{quantile}"}} '
+                    f"{round(seconds, 6)}"
+                )
+            total = round(stats.total_wait_seconds, 6)
+            lines.append(f"{name}_wait_seconds_sum{{{label}}} {total}")
+            lines.append(f"{name}_wait_seconds_count{{{label}}} {stats.wait.count}")
+        return lines
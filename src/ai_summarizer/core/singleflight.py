@@ -0,0 +1,160 @@
+"""
+Single Flight - Coalescing of identical concurrent requests.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Snapshot of coalescing counters."""
+    leaders: int
+    coalesced: int
+    in_flight: int
+
+
+class _Call:
+    """One in-flight upstream call and the callers waiting on it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.callbacks: List[Callable[[], None]] = []
+
+    def outcome(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time and share its result.
+
+    Callers that arrive while a call for their key is running wait for
+    that call instead of starting another. Sync and async callers may
+    wait on the same call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    def _join(self, key: str) -> Tuple[_Call, bool]:
+        """Return the call for a key and whether the caller leads it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                return call, False
+            call = _Call()
+            self._calls[key] = call
+            self._leaders += 1
+            return call, True
+
+    def _finish(
+        self,
+        key: str,
+        call: _Call,
+        result: Any,
+        error: Optional[BaseException]
+    ) -> None:
+        """Publish a call's outcome to everyone waiting on it."""
+        with self._lock:
+            self._calls.pop(key, None)
+            call.result = result
+            call.error = error
+            call.done.set()
+            callbacks, call.callbacks = call.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _subscribe(self, call: _Call, callback: Callable[[], None]) -> None:
+        """Run a callback once the call finishes."""
+        with self._lock:
+            if not call.done.is_set():
+                call.callbacks.append(callback)
+                return
+        callback()
+
+    def do(self, key: str, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Run fn, or wait for the identical call already in flight.
+
+        Args:
+            key: Identity of the request
+            fn: Function producing the result
+
+        Returns:
+            Tuple of (result, shared) where shared is True if the result
+            came from another caller's call
+        """
+        call, leader = self._join(key)
+        if not leader:
+            call.done.wait()
+            return call.outcome(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, call, None, e)
+            raise
+        self._finish(key, call, result, None)
+        return result, False
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Async counterpart of do().
+
+        The leader's call runs as its own task, so a waiter that is
+        cancelled (for example by a deadline) does not cancel the call
+        the other waiters depend on.
+
+        Args:
+            key: Identity of the request
+            fn: Coroutine function producing the result
+
+        Returns:
+            Tuple of (result, shared)
+        """
+        call, leader = self._join(key)
+        if leader:
+            task = asyncio.ensure_future(fn())
+
+            def on_done(task: "asyncio.Future[T]") -> None:
+                if task.cancelled():
+                    self._finish(key, call, None, asyncio.CancelledError())
+                else:
+                    error = task.exception()
+                    self._finish(key, call, None if error else task.result(), error)
+
+            task.add_done_callback(on_done)
+
+        loop = asyncio.get_running_loop()
+        waiter: "asyncio.Future[None]" = loop.create_future()
+
+        def wake() -> None:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self._subscribe(call, lambda: loop.call_soon_threadsafe(wake))
+        await waiter
+        return call.outcome(), not leader
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """Current leader and coalesced-call counters."""
+        with self._lock:
+            return SingleFlightStats(
+                leaders=self._leaders,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls)
+            )
@@ -0,0 +1,149 @@
+"""
+Streaming - Server-sent event parsing for incremental summary output.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generator, Iterable, Iterator, Optional
+
+from ..exceptions import APIError
+
+if TYPE_CHECKING:
+    from .summarizer import SummaryResult
+
+# Sentinel some OpenAI-style servers send as the final event's data
+DONE = "[DONE]"
+
+
+@dataclass
+class StreamEvent:
+    """One dispatched server-sent event."""
+    data: str
+    event: str = "message"
+
+
+def parse_sse(lines: Iterable[str]) -> Iterator[StreamEvent]:
+    """
+    Group the lines of a text/event-stream body into events.
+
+    Follows the dispatch rules of the SSE specification: ``data`` fields
+    accumulate until a blank line, ``event`` names the event, lines
+    starting with a colon are comments, and unknown fields are ignored.
+
+    Args:
+        lines: Body lines without their line terminators
+
+    Returns:
+        Iterator of events, stopping early at a ``[DONE]`` event
+    """
+    data: list = []
+    event = "message"
+    for line in lines:
+        if not line:
+            if data:
+                payload = "\n".join(data)
+                if payload == DONE:
+                    return
+                yield StreamEvent(data=payload, event=event)
+            data = []
+            event = "message"
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            data.append(value)
+        elif name == "event":
+            event = value
+    if data and "\n".join(data) != DONE:
+        yield StreamEvent(data="\n".join(data), event=event)
+
+
+def token_segments(events: Iterable[StreamEvent]) -> Iterator[str]:
+    """
+    Extract generated text from text-generation stream events.
+
+    Understands the token events of Hugging Face text-generation
+    endpoints: ``{"token": {"text": ..., "special": ...}}``, with the
+    final event also carrying ``generated_text``. Special tokens such as
+    end-of-sequence markers are skipped.
+
+    Args:
+        events: Parsed server-sent events
+
+    Returns:
+        Iterator of text segments in generation order
+
+    Raises:
+        APIError: If the stream reports an error or sends invalid data
+    """
+    for event in events:
+        try:
+            chunk = json.loads(event.data)
+        except ValueError as e:
+            raise APIError(f"Invalid stream event: {event.data[:100]}") from e
+        if not isinstance(chunk, dict):
+            raise APIError("Unexpected stream event format")
+        if event.event == "error" or "error" in chunk:
+            raise APIError(str(chunk.get("error", "Stream failed")))
+        token = chunk.get("token") or {}
+        if token.get("special"):
+            continue
+        text = token.get("text")
+        if text:
+            yield text
+
+
+class SummaryStream:
+    """
+    Iterator over summary segments as they are generated.
+
+    Once iteration finishes, ``result`` holds the complete SummaryResult,
+    including a failed one if the stream broke off part way. Close the
+    stream to abandon it early and release its connection.
+    """
+
+    def __init__(self, segments: Generator[str, None, "SummaryResult"]):
+        self._segments = segments
+        self._started = time.perf_counter()
+        self.result: Optional["SummaryResult"] = None
+        self.first_segment_seconds: Optional[float] = None
+
+    def __iter__(self) -> "SummaryStream":
+        return self
+
+    def __next__(self) -> str:
+        try:
+            segment = next(self._segments)
+        except StopIteration as stop:
+            if self.result is None:
+                self.result = stop.value
+            raise
+        if self.first_segment_seconds is None:
+            self.first_segment_seconds = time.perf_counter() - self._started
+        return segment
+
+    def read(self) -> "SummaryResult":
+        """
+        Consume the rest of the stream.
+
+        Returns:
+            The complete SummaryResult
+        """
+        for _ in self:
+            pass
+        assert self.result is not None
+        return self.result
+
+    def close(self) -> None:
+        """Stop generating and release the connection."""
+        self._segments.close()
+
+    def __enter__(self) -> "SummaryStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
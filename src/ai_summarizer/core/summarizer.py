@@ -2,9 +2,84 @@
 Summarizer Service - Core business logic for text summarization.
 """
 
+import asyncio
+import threading
+import time
 import requests
-from typing import Optional
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+from dataclasses import dataclass, field, replace
+
+from ..exceptions import (
+    APIError,
+    CircuitOpenError,
+    ConfigurationError,
+    DeadlineExceededError,
+    ModelLoadingError,
+    RateLimitError,
+    SummarizerError,
+)
+from ..tracing import Tracer, get_tracer
+from ..utils.helpers import TextStats, text_stats
+from ..utils.validators import NormalizedText, normalize_text
+from .batching import DEFAULT_BATCH_SIZE, DEFAULT_BATCH_TOKENS, pack_batches
+from .breaker import OPEN, CircuitBreaker
+from .cache import SummaryCache, make_cache_key
+from .codec import ACCEPT_ENCODING, REJECTED_ENCODING_STATUSES, WireCodec
+from .chunking import DEFAULT_CHUNK_TOKENS, estimate_tokens, split_into_chunks
+from .concurrency import (
+    FAILURE,
+    OVERLOAD,
+    SUCCESS,
+    AdaptiveLimiter,
+    Permit,
+    get_default_limiter,
+)
+from .retry import RetryPolicy, parse_retry_after
+from .hedging import Hedger
+from .outcomes import CANCELLED, ERROR, OK
+from .routing import Endpoint, EndpointPool
+from .scheduling import PriorityScheduler, carry_work
+from .singleflight import SingleFlight
+from .streaming import SummaryStream, parse_sse, token_segments
+from .transport import (
+    AsyncPooledTransport,
+    PooledTransport,
+    TransportConfig,
+    TransportResponse,
+)
+
+if TYPE_CHECKING:
+    from .extractive import ExtractiveSummarizer
+
+_T = TypeVar("_T")
+
+BACKEND_API = "api"
+BACKEND_EXTRACTIVE = "extractive"
+
+
+@dataclass
+class ReductionLevel:
+    """Timing and size figures for one level of a long-document reduction."""
+    level: int
+    chunk_count: int
+    input_length: int
+    output_length: int
+    elapsed_seconds: float
 
 
 @dataclass
@@ -16,6 +91,69 @@ class SummaryResult:
     input_length: int = 0
     output_length: int = 0
     reduction_percent: float = 0.0
+    input_words: int = 0
+    output_words: int = 0
+    chunk_count: int = 1
+    levels: List[ReductionLevel] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    cached: bool = False
+    attempts: int = 1
+    coalesced: bool = False
+    engine: str = "api"
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    
+    @property
+    def word_reduction_percent(self) -> float:
+        """Reduction in word count from input to summary."""
+        if not self.input_words:
+            return 0.0
+        return round((1 - self.output_words / self.input_words) * 100, 1)
+
+
+def _outcome_for_status(status_code: int) -> str:
+    """Classify a response status for the adaptive limiter."""
+    if status_code in (429, 503):
+        return OVERLOAD
+    return FAILURE if status_code >= 500 else SUCCESS
+
+
+def _endpoint_outcome(status_code: int) -> str:
+    """Classify a response status for endpoint health."""
+    return ERROR if status_code == 429 or status_code >= 500 else OK
+
+
+def _is_usable(future: "Union[Future[Any], asyncio.Future[Any]]") -> bool:
+    """Check whether a finished send can be returned without waiting for others."""
+    if future.exception() is not None:
+        return False
+    return _endpoint_outcome(future.result().status_code) == OK
+
+
+def _circuit_outcome(error: Optional[BaseException]) -> str:
+    """Classify how a request ended for the circuit breaker."""
+    if error is None:
+        return OK
+    if isinstance(error, (asyncio.CancelledError, GeneratorExit, DeadlineExceededError)):
+        return CANCELLED
+    if isinstance(error, (
+        requests.exceptions.Timeout,
+        requests.exceptions.ConnectionError,
+        ModelLoadingError
+    )):
+        return ERROR
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        if response is not None and response.status_code >= 500:
+            return ERROR
+    return OK
+
+
+def _outcome_for_error(error: BaseException) -> str:
+    """Classify a transport error for the adaptive limiter."""
+    if isinstance(error, requests.exceptions.Timeout):
+        return OVERLOAD
+    return FAILURE
 
 
 class SummarizerService:
@@ -28,12 +166,36 @@ class SummarizerService:
     
     DEFAULT_API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
     DEFAULT_TIMEOUT = 30
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_MAX_CONCURRENCY = 64
+    MAX_REDUCTION_LEVELS = 5
+    GENERATION_PARAMETERS: Dict[str, Any] = {"do_sample": False}
+    STREAM_PROMPT = "Summarize the following text.\n\n{text}\n\nSummary:"
     
     def __init__(
         self,
         api_key: str,
         api_url: Optional[str] = None,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        transport: Optional[PooledTransport] = None,
+        transport_config: Optional[TransportConfig] = None,
+        cache: Optional[SummaryCache] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        async_transport: Optional[AsyncPooledTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        backend: str = BACKEND_API,
+        fallback: bool = False,
+        tracer: Optional[Tracer] = None,
+        stream_url: Optional[str] = None,
+        endpoints: Optional[EndpointPool] = None,
+        hedger: Optional[Hedger] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        codec: Optional[WireCodec] = None,
+        scheduler: Optional[PriorityScheduler] = None
     ):
         """
         Initialize the summarizer service.
@@ -42,10 +204,75 @@ class SummarizerService:
             api_key: Hugging Face API key
             api_url: Optional custom API URL
             timeout: Request timeout in seconds
+            max_workers: Concurrent chunk requests in long-document mode
+            chunk_tokens: Token budget per chunk in long-document mode
+            transport: Shared pooled transport; one is created if omitted
+            transport_config: Pool settings used when creating a transport
+            cache: Optional summary cache consulted before each request
+            max_concurrency: In-flight request limit for the async API
+            async_transport: Shared async transport; one is created per
+                event loop if omitted
+            retry_policy: Backoff policy for transient failures; defaults
+                to RetryPolicy()
+            limiter: Adaptive concurrency limiter; defaults to the one
+                shared by every service in the process
+            single_flight: Coalescer for identical concurrent requests;
+                each service gets its own if omitted
+            backend: "api" for the inference endpoint or "extractive" for
+                the local engine
+            fallback: Use the extractive engine when an upstream call
+                fails or misses its deadline
+            tracer: Span tracer; defaults to the package tracer, which
+                records nothing until an exporter is added
+            stream_url: Text-generation endpoint that streams tokens as
+                server-sent events; without one, summarize_stream()
+                yields the complete summary as a single segment
+            endpoints: Pool of equivalent inference endpoints to balance
+                requests across; api_url defaults to its first URL and
+                still identifies requests in the cache
+            hedger: Send a duplicate of requests that run slower than
+                the hedger's latency percentile and use whichever answers
+                first; off when omitted
+            breaker: Circuit breaker that fails requests fast while the
+                backend is unhealthy; failed requests still go to the
+                extractive engine when ``fallback`` is set
+            codec: Request body encoder and byte counter; defaults to
+                uncompressed compact JSON
+            scheduler: Orders requests waiting for a slot in its limiter
+                by priority class and tenant, taken from work_context();
+                the limiter defaults to the scheduler's when set
         """
+        if backend not in (BACKEND_API, BACKEND_EXTRACTIVE):
+            raise ConfigurationError(f"Unknown backend: {backend}", "backend")
+        
         self.api_key = api_key
-        self.api_url = api_url or self.DEFAULT_API_URL
+        self.endpoints = endpoints
+        self.api_url = api_url or (endpoints.urls[0] if endpoints else self.DEFAULT_API_URL)
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.chunk_tokens = chunk_tokens
+        self.transport = transport or PooledTransport(transport_config)
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.scheduler = scheduler
+        self.limiter = limiter or (scheduler.limiter if scheduler else get_default_limiter())
+        self.single_flight = single_flight or SingleFlight()
+        self.backend = backend
+        self.fallback = fallback
+        self.tracer = tracer or get_tracer()
+        self.stream_url = stream_url
+        self.hedger = hedger
+        self.breaker = breaker
+        self.codec = codec or WireCodec()
+        self._extractive: Optional["ExtractiveSummarizer"] = None
+        self._send_pool: Optional[ThreadPoolExecutor] = None
+        self._send_pool_lock = threading.Lock()
+        self._transport_config = transport_config
+        self._async_transport = async_transport
+        self._owns_async_transport = async_transport is None
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def summarize(
         self,
@@ -64,62 +291,1197 @@ class SummarizerService:
         Returns:
             SummaryResult with the summarization result
         """
+        with self.tracer.span("summarize", input_chars=len(text)) as span:
+            result = self._summarize(text, max_length, min_length)
+            span.set(
+                success=result.success,
+                engine=result.engine,
+                cached=result.cached,
+                coalesced=result.coalesced,
+                attempts=result.attempts
+            )
+        return result
+    
+    def _summarize(
+        self,
+        text: str,
+        max_length: int,
+        min_length: int
+    ) -> SummaryResult:
+        """Body of summarize(), run inside its span."""
+        if self.backend == BACKEND_EXTRACTIVE:
+            return self.extractive.summarize(text, max_length, min_length)
+        
         if not self.api_key:
-            return SummaryResult(
+            return self._with_fallback(text, max_length, min_length, SummaryResult(
                 success=False,
                 error="API key not configured"
+            ))
+        
+        normalized = normalize_text(text)
+        if not normalized.is_valid:
+            return SummaryResult(success=False, error=normalized.error)
+        
+        key = self._request_key(normalized, max_length, min_length)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        
+        def fetch() -> SummaryResult:
+            result = self._request_summary(normalized, max_length, min_length)
+            self._store(key, result)
+            return result
+        
+        result, shared = self.single_flight.do(key, fetch)
+        if shared:
+            result = replace(result, coalesced=True, bytes_sent=0, bytes_received=0)
+        return self._with_fallback(text, max_length, min_length, result)
+    
+    def summarize_stream(
+        self,
+        text: str,
+        max_length: int = 150,
+        min_length: int = 30
+    ) -> SummaryStream:
+        """
+        Summarize the given text, yielding the summary as it is generated.
+        
+        Nothing is sent until iteration starts. Failures before the first
+        segment are retried like summarize(); a stream that breaks off
+        part way ends with a failed result holding the partial summary.
+        Text longer than one chunk is summarized with summarize_long()
+        and yielded as a single segment.
+        
+        Args:
+            text: The text to summarize
+            max_length: Maximum summary length, in generated tokens when
+                streaming
+            min_length: Minimum summary length; ignored by streaming
+                endpoints
+            
+        Returns:
+            SummaryStream of text segments; its ``result`` is set once
+            the stream is exhausted
+        """
+        return SummaryStream(self._stream(text, max_length, min_length))
+    
+    def _stream(
+        self,
+        text: str,
+        max_length: int,
+        min_length: int
+    ) -> Generator[str, None, SummaryResult]:
+        """Generator behind summarize_stream(); returns the final result."""
+        long_input = estimate_tokens(text) > self.chunk_tokens
+        if (
+            long_input
+            or self.backend == BACKEND_EXTRACTIVE
+            or not self.stream_url
+            or not self.api_key
+        ):
+            summarize = self.summarize_long if long_input else self.summarize
+            result = summarize(text, max_length, min_length)
+            if result.summary:
+                yield result.summary
+            return result
+        
+        normalized = normalize_text(text)
+        if not normalized.is_valid:
+            return SummaryResult(success=False, error=normalized.error)
+        
+        key = make_cache_key(
+            normalized.text,
+            max_length,
+            min_length,
+            self.stream_url,
+            {**self.GENERATION_PARAMETERS, "stream": True},
+            text_digest=normalized.digest
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            if cached.summary:
+                yield cached.summary
+            return cached
+        
+        rejected = self._circuit_rejection()
+        if rejected is not None:
+            result = self._with_fallback(text, max_length, min_length, rejected)
+            if result.summary:
+                yield result.summary
+            return result
+        
+        with self.tracer.span("build_payload"):
+            payload = self._build_stream_payload(normalized.text, max_length)
+        started = time.monotonic()
+        parts: List[str] = []
+        attempt = 0
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                attempt += 1
+                error = None
+                try:
+                    result = yield from self._stream_once(
+                        payload, normalized.stats, parts, attempt
+                    )
+                except Exception as e:
+                    error = e
+                    delay = None
+                    if not parts:
+                        delay = self._retry_delay(e, attempt, started)
+                    if delay is not None:
+                        time.sleep(delay)
+                        continue
+                    result = self._error_result(e)
+                    result.summary = "".join(parts) or None
+                break
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._record_circuit(error)
+        
+        result.attempts = attempt
+        result.elapsed_seconds = time.monotonic() - started
+        self._store(key, result)
+        if not parts:
+            result = self._with_fallback(text, max_length, min_length, result)
+            if result.summary:
+                yield result.summary
+        return result
+    
+    def _stream_once(
+        self,
+        payload: Dict[str, Any],
+        stats: TextStats,
+        parts: List[str],
+        attempt: int
+    ) -> Generator[str, None, SummaryResult]:
+        """
+        Make one streaming request, holding a limiter slot throughout.
+        
+        Segments are appended to ``parts`` as they are yielded.
+        """
+        with self.tracer.span("limiter.acquire"):
+            permit = self._acquire()
+        outcome = FAILURE
+        try:
+            with self.tracer.span("upstream", attempt=attempt, stream=True) as span:
+                body = self.codec.encode(payload, compress=False)
+                stream = self.transport.post_stream(
+                    self.stream_url,  # type: ignore[arg-type]
+                    headers={**self._headers(), **body.headers},
+                    content=body.content,
+                    timeout=self.timeout
+                )
+                span.set(status_code=stream.status_code)
+            with stream:
+                outcome = _outcome_for_status(stream.status_code)
+                if stream.status_code != 200:
+                    return self._parse_response(stats, stream.read())
+                for segment in token_segments(parse_sse(stream.iter_lines())):
+                    parts.append(segment)
+                    yield segment
+        except GeneratorExit:
+            # The consumer stopped reading; not a sign of upstream trouble
+            outcome = SUCCESS
+            raise
+        except BaseException as e:
+            # Errors parsed from a response keep the status-based outcome
+            if not isinstance(e, (SummarizerError, requests.exceptions.HTTPError)):
+                outcome = _outcome_for_error(e)
+            raise
+        finally:
+            permit.release(outcome)
+        if not parts:
+            # A 200 without token events, e.g. a non-streaming endpoint
+            raise APIError("Empty stream")
+        return self._item_result(stats, {"summary_text": "".join(parts).strip()})
+    
+    def _build_stream_payload(self, text: str, max_length: int) -> Dict[str, Any]:
+        """Build the text-generation request body for a streamed summary."""
+        return {
+            "inputs": self.STREAM_PROMPT.format(text=text),
+            "parameters": {
+                "max_new_tokens": max_length,
+                **self.GENERATION_PARAMETERS
+            },
+            "stream": True
+        }
+    
+    async def asummarize(
+        self,
+        text: str,
+        max_length: int = 150,
+        min_length: int = 30,
+        deadline: Optional[float] = None
+    ) -> SummaryResult:
+        """
+        Summarize the given text without blocking the event loop.
+        
+        At most ``max_concurrency`` requests per service are in flight;
+        further calls wait for a slot.
+        
+        Args:
+            text: The text to summarize
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            deadline: Seconds allowed for the call, including time spent
+                waiting for a concurrency slot
+            
+        Returns:
+            SummaryResult with the summarization result
+        """
+        with self.tracer.span("asummarize", input_chars=len(text)) as span:
+            result = await self._asummarize(text, max_length, min_length, deadline)
+            span.set(
+                success=result.success,
+                engine=result.engine,
+                cached=result.cached,
+                coalesced=result.coalesced,
+                attempts=result.attempts
             )
+        return result
+    
+    async def _asummarize(
+        self,
+        text: str,
+        max_length: int,
+        min_length: int,
+        deadline: Optional[float]
+    ) -> SummaryResult:
+        """Body of asummarize(), run inside its span."""
+        if self.backend == BACKEND_EXTRACTIVE:
+            return await self._aextractive(text, max_length, min_length)
         
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        payload = {
-            "inputs": text,
+        if not self.api_key:
+            return await self._awith_fallback(text, max_length, min_length, SummaryResult(
+                success=False,
+                error="API key not configured"
+            ))
+        
+        normalized = normalize_text(text)
+        if not normalized.is_valid:
+            return SummaryResult(success=False, error=normalized.error)
+        
+        key = self._request_key(normalized, max_length, min_length)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        
+        async def fetch() -> SummaryResult:
+            result = await self._arequest_summary(normalized, max_length, min_length)
+            self._store(key, result)
+            return result
+        
+        try:
+            result, shared = await asyncio.wait_for(
+                self.single_flight.ado(key, fetch),
+                timeout=deadline
+            )
+        except asyncio.TimeoutError:
+            result = SummaryResult(success=False, error="Deadline exceeded")
+        else:
+            if shared:
+                result = replace(result, coalesced=True, bytes_sent=0, bytes_received=0)
+        
+        return await self._awith_fallback(text, max_length, min_length, result)
+    
+    async def asummarize_many(
+        self,
+        texts: Sequence[str],
+        max_length: int = 150,
+        min_length: int = 30,
+        deadline: Optional[float] = None
+    ) -> List[SummaryResult]:
+        """
+        Summarize several texts concurrently.
+        
+        Args:
+            texts: The texts to summarize
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            deadline: Seconds allowed for each call
+            
+        Returns:
+            One SummaryResult per text, in input order
+        """
+        with self.tracer.span("asummarize_many", texts=len(texts)):
+            return list(await asyncio.gather(*(
+                self.asummarize(text, max_length, min_length, deadline)
+                for text in texts
+            )))
+    
+    def summarize_many(
+        self,
+        texts: Sequence[str],
+        max_length: int = 150,
+        min_length: int = 30,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_tokens: int = DEFAULT_BATCH_TOKENS
+    ) -> List[SummaryResult]:
+        """
+        Summarize several texts using as few requests as possible.
+        
+        Texts are packed into multi-input requests within the size and
+        token budgets and the batches are sent concurrently. A failure
+        affects only its own item: if a whole batch is rejected, its texts
+        are retried one by one.
+        
+        Args:
+            texts: The texts to summarize
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            batch_size: Maximum texts per request
+            batch_tokens: Maximum estimated tokens per request
+            
+        Returns:
+            One SummaryResult per text, in input order
+        """
+        if self.backend == BACKEND_EXTRACTIVE:
+            return [
+                self.extractive.summarize(text, max_length, min_length)
+                for text in texts
+            ]
+        
+        results: List[Optional[SummaryResult]] = [None] * len(texts)
+        if not self.api_key:
+            return [
+                self._with_fallback(text, max_length, min_length, SummaryResult(
+                    success=False,
+                    error="API key not configured"
+                ))
+                for text in texts
+            ]
+        
+        pending: List[int] = []
+        normalized = [normalize_text(text) for text in texts]
+        cache_keys: List[str] = []
+        for index, item in enumerate(normalized):
+            if not item.is_valid:
+                cache_keys.append("")
+                results[index] = SummaryResult(success=False, error=item.error)
+                continue
+            cache_key = self._request_key(item, max_length, min_length)
+            cache_keys.append(cache_key)
+            cached = self._lookup(cache_key)
+            if cached is not None:
+                results[index] = cached
+                continue
+            pending.append(index)
+        
+        batches = [
+            [pending[i] for i in batch]
+            for batch in pack_batches(
+                [estimate_tokens(normalized[i].text) for i in pending],
+                batch_size,
+                batch_tokens
+            )
+        ]
+        
+        def run(batch: List[int]) -> None:
+            with self.tracer.span("batch", texts=len(batch)):
+                batch_results = self._request_batch(
+                    [normalized[i] for i in batch], max_length, min_length
+                )
+                for index, result in zip(batch, batch_results):
+                    self._store(cache_keys[index], result)
+                    results[index] = self._with_fallback(
+                        texts[index], max_length, min_length, result
+                    )
+        
+        if batches:
+            workers = max(1, min(self.max_workers, len(batches)))
+            with self.tracer.span("summarize_many", texts=len(texts), batches=len(batches)):
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(self._worker(run), batches))
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            raise SummarizerError(f"No result for texts at {missing}")
+        return cast(List[SummaryResult], results)
+    
+    def _request_batch(
+        self,
+        texts: List[NormalizedText],
+        max_length: int,
+        min_length: int
+    ) -> List[SummaryResult]:
+        """Summarize a batch in one request, falling back to single requests."""
+        if len(texts) == 1:
+            return [self._request_summary(texts[0], max_length, min_length)]
+        if self._circuit_rejection() is not None:
+            return [self._request_summary(t, max_length, min_length) for t in texts]
+        
+        def send(attempt: int) -> List[SummaryResult]:
+            with self.tracer.span("build_payload"):
+                payload = self._build_payload(
+                    [t.text for t in texts], max_length, min_length
+                )
+            response = self._send(payload, attempt)
+            with self.tracer.span("parse"):
+                items = self._response_json(response)
+            if not isinstance(items, list) or len(items) != len(texts):
+                raise APIError("Batch response does not match its inputs")
+            return [self._item_result(t.stats, item) for t, item in zip(texts, items)]
+        
+        results, attempts = self._retrying(send, lambda error: None)
+        if results is None:
+            return [self._request_summary(t, max_length, min_length) for t in texts]
+        for result in results:
+            result.attempts = attempts
+        return results
+    
+    @property
+    def extractive(self) -> "ExtractiveSummarizer":
+        """The local extractive engine, created on first use."""
+        if self._extractive is None:
+            from .extractive import ExtractiveSummarizer
+            self._extractive = ExtractiveSummarizer()
+        return self._extractive
+    
+    def _with_fallback(
+        self,
+        text: str,
+        max_length: int,
+        min_length: int,
+        result: SummaryResult
+    ) -> SummaryResult:
+        """Replace a failed upstream result with a local summary if enabled."""
+        if result.success or not self.fallback or not text.strip():
+            return result
+        with self.tracer.span("fallback", engine=BACKEND_EXTRACTIVE):
+            fallback = self.extractive.summarize(text, max_length, min_length)
+        return replace(fallback, attempts=result.attempts)
+    
+    async def _aextractive(
+        self,
+        text: str,
+        max_length: int,
+        min_length: int
+    ) -> SummaryResult:
+        """Run the CPU-bound extractive engine off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.extractive.summarize, text, max_length, min_length
+        )
+    
+    async def _awith_fallback(
+        self,
+        text: str,
+        max_length: int,
+        min_length: int,
+        result: SummaryResult
+    ) -> SummaryResult:
+        """Async counterpart of _with_fallback."""
+        if result.success or not self.fallback or not text.strip():
+            return result
+        with self.tracer.span("fallback", engine=BACKEND_EXTRACTIVE):
+            fallback = await self._aextractive(text, max_length, min_length)
+        return replace(fallback, attempts=result.attempts)
+    
+    def _request_key(
+        self,
+        normalized: NormalizedText,
+        max_length: int,
+        min_length: int
+    ) -> str:
+        """Identify a request for caching and coalescing."""
+        return make_cache_key(
+            normalized.text,
+            max_length,
+            min_length,
+            self.api_url,
+            self.GENERATION_PARAMETERS,
+            text_digest=normalized.digest
+        )
+    
+    def _lookup(self, key: str) -> Optional[SummaryResult]:
+        """Return a cached result for the key, if any."""
+        if self.cache is None:
+            return None
+        with self.tracer.span("cache.lookup") as span:
+            result = self.cache.get(key)
+            span.set(hit=result is not None)
+        return result
+    
+    def _store(self, key: str, result: SummaryResult) -> None:
+        """Cache a successful result."""
+        if self.cache is not None and result.success:
+            self.cache.put(key, result)
+    
+    def _request_summary(
+        self,
+        normalized: NormalizedText,
+        max_length: int,
+        min_length: int
+    ) -> SummaryResult:
+        """Send one summarization request, retrying transient failures."""
+        rejected = self._circuit_rejection()
+        if rejected is not None:
+            return rejected
+        
+        def send(attempt: int) -> SummaryResult:
+            with self.tracer.span("build_payload"):
+                payload = self._build_payload(normalized.text, max_length, min_length)
+            response = self._send(payload, attempt)
+            with self.tracer.span("parse"):
+                result = self._parse_response(normalized.stats, response)
+            result.bytes_sent = response.bytes_sent
+            result.bytes_received = response.bytes_received
+            return result
+        
+        result, attempts = self._retrying(send, self._error_result)
+        result.attempts = attempts
+        return result
+    
+    def _retrying(
+        self,
+        send: Callable[[int], _T],
+        failed: Callable[[Exception], _T]
+    ) -> Tuple[_T, int]:
+        """
+        Call ``send(attempt)`` until it succeeds or the retry policy gives up.
+        
+        The caller checks the circuit breaker first; how the request
+        ended is reported to it here.
+        
+        Returns:
+            The result of ``send``, or ``failed(error)`` for the last
+            error, and the number of attempts made
+        """
+        started = time.monotonic()
+        attempt = 0
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                attempt += 1
+                error = None
+                try:
+                    return send(attempt), attempt
+                except Exception as e:
+                    error = e
+                    delay = self._retry_delay(e, attempt, started)
+                    if delay is None:
+                        return failed(e), attempt
+                    time.sleep(delay)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._record_circuit(error)
+    
+    async def _arequest_summary(
+        self,
+        normalized: NormalizedText,
+        max_length: int,
+        min_length: int
+    ) -> SummaryResult:
+        """
+        Send one summarization request from the event loop.
+        
+        The concurrency slot is released while waiting to retry.
+        """
+        rejected = self._circuit_rejection()
+        if rejected is not None:
+            return rejected
+        started = time.monotonic()
+        attempt = 0
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                attempt += 1
+                error = None
+                try:
+                    with self.tracer.span("build_payload"):
+                        payload = self._build_payload(
+                            normalized.text, max_length, min_length
+                        )
+                    response = await self._asend(payload, attempt)
+                    with self.tracer.span("parse"):
+                        result = self._parse_response(normalized.stats, response)
+                    result.bytes_sent = response.bytes_sent
+                    result.bytes_received = response.bytes_received
+                except Exception as e:
+                    error = e
+                    delay = self._retry_delay(e, attempt, started)
+                    if delay is None:
+                        result = self._error_result(e)
+                    else:
+                        await asyncio.sleep(delay)
+                        continue
+                result.attempts = attempt
+                return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._record_circuit(error)
+    
+    def _retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        started: float
+    ) -> Optional[float]:
+        """Backoff before the next attempt, or None to give up."""
+        if self.breaker is not None and self.breaker.state == OPEN:
+            # Other requests have already found the backend down
+            return None
+        return self.retry_policy.next_delay(error, attempt, time.monotonic() - started)
+    
+    def _circuit_rejection(self) -> Optional[SummaryResult]:
+        """Return a failed result if the circuit breaker rejects the request."""
+        if self.breaker is None or self.breaker.allow():
+            return None
+        with self.tracer.span("circuit.rejected"):
+            return self._error_result(CircuitOpenError(self.breaker.stats.retry_after))
+    
+    def _record_circuit(self, error: Optional[BaseException]) -> None:
+        """Report how an allowed request ended to the circuit breaker."""
+        if self.breaker is not None:
+            self.breaker.record(_circuit_outcome(error))
+    
+    def _send(self, payload: Dict[str, Any], attempt: int = 1) -> TransportResponse:
+        """
+        POST a payload, hedging it when a hedger is configured.
+        
+        Python threads cannot be interrupted, so a losing request runs to
+        completion on the send pool and its response is discarded.
+        """
+        if self.hedger is None:
+            return self._send_once(payload, attempt)
+        started = time.monotonic()
+        response = self._send_hedged(payload, attempt, self.hedger)
+        self.hedger.observe(time.monotonic() - started)
+        return response
+    
+    def _send_hedged(
+        self,
+        payload: Dict[str, Any],
+        attempt: int,
+        hedger: Hedger
+    ) -> TransportResponse:
+        """Send a payload and a delayed duplicate; return the first good response."""
+        delay = hedger.delay()
+        if delay is None:
+            return self._send_once(payload, attempt)
+        primary = self._send_in_thread(payload, attempt)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not hedger.try_hedge():
+            return primary.result()
+        pending = {primary, self._send_in_thread(payload, attempt, hedge=True)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if _is_usable(future):
+                    if future is not primary:
+                        hedger.record_win()
+                    return future.result()
+        return primary.result()
+    
+    def _send_in_thread(
+        self,
+        payload: Dict[str, Any],
+        attempt: int,
+        hedge: bool = False
+    ) -> "Future[TransportResponse]":
+        """Run _send_once on the service's send pool."""
+        return self._send_executor().submit(
+            self._worker(self._send_once), payload, attempt, hedge
+        )
+    
+    def _send_executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool for hedged sends, created on first use.
+        
+        Every send holds a limiter slot, so more threads than the
+        limiter's ceiling would only wait; extra sends queue instead.
+        """
+        with self._send_pool_lock:
+            if self._send_pool is None:
+                self._send_pool = ThreadPoolExecutor(
+                    max_workers=self.limiter.max_limit,
+                    thread_name_prefix="summarizer-send"
+                )
+            return self._send_pool
+    
+    def _send_once(
+        self,
+        payload: Dict[str, Any],
+        attempt: int = 1,
+        hedge: bool = False
+    ) -> TransportResponse:
+        """POST a payload once a slot is free in the concurrency limiter."""
+        with self.tracer.span("limiter.acquire"):
+            permit = self._acquire()
+        endpoint, url = self._pick_endpoint()
+        started = time.monotonic()
+        try:
+            with self.tracer.span("upstream", attempt=attempt, endpoint=url, hedge=hedge) as span:
+                response = self._post(url, payload)
+                span.set(
+                    status_code=response.status_code,
+                    bytes_sent=response.bytes_sent,
+                    bytes_received=response.bytes_received
+                )
+        except BaseException as e:
+            permit.release(_outcome_for_error(e))
+            self._release_endpoint(endpoint, started, ERROR)
+            raise
+        permit.release(_outcome_for_status(response.status_code))
+        self._release_endpoint(endpoint, started, _endpoint_outcome(response.status_code))
+        return response
+    
+    async def _asend(self, payload: Dict[str, Any], attempt: int = 1) -> TransportResponse:
+        """POST a payload from the event loop, hedging it when configured."""
+        if self.hedger is None:
+            return await self._asend_once(payload, attempt)
+        started = time.monotonic()
+        response = await self._asend_hedged(payload, attempt, self.hedger)
+        self.hedger.observe(time.monotonic() - started)
+        return response
+    
+    async def _asend_hedged(
+        self,
+        payload: Dict[str, Any],
+        attempt: int,
+        hedger: Hedger
+    ) -> TransportResponse:
+        """Send a payload and a delayed duplicate; cancel whichever loses."""
+        delay = hedger.delay()
+        if delay is None:
+            return await self._asend_once(payload, attempt)
+        primary = asyncio.ensure_future(self._asend_once(payload, attempt))
+        sends = [primary]
+        try:
+            done, _ = await asyncio.wait(sends, timeout=delay)
+            if not done and hedger.try_hedge():
+                sends.append(asyncio.ensure_future(
+                    self._asend_once(payload, attempt, hedge=True)
+                ))
+            pending = set(sends)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if _is_usable(task):
+                        if task is not primary:
+                            hedger.record_win()
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in sends:
+                task.cancel()
+    
+    async def _asend_once(
+        self,
+        payload: Dict[str, Any],
+        attempt: int = 1,
+        hedge: bool = False
+    ) -> TransportResponse:
+        """POST a payload from the event loop within both concurrency limits."""
+        transport, semaphore = self._async_resources()
+        with self.tracer.span("limiter.acquire"):
+            permit = await self._aacquire(semaphore)
+        endpoint, url = self._pick_endpoint()
+        started = time.monotonic()
+        try:
+            with self.tracer.span("upstream", attempt=attempt, endpoint=url, hedge=hedge) as span:
+                response = await self._apost(transport, url, payload)
+                span.set(
+                    status_code=response.status_code,
+                    bytes_sent=response.bytes_sent,
+                    bytes_received=response.bytes_received
+                )
+        except BaseException as e:
+            permit.release(_outcome_for_error(e))
+            cancelled = isinstance(e, asyncio.CancelledError)
+            self._release_endpoint(endpoint, started, CANCELLED if cancelled else ERROR)
+            raise
+        finally:
+            semaphore.release()
+        permit.release(_outcome_for_status(response.status_code))
+        self._release_endpoint(endpoint, started, _endpoint_outcome(response.status_code))
+        return response
+    
+    def _acquire(self) -> Permit:
+        """Wait for a limiter slot, in scheduling order when configured."""
+        if self.scheduler is not None:
+            return self.scheduler.acquire()
+        permit = self.limiter.acquire()
+        assert permit is not None
+        return permit
+    
+    async def _aacquire(self, semaphore: asyncio.Semaphore) -> Permit:
+        """
+        Take the service's semaphore and a limiter slot.
+        
+        With a scheduler the slot is taken first, so requests queued
+        behind the semaphore cannot jump the scheduler's order.
+        """
+        if self.scheduler is not None:
+            permit = await self.scheduler.acquire_async()
+            try:
+                await semaphore.acquire()
+            except BaseException:
+                permit.release(FAILURE)
+                raise
+            return permit
+        await semaphore.acquire()
+        try:
+            return await self.limiter.acquire_async()
+        except BaseException:
+            semaphore.release()
+            raise
+    
+    def _worker(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Carry the caller's span and work context onto a worker thread."""
+        return self.tracer.wrap(carry_work(fn))
+    
+    def _post(self, url: str, payload: Dict[str, Any]) -> TransportResponse:
+        """POST an encoded payload, resending it plain if compression is refused."""
+        body = self.codec.encode(payload, url)
+        response = self.transport.post(
+            url,
+            headers={**self._headers(), **body.headers},
+            content=body.content,
+            timeout=self.timeout
+        )
+        if self.codec.refused(body, response.status_code):
+            self.codec.record(body, response.bytes_received)
+            body = self.codec.encode(payload, url, compress=False)
+            response = self.transport.post(
+                url,
+                headers={**self._headers(), **body.headers},
+                content=body.content,
+                timeout=self.timeout
+            )
+            if response.status_code not in REJECTED_ENCODING_STATUSES:
+                self.codec.send_plain(url)
+        self.codec.record(body, response.bytes_received)
+        return response
+    
+    async def _apost(
+        self,
+        transport: AsyncPooledTransport,
+        url: str,
+        payload: Dict[str, Any]
+    ) -> TransportResponse:
+        """Async counterpart of _post."""
+        body = self.codec.encode(payload, url)
+        response = await transport.post(
+            url,
+            headers={**self._headers(), **body.headers},
+            content=body.content,
+            timeout=self.timeout
+        )
+        if self.codec.refused(body, response.status_code):
+            self.codec.record(body, response.bytes_received)
+            body = self.codec.encode(payload, url, compress=False)
+            response = await transport.post(
+                url,
+                headers={**self._headers(), **body.headers},
+                content=body.content,
+                timeout=self.timeout
+            )
+            if response.status_code not in REJECTED_ENCODING_STATUSES:
+                self.codec.send_plain(url)
+        self.codec.record(body, response.bytes_received)
+        return response
+    
+    def _pick_endpoint(self) -> Tuple[Optional[Endpoint], str]:
+        """Choose the URL for one upstream request."""
+        if self.endpoints is None:
+            return None, self.api_url
+        endpoint = self.endpoints.acquire()
+        return endpoint, endpoint.url
+    
+    def _release_endpoint(
+        self,
+        endpoint: Optional[Endpoint],
+        started: float,
+        outcome: str
+    ) -> None:
+        """Report a finished request to the endpoint pool."""
+        if endpoint is not None and self.endpoints is not None:
+            self.endpoints.release(endpoint, time.monotonic() - started, outcome)
+    
+    def _async_resources(self) -> Tuple[AsyncPooledTransport, asyncio.Semaphore]:
+        """
+        Return the async transport and semaphore for the running loop.
+        
+        Both are tied to an event loop, so they are rebuilt when the service
+        is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            if self._owns_async_transport or self._async_transport is None:
+                self._async_transport = AsyncPooledTransport(self._transport_config)
+            self._async_semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._async_loop = loop
+        return self._async_transport, self._async_semaphore  # type: ignore[return-value]
+    
+    def _headers(self) -> Dict[str, str]:
+        """Build the request headers."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept-Encoding": ACCEPT_ENCODING
+        }
+    
+    def _build_payload(
+        self,
+        inputs: Union[str, List[str]],
+        max_length: int,
+        min_length: int
+    ) -> Dict[str, Any]:
+        """Build the inference request body for one or several texts."""
+        return {
+            "inputs": inputs,
             "parameters": {
                 "max_length": max_length,
                 "min_length": min_length,
-                "do_sample": False
+                **self.GENERATION_PARAMETERS
             }
         }
+    
+    def _parse_response(
+        self,
+        stats: TextStats,
+        response: TransportResponse
+    ) -> SummaryResult:
+        """
+        Turn an inference response into a SummaryResult.
         
-        try:
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
+        Raises:
+            ModelLoadingError: If the model is still loading
+            RateLimitError: For 429 responses
+            requests.exceptions.HTTPError: For other 4xx and 5xx responses
+        """
+        result = self._response_json(response)
+        
+        if isinstance(result, dict) and "error" in result:
+            return SummaryResult(
+                success=False,
+                error=result["error"]
             )
-            response.raise_for_status()
+        
+        if isinstance(result, list) and len(result) > 0:
+            return self._item_result(stats, result[0])
+        
+        return SummaryResult(
+            success=False,
+            error="Unexpected API response format"
+        )
+    
+    @staticmethod
+    def _response_json(response: TransportResponse) -> Any:
+        """
+        Decode the body of an inference response.
+        
+        Raises:
+            ModelLoadingError: If the model is still loading
+            RateLimitError: For 429 responses
+            requests.exceptions.HTTPError: For other 4xx and 5xx responses
+        """
+        if response.status_code == 429:
+            raise RateLimitError(parse_retry_after(response.headers))
+        
+        try:
             result = response.json()
+        except ValueError:
+            response.raise_for_status()
+            raise
+        
+        if isinstance(result, dict) and "loading" in str(result.get("error", "")).lower():
+            raise ModelLoadingError(result.get("estimated_time"))
+        
+        response.raise_for_status()
+        return result
+    
+    @staticmethod
+    def _item_result(input_stats: TextStats, item: Any) -> SummaryResult:
+        """Build the result for one generated item of a response."""
+        # Some pipelines wrap each item of a batched response in a list
+        if isinstance(item, list) and item:
+            item = item[0]
+        if not isinstance(item, dict):
+            return SummaryResult(
+                success=False,
+                error="Unexpected API response format"
+            )
+        if "error" in item:
+            return SummaryResult(success=False, error=item["error"])
+        
+        summary_text = item.get("summary_text", "")
+        output_stats = text_stats(summary_text)
+        input_len = input_stats.characters
+        output_len = output_stats.characters
+        reduction = (1 - output_len / input_len) * 100 if input_len > 0 else 0
+        
+        return SummaryResult(
+            success=True,
+            summary=summary_text,
+            input_length=input_len,
+            output_length=output_len,
+            reduction_percent=round(reduction, 1),
+            input_words=input_stats.words,
+            output_words=output_stats.words
+        )
+    
+    @staticmethod
+    def _error_result(error: Exception) -> SummaryResult:
+        """Map a request exception to a failed SummaryResult."""
+        if isinstance(error, requests.exceptions.Timeout):
+            return SummaryResult(success=False, error="Request timed out")
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return SummaryResult(success=False, error="Connection failed")
+        if isinstance(error, requests.exceptions.HTTPError):
+            return SummaryResult(success=False, error=f"HTTP error: {error}")
+        if isinstance(error, SummarizerError):
+            return SummaryResult(success=False, error=error.message)
+        return SummaryResult(success=False, error=str(error))
+    
+    def summarize_long(
+        self,
+        text: str,
+        max_length: int = 150,
+        min_length: int = 30
+    ) -> SummaryResult:
+        """
+        Summarize a document that may exceed the model's input window.
+        
+        The text is split into token-budgeted chunks, the chunks are
+        summarized concurrently, and the joined partial summaries are
+        reduced again until they fit a single request.
+        
+        Args:
+            text: The text to summarize
+            max_length: Maximum summary length
+            min_length: Minimum summary length
             
-            if isinstance(result, dict) and "error" in result:
+        Returns:
+            SummaryResult with per-level timing and chunk counts
+        """
+        with self.tracer.span("summarize_long", input_chars=len(text)) as span:
+            result = self._summarize_long(text, max_length, min_length)
+            span.set(success=result.success, chunk_count=result.chunk_count)
+        return result
+    
+    def _summarize_long(
+        self,
+        text: str,
+        max_length: int,
+        min_length: int
+    ) -> SummaryResult:
+        """Body of summarize_long(), run inside its span."""
+        if self.backend == BACKEND_EXTRACTIVE:
+            return self.extractive.summarize(text, max_length, min_length)
+        
+        started = time.perf_counter()
+        levels: List[ReductionLevel] = []
+        current = text
+        bytes_sent = bytes_received = 0
+        
+        while estimate_tokens(current) > self.chunk_tokens:
+            if len(levels) >= self.MAX_REDUCTION_LEVELS:
                 return SummaryResult(
                     success=False,
-                    error=result["error"]
+                    error="Document could not be reduced to a single request",
+                    levels=levels,
+                    elapsed_seconds=time.perf_counter() - started
                 )
             
-            if isinstance(result, list) and len(result) > 0:
-                summary_text = result[0].get("summary_text", "")
-                input_len = len(text)
-                output_len = len(summary_text)
-                reduction = (1 - output_len / input_len) * 100 if input_len > 0 else 0
-                
+            level_started = time.perf_counter()
+            chunks = split_into_chunks(current, self.chunk_tokens)
+            with self.tracer.span("reduce", level=len(levels) + 1, chunks=len(chunks)):
+                partials = self._summarize_chunks(chunks, max_length, min_length)
+            
+            failed = next((r for r in partials if not r.success), None)
+            if failed is not None:
                 return SummaryResult(
-                    success=True,
-                    summary=summary_text,
-                    input_length=input_len,
-                    output_length=output_len,
-                    reduction_percent=round(reduction, 1)
+                    success=False,
+                    error=failed.error,
+                    levels=levels,
+                    elapsed_seconds=time.perf_counter() - started
                 )
             
-            return SummaryResult(
-                success=False,
-                error="Unexpected API response format"
+            bytes_sent += sum(r.bytes_sent for r in partials)
+            bytes_received += sum(r.bytes_received for r in partials)
+            reduced = "\n\n".join(r.summary or "" for r in partials)
+            levels.append(ReductionLevel(
+                level=len(levels) + 1,
+                chunk_count=len(chunks),
+                input_length=len(current),
+                output_length=len(reduced),
+                elapsed_seconds=time.perf_counter() - level_started
+            ))
+            current = reduced
+        
+        result = self.summarize(current, max_length, min_length)
+        if result.success:
+            input_len = len(text)
+            output_len = result.output_length
+            reduction = (1 - output_len / input_len) * 100 if input_len > 0 else 0
+            result = replace(
+                result,
+                input_length=input_len,
+                reduction_percent=round(reduction, 1),
+                input_words=text_stats(text).words,
+                chunk_count=sum(level.chunk_count for level in levels) or 1
             )
-            
-        except requests.exceptions.Timeout:
-            return SummaryResult(success=False, error="Request timed out")
-        except requests.exceptions.ConnectionError:
-            return SummaryResult(success=False, error="Connection failed")
-        except requests.exceptions.HTTPError as e:
-            return SummaryResult(success=False, error=f"HTTP error: {e}")
-        except Exception as e:
-            return SummaryResult(success=False, error=str(e))
+        return replace(
+            result,
+            levels=levels,
+            bytes_sent=result.bytes_sent + bytes_sent,
+            bytes_received=result.bytes_received + bytes_received,
+            elapsed_seconds=time.perf_counter() - started
+        )
+    
+    def close(self) -> None:
+        """Release the pooled connections and send threads held by this service."""
+        with self._send_pool_lock:
+            pool, self._send_pool = self._send_pool, None
+        if pool is not None:
+            # Losing hedges finish in the background; nobody reads them
+            pool.shutdown(wait=False)
+        self.transport.close()
+    
+    def __enter__(self) -> "SummarizerService":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    async def aclose(self) -> None:
+        """Release the async connections held by this service."""
+        if self._async_transport is not None and self._owns_async_transport:
+            await self._async_transport.aclose()
+            self._async_transport = None
+            self._async_loop = None
+    
+    async def __aenter__(self) -> "SummarizerService":
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+    
+    def _summarize_chunks(
+        self,
+        chunks: List[str],
+        max_length: int,
+        min_length: int
+    ) -> List[SummaryResult]:
+        """Summarize chunks concurrently, preserving their order."""
+        workers = max(1, min(self.max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                self._worker(
+                    lambda chunk: self.summarize(chunk, max_length, min_length)
+                ),
+                chunks
+            ))
@@ -0,0 +1,554 @@
+"""
+Transport - Pooled keep-alive HTTP transport for inference requests.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .codec import dumps, loads
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection pool settings for a PooledTransport."""
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    http2: bool = False
+
+
+@dataclass
+class TransportStats:
+    """Snapshot of connection pool counters."""
+    requests: int
+    connections_opened: int
+    pool_hits: int
+    pool_misses: int
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests served on an already-open connection."""
+        return self.pool_hits / self.requests if self.requests else 0.0
+
+
+@dataclass
+class TransportResponse:
+    """Backend-neutral HTTP response."""
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str]
+    url: str = ""
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    def json(self) -> Any:
+        """
+        Decode the response body as JSON.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not JSON,
+                a RequestException like the one requests itself raises
+        """
+        try:
+            return loads(self.content)
+        except ValueError as e:
+            raise requests.exceptions.JSONDecodeError(
+                getattr(e, "msg", str(e)),
+                self.content.decode("utf-8", "replace"),
+                getattr(e, "pos", 0)
+            ) from e
+
+    def raise_for_status(self) -> None:
+        """Raise requests.HTTPError for 4xx and 5xx responses."""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}",
+                response=self  # type: ignore[arg-type]
+            )
+
+
+class TransportStream:
+    """
+    HTTP response whose body is consumed incrementally, line by line.
+
+    Close the stream (or use it as a context manager) to return its
+    connection to the pool.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        lines: Iterable[str],
+        read: Callable[[], bytes],
+        close: Callable[[], None],
+        url: str = ""
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self._lines = lines
+        self._read = read
+        self._close = close
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield decoded body lines as they arrive."""
+        return iter(self._lines)
+
+    def read(self) -> TransportResponse:
+        """Read the rest of the body into a regular response."""
+        return TransportResponse(
+            status_code=self.status_code,
+            content=self._read(),
+            headers=self.headers,
+            url=self.url
+        )
+
+    def close(self) -> None:
+        """Release the connection."""
+        self._close()
+
+    def __enter__(self) -> "TransportStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _Counters:
+    """Thread-safe request and connection counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def snapshot(self) -> TransportStats:
+        with self._lock:
+            misses = min(self.connections_opened, self.requests)
+            return TransportStats(
+                requests=self.requests,
+                connections_opened=self.connections_opened,
+                pool_hits=self.requests - misses,
+                pool_misses=misses
+            )
+
+
+def _counting_pool(base: Type[HTTPConnectionPool], counters: _Counters) -> type:
+    """Build a connection pool class that counts every socket it opens."""
+    connection_cls = base.ConnectionCls
+
+    def connect(self: Any) -> None:
+        counters.record_connection()
+        connection_cls.connect(self)
+
+    counting_connection = type(
+        f"Counting{connection_cls.__name__}", (connection_cls,), {"connect": connect}
+    )
+    return type(
+        f"Counting{base.__name__}", (base,), {"ConnectionCls": counting_connection}
+    )
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools report connection creation to counters."""
+
+    def __init__(self, counters: _Counters, **kwargs: Any) -> None:
+        self._counters = counters
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._counters),
+            "https": _counting_pool(HTTPSConnectionPool, self._counters),
+        }
+
+
+class PooledTransport:
+    """
+    Thread-safe HTTP transport that reuses connections across requests.
+
+    One transport is meant to be created per SummarizerService and shared
+    by every caller of that service, so repeat requests skip the TCP and
+    TLS handshake.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            config: Pool settings; defaults to TransportConfig()
+        """
+        self.config = config or TransportConfig()
+        self._counters = _Counters()
+        self._client: Any = None
+        self._session: Optional[requests.Session] = None
+
+        if self.config.http2:
+            self._client = self._build_http2_client()
+        else:
+            self._session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        """Create a requests session with a counting pooled adapter."""
+        session = requests.Session()
+        adapter = _CountingAdapter(
+            self._counters,
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _build_http2_client(self) -> Any:
+        """Create an HTTP/2 capable httpx client."""
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "HTTP/2 transport requires httpx: pip install 'httpx[http2]'"
+            ) from e
+
+        limits = httpx.Limits(
+            max_connections=self.config.pool_maxsize,
+            max_keepalive_connections=(
+                self.config.pool_maxsize if self.config.keep_alive else 0
+            )
+        )
+        return httpx.Client(http2=True, limits=limits)
+
+    def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace hook used to count new HTTP/2 connections."""
+        if event_name == "connection.connect_tcp.complete":
+            self._counters.record_connection()
+
+    def post(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        json_body: Any = None,
+        timeout: Optional[float] = None,
+        content: Optional[bytes] = None
+    ) -> TransportResponse:
+        """
+        Send a POST request over a pooled connection.
+
+        Args:
+            url: Target URL
+            headers: Request headers
+            json_body: Body to send as JSON
+            timeout: Request timeout in seconds
+            content: Pre-encoded body sent instead of json_body; headers
+                must describe it
+
+        Returns:
+            TransportResponse with the status, headers, body and bytes
+            on the wire
+
+        Raises:
+            requests.exceptions.Timeout: If the request timed out
+            requests.exceptions.ConnectionError: If the connection failed
+        """
+        self._counters.record_request()
+        headers, content = _request_body(headers, json_body, content)
+        if self._session is not None:
+            response = self._session.post(
+                url, headers=headers, data=content, timeout=timeout
+            )
+            return TransportResponse(
+                status_code=response.status_code,
+                content=response.content,
+                headers=response.headers,
+                url=url,
+                bytes_sent=len(content or b""),
+                bytes_received=_wire_size(response)
+            )
+        return self._post_http2(url, headers, content, timeout)
+
+    def post_stream(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        json_body: Any = None,
+        timeout: Optional[float] = None,
+        content: Optional[bytes] = None
+    ) -> TransportStream:
+        """
+        Send a POST request and return once the response headers arrive.
+
+        Args:
+            url: Target URL
+            headers: Request headers
+            json_body: Body to send as JSON
+            timeout: Connect and per-read timeout in seconds
+            content: Pre-encoded body sent instead of json_body
+
+        Returns:
+            TransportStream for reading the body incrementally
+
+        Raises:
+            requests.exceptions.Timeout: If the request timed out
+            requests.exceptions.ConnectionError: If the connection failed
+        """
+        self._counters.record_request()
+        headers, content = _request_body(headers, json_body, content)
+        if self._session is not None:
+            response = self._session.post(
+                url, headers=headers, data=content, timeout=timeout, stream=True
+            )
+            return TransportStream(
+                status_code=response.status_code,
+                headers=response.headers,
+                lines=(
+                    line.decode("utf-8")
+                    for line in _mapped_errors(response.iter_lines(chunk_size=None))
+                ),
+                read=lambda: response.content,
+                close=response.close,
+                url=url
+            )
+        return self._post_stream_http2(url, headers, content, timeout)
+
+    def _post_stream_http2(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        content: Optional[bytes],
+        timeout: Optional[float]
+    ) -> TransportStream:
+        """Streaming counterpart of _post_http2."""
+        import httpx
+
+        request = self._client.build_request(
+            "POST",
+            url,
+            headers=headers,
+            content=content,
+            timeout=timeout,
+            extensions={"trace": self._trace}
+        )
+        try:
+            response = self._client.send(request, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return TransportStream(
+            status_code=response.status_code,
+            headers=CaseInsensitiveDict(response.headers),
+            lines=_mapped_errors(response.iter_lines()),
+            read=response.read,
+            close=response.close,
+            url=url
+        )
+
+    def _post_http2(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        content: Optional[bytes],
+        timeout: Optional[float]
+    ) -> TransportResponse:
+        """Send a request with the httpx client, mapping its errors."""
+        import httpx
+
+        try:
+            response = self._client.post(
+                url,
+                headers=headers,
+                content=content,
+                timeout=timeout,
+                extensions={"trace": self._trace}
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return TransportResponse(
+            status_code=response.status_code,
+            content=response.content,
+            headers=CaseInsensitiveDict(response.headers),
+            url=url,
+            bytes_sent=len(content or b""),
+            bytes_received=response.num_bytes_downloaded
+        )
+
+    @property
+    def stats(self) -> TransportStats:
+        """Current pool hit/miss and connection counters."""
+        return self._counters.snapshot()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if self._session is not None:
+            self._session.close()
+        if self._client is not None:
+            self._client.close()
+
+    def __enter__(self) -> "PooledTransport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _mapped_errors(lines: Iterable[Any]) -> Iterator[Any]:
+    """Re-raise read errors from either HTTP backend as requests exceptions."""
+    try:
+        yield from lines
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+        raise
+    except requests.exceptions.RequestException as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+    except Exception as e:
+        if type(e).__module__.startswith(("httpx", "httpcore", "urllib3")):
+            if "Timeout" in type(e).__name__:
+                raise requests.exceptions.Timeout(str(e)) from e
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        raise
+
+
+def _request_body(
+    headers: Optional[Mapping[str, str]],
+    json_body: Any,
+    content: Optional[bytes]
+) -> Tuple[Dict[str, str], Optional[bytes]]:
+    """Serialize a JSON body unless pre-encoded content was given."""
+    merged = dict(headers or {})
+    if content is None and json_body is not None:
+        content = dumps(json_body)
+        merged.setdefault("Content-Type", "application/json")
+    return merged, content
+
+
+def _wire_size(response: requests.Response) -> int:
+    """Bytes of a requests response body as received, before decompression."""
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return len(response.content)
+
+
+class AsyncPooledTransport:
+    """
+    Asyncio HTTP transport backed by a pooled httpx.AsyncClient.
+
+    A transport is bound to the event loop it is first used on.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            config: Pool settings; defaults to TransportConfig()
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "The async API requires httpx: pip install 'ai-text-summarizer[async]'"
+            ) from e
+
+        self.config = config or TransportConfig()
+        self._counters = _Counters()
+        limits = httpx.Limits(
+            max_connections=self.config.pool_maxsize,
+            max_keepalive_connections=(
+                self.config.pool_maxsize if self.config.keep_alive else 0
+            )
+        )
+        self._client = httpx.AsyncClient(http2=self.config.http2, limits=limits)
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace hook used to count new connections."""
+        if event_name == "connection.connect_tcp.complete":
+            self._counters.record_connection()
+
+    async def post(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        json_body: Any = None,
+        timeout: Optional[float] = None,
+        content: Optional[bytes] = None
+    ) -> TransportResponse:
+        """
+        Send a POST request over a pooled connection.
+
+        Args:
+            url: Target URL
+            headers: Request headers
+            json_body: Body to send as JSON
+            timeout: Request timeout in seconds
+            content: Pre-encoded body sent instead of json_body; headers
+                must describe it
+
+        Returns:
+            TransportResponse with the status, headers, body and bytes
+            on the wire
+
+        Raises:
+            requests.exceptions.Timeout: If the request timed out
+            requests.exceptions.ConnectionError: If the connection failed
+        """
+        import httpx
+
+        self._counters.record_request()
+        headers, content = _request_body(headers, json_body, content)
+        try:
+            response = await self._client.post(
+                url,
+                headers=headers,
+                content=content,
+                timeout=timeout,
+                extensions={"trace": self._trace}
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return TransportResponse(
+            status_code=response.status_code,
+            content=response.content,
+            headers=CaseInsensitiveDict(response.headers),
+            url=url,
+            bytes_sent=len(content or b""),
+            bytes_received=response.num_bytes_downloaded
+        )
+
+    @property
+    def stats(self) -> TransportStats:
+        """Current pool hit/miss and connection counters."""
+        return self._counters.snapshot()
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncPooledTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
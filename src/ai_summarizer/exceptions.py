@@ -0,0 +1,79 @@
+"""
+Exceptions - Custom exceptions for the AI Text Summarizer.
+"""
+
+from typing import Optional
+
+
+class SummarizerError(Exception):
+    """Base exception for summarizer errors."""
+    pass
+
+
+class APIError(SummarizerError):
+    """Raised when API request fails."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(self.message)
+
+
+class ValidationError(SummarizerError):
+    """Raised when input validation fails."""
+    
+    def __init__(self, message: str, field: Optional[str] = None):
+        self.message = message
+        self.field = field
+        super().__init__(self.message)
+
+
+class ConfigurationError(SummarizerError):
+    """Raised when configuration is missing or invalid."""
+    
+    def __init__(self, message: str, config_key: Optional[str] = None):
+        self.message = message
+        self.config_key = config_key
+        super().__init__(self.message)
+
+
+class ModelLoadingError(APIError):
+    """Raised when the AI model is still loading."""
+    
+    def __init__(self, estimated_time: Optional[float] = None):
+        self.estimated_time = estimated_time
+        message = "Model is loading. Please try again in a few seconds."
+        if estimated_time:
+            message = f"Model is loading. Estimated time: {estimated_time:g} seconds."
+        super().__init__(message, status_code=503)
+
+
+class RateLimitError(APIError):
+    """Raised when API rate limit is exceeded."""
+    
+    def __init__(self, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        message = "Rate limit exceeded. Please try again later."
+        if retry_after:
+            message = f"Rate limit exceeded. Retry after {retry_after:g} seconds."
+        super().__init__(message, status_code=429)
+
+
+class CircuitOpenError(APIError):
+    """Raised when requests fail fast because the backend is unhealthy."""
+    
+    def __init__(self, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        message = "Inference backend unavailable."
+        if retry_after:
+            message = f"Inference backend unavailable. Retry after {retry_after:.0f} seconds."
+        super().__init__(message, status_code=503)
+
+
+class DeadlineExceededError(SummarizerError):
+    """Raised when queued work is dropped because its caller stopped waiting."""
+    
+    def __init__(self, priority: Optional[str] = None):
+        self.message = "Deadline exceeded"
+        self.priority = priority
+        super().__init__(self.message)
@@ -2,10 +2,18 @@
 Health Check Module - Application health and metrics endpoints.
 """
 
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from .config import get_settings
+from .core.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from .metrics import LatencyRecorder
+
+# Prometheus values for the circuit state gauge
+CIRCUIT_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
 
 
 @dataclass
@@ -22,12 +30,32 @@ class HealthChecker:
     """
     Health checker for the AI Text Summarizer service.
     
-    Provides health status and basic metrics for monitoring.
+    Provides health status, request counters and latency percentiles
+    for monitoring. Safe to call from multiple threads.
     """
     
-    def __init__(self, version: str = "1.0.0"):
+    METRIC_PREFIX = "summarizer"
+    
+    def __init__(
+        self,
+        version: str = "1.0.0",
+        latency: Optional[LatencyRecorder] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize the health checker.
+        
+        Args:
+            version: Service version reported by check_health()
+            latency: Latency recorder, or None for default windows and buckets
+            breaker: Circuit breaker guarding the inference backend; its
+                state decides the reported status
+        """
         self.version = version
         self.start_time = time.time()
+        self.latency = latency if latency is not None else LatencyRecorder()
+        self.breaker = breaker
+        self._lock = threading.Lock()
         self._request_count = 0
         self._error_count = 0
     
@@ -35,48 +63,150 @@ class HealthChecker:
         """
         Perform health check and return status.
         
+        The status is "healthy" while the circuit breaker is closed,
+        "degraded" while it is half-open and "unhealthy" while it is open.
+        
         Returns:
             HealthStatus with current service health
         """
         uptime = time.time() - self.start_time
+        checks = {
+            "api_configured": self._check_api_config(),
+            "dependencies_loaded": True
+        }
+        status = "healthy"
+        if self.breaker is not None:
+            state = self.breaker.state
+            checks["backend_available"] = state == CLOSED
+            if state == OPEN:
+                status = "unhealthy"
+            elif state == HALF_OPEN:
+                status = "degraded"
         
         return HealthStatus(
-            status="healthy",
+            status=status,
             version=self.version,
             timestamp=datetime.utcnow().isoformat() + "Z",
             uptime_seconds=round(uptime, 2),
-            checks={
-                "api_configured": self._check_api_config(),
-                "dependencies_loaded": True
-            }
+            checks=checks
         )
     
     def _check_api_config(self) -> bool:
         """Check if API is configured."""
-        import os
-        return bool(os.getenv("HUGGINGFACE_API_KEY"))
+        return get_settings().is_configured
     
-    def record_request(self) -> None:
-        """Record a successful request."""
-        self._request_count += 1
+    def record_request(
+        self,
+        latency: Optional[float] = None,
+        input_chars: int = 0,
+        outcome: str = "success"
+    ) -> None:
+        """
+        Record a successful request.
+        
+        Args:
+            latency: Request duration in seconds, if measured
+            input_chars: Input length, used for the size breakdown
+            outcome: Outcome label for the latency series
+        """
+        with self._lock:
+            self._request_count += 1
+        if latency is not None:
+            self.latency.observe(latency, outcome, input_chars)
     
-    def record_error(self) -> None:
-        """Record an error."""
-        self._error_count += 1
+    def record_error(
+        self,
+        latency: Optional[float] = None,
+        input_chars: int = 0,
+        outcome: str = "error"
+    ) -> None:
+        """
+        Record an error.
+        
+        Args:
+            latency: Request duration in seconds, if measured
+            input_chars: Input length, used for the size breakdown
+            outcome: Outcome label for the latency series
+        """
+        with self._lock:
+            self._error_count += 1
+        if latency is not None:
+            self.latency.observe(latency, outcome, input_chars)
     
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get service metrics.
         
         Returns:
-            Dictionary of metrics
+            Dictionary of metrics, with latency percentiles per rolling
+            window in seconds
         """
-        return {
-            "total_requests": self._request_count,
-            "total_errors": self._error_count,
-            "error_rate": self._error_count / max(self._request_count, 1),
-            "uptime_seconds": round(time.time() - self.start_time, 2)
+        with self._lock:
+            requests, errors = self._request_count, self._error_count
+        latency = {}
+        for window in self.latency.windows:
+            summary = self.latency.percentiles(window=window)
+            latency[f"{window}s"] = {
+                "count": summary.count,
+                "p50": round(summary.p50, 4),
+                "p90": round(summary.p90, 4),
+                "p99": round(summary.p99, 4),
+                "max": round(summary.max, 4)
+            }
+        metrics = {
+            "total_requests": requests,
+            "total_errors": errors,
+            "error_rate": errors / max(requests, 1),
+            "uptime_seconds": round(time.time() - self.start_time, 2),
+            "latency": latency
         }
+        if self.breaker is not None:
+            breaker = self.breaker.stats
+            metrics["circuit"] = {
+                "state": breaker.state,
+                "opened": breaker.opened,
+                "rejected": breaker.rejected,
+                "retry_after": round(breaker.retry_after, 2)
+            }
+        return metrics
+    
+    def export_prometheus(self) -> str:
+        """
+        Export metrics in Prometheus text exposition format.
+        
+        Returns:
+            Exposition text ending in a newline
+        """
+        prefix = self.METRIC_PREFIX
+        with self._lock:
+            requests, errors = self._request_count, self._error_count
+        lines = [
+            f"# HELP {prefix}_requests_total Successful summarization requests.",
+            f"# TYPE {prefix}_requests_total counter",
+            f"{prefix}_requests_total {requests}",
+            f"# HELP {prefix}_errors_total Failed summarization requests.",
+            f"# TYPE {prefix}_errors_total counter",
+            f"{prefix}_errors_total {errors}",
+            f"# HELP {prefix}_uptime_seconds Seconds since the service started.",
+            f"# TYPE {prefix}_uptime_seconds gauge",
+            f"{prefix}_uptime_seconds {round(time.time() - self.start_time, 2)}",
+        ]
+        if self.breaker is not None:
+            breaker = self.breaker.stats
+            lines.extend([
+                f"# HELP {prefix}_circuit_state Circuit breaker state "
+                "(0 closed, 1 half-open, 2 open).",
+                f"# TYPE {prefix}_circuit_state gauge",
+                f"{prefix}_circuit_state {CIRCUIT_STATE_VALUES[breaker.state]}",
+                f"# HELP {prefix}_circuit_opened_total Times the circuit opened.",
+                f"# TYPE {prefix}_circuit_opened_total counter",
+                f"{prefix}_circuit_opened_total {breaker.opened}",
+                f"# HELP {prefix}_circuit_rejected_total Requests failed fast by the circuit.",
+                f"# TYPE {prefix}_circuit_rejected_total counter",
+                f"{prefix}_circuit_rejected_total {breaker.rejected}",
+            ])
+        lines.extend(self.latency.render_prometheus(f"{prefix}_request_duration_seconds"))
+        return "\n".join(lines) + "\n"
 
 
 # Global health checker instance
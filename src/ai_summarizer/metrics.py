@@ -0,0 +1,372 @@
+"""
+Metrics Module - Latency histograms with streaming percentile estimates.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Log-spaced bucket upper bounds from 1 ms to ~131 s, each sqrt(2) apart,
+# so an interpolated percentile is within ~20% of the true value
+DEFAULT_BOUNDS: Tuple[float, ...] = tuple(0.001 * 2 ** (k / 2) for k in range(35))
+
+# Input size bucket upper bounds in characters
+DEFAULT_SIZE_BUCKETS: Tuple[int, ...] = (1000, 5000, 20000, 50000)
+
+# Rolling windows reported alongside the all-time histogram, in seconds
+DEFAULT_WINDOWS: Tuple[int, ...] = (60, 300, 900)
+
+QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+
+
+def _format_chars(chars: int) -> str:
+    return f"{chars // 1000}k" if chars and chars % 1000 == 0 else str(chars)
+
+
+def size_bucket(chars: int, buckets: Sequence[int] = DEFAULT_SIZE_BUCKETS) -> str:
+    """
+    Label the input size bucket a text length falls into.
+
+    Args:
+        chars: Input length in characters
+        buckets: Ascending bucket upper bounds
+
+    Returns:
+        Label such as "1k-5k", or "50k+" past the last bound
+    """
+    index = bisect_left(buckets, chars)
+    if index == len(buckets):
+        return f"{_format_chars(buckets[-1])}+"
+    lower = buckets[index - 1] if index else 0
+    return f"{_format_chars(lower)}-{_format_chars(buckets[index])}"
+
+
+def _window_label(seconds: int) -> str:
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    if seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
+
+
+@dataclass
+class LatencySummary:
+    """Percentile snapshot of a set of latency observations."""
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Recording is a binary search and an increment, and percentiles are
+    interpolated within the bucket that holds them. Not thread-safe on
+    its own; LatencyRecorder serializes access.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS):
+        self.bounds = bounds
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one latency in seconds."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram with the same bounds into this one."""
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated latency in seconds, or 0.0 with no observations
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(max(estimate, self.min), self.max)
+            cumulative += count
+        return self.max
+
+    def summary(self) -> LatencySummary:
+        """Percentiles of everything recorded."""
+        return LatencySummary(
+            count=self.count,
+            p50=self.quantile(0.5),
+            p90=self.quantile(0.9),
+            p99=self.quantile(0.99),
+            max=self.max
+        )
+
+
+class RollingHistogram:
+    """
+    Histogram over a sliding time window.
+
+    Observations land in time slices of ``slice_seconds``; slices older
+    than ``window_seconds`` are dropped, and a query merges the slices
+    that overlap the requested window.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        slice_seconds: float = 10.0,
+        bounds: Sequence[float] = DEFAULT_BOUNDS
+    ):
+        self.window_seconds = window_seconds
+        self.slice_seconds = slice_seconds
+        self.bounds = bounds
+        self._slices: Deque[Tuple[int, LatencyHistogram]] = deque()
+
+    def observe(self, value: float, now: float) -> None:
+        """Record one latency at the given clock time."""
+        index = int(now // self.slice_seconds)
+        if not self._slices or self._slices[-1][0] != index:
+            self._slices.append((index, LatencyHistogram(self.bounds)))
+            self._expire(now)
+        self._slices[-1][1].observe(value)
+
+    def _expire(self, now: float) -> None:
+        oldest = int((now - self.window_seconds) // self.slice_seconds)
+        while self._slices and self._slices[0][0] < oldest:
+            self._slices.popleft()
+
+    def window(self, seconds: float, now: float) -> LatencyHistogram:
+        """
+        Merge the slices covering the last ``seconds``.
+
+        Args:
+            seconds: Window length, at most ``window_seconds``
+            now: Current clock time
+
+        Returns:
+            A new histogram of the window's observations
+        """
+        oldest = int((now - seconds) // self.slice_seconds)
+        merged = LatencyHistogram(self.bounds)
+        for index, histogram in self._slices:
+            if index >= oldest:
+                merged.merge(histogram)
+        return merged
+
+
+class _Series:
+    """All-time and rolling histograms for one label set."""
+
+    def __init__(self, bounds: Sequence[float], max_window: float, slice_seconds: float):
+        self.total = LatencyHistogram(bounds)
+        self.rolling = RollingHistogram(max_window, slice_seconds, bounds)
+
+
+class LatencyRecorder:
+    """
+    Thread-safe latency recorder keyed by outcome and input size bucket.
+
+    Keeps an all-time histogram per series for Prometheus export and a
+    rolling one for percentiles over recent windows.
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        slice_seconds: float = 10.0,
+        size_buckets: Sequence[int] = DEFAULT_SIZE_BUCKETS,
+        bounds: Sequence[float] = DEFAULT_BOUNDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            windows: Rolling window lengths in seconds
+            slice_seconds: Granularity of the rolling windows
+            size_buckets: Input size bucket upper bounds in characters
+            bounds: Latency bucket upper bounds in seconds
+            clock: Monotonic time source
+        """
+        self.windows = tuple(sorted(windows))
+        self.slice_seconds = slice_seconds
+        self.size_buckets = tuple(size_buckets)
+        self.bounds = tuple(bounds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    def observe(self, seconds: float, outcome: str = "success", input_chars: int = 0) -> None:
+        """
+        Record one request's latency.
+
+        Args:
+            seconds: Request latency
+            outcome: Outcome label, e.g. "success" or "error"
+            input_chars: Input length used to pick the size bucket
+        """
+        key = (outcome, size_bucket(input_chars, self.size_buckets))
+        now = self._clock()
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _Series(self.bounds, self.windows[-1], self.slice_seconds)
+                self._series[key] = series
+            series.total.observe(seconds)
+            series.rolling.observe(seconds, now)
+
+    def _matching(
+        self,
+        window: Optional[int],
+        outcome: Optional[str],
+        input_size: Optional[str],
+        now: float
+    ) -> Iterable[Tuple[Tuple[str, str], LatencyHistogram]]:
+        for key, series in sorted(self._series.items()):
+            if outcome is not None and key[0] != outcome:
+                continue
+            if input_size is not None and key[1] != input_size:
+                continue
+            if window is None:
+                yield key, series.total
+            else:
+                yield key, series.rolling.window(window, now)
+
+    def percentiles(
+        self,
+        window: Optional[int] = None,
+        outcome: Optional[str] = None,
+        input_size: Optional[str] = None
+    ) -> LatencySummary:
+        """
+        Percentiles across the matching series.
+
+        Args:
+            window: Rolling window in seconds, or None for all time
+            outcome: Only include this outcome
+            input_size: Only include this size bucket label
+
+        Returns:
+            LatencySummary of the merged observations
+        """
+        merged = LatencyHistogram(self.bounds)
+        now = self._clock()
+        with self._lock:
+            for _, histogram in self._matching(window, outcome, input_size, now):
+                merged.merge(histogram)
+        return merged.summary()
+
+    def breakdown(self, window: Optional[int] = None) -> Dict[str, Dict[str, LatencySummary]]:
+        """
+        Percentiles per outcome and size bucket.
+
+        Args:
+            window: Rolling window in seconds, or None for all time
+
+        Returns:
+            Mapping of outcome to size bucket label to LatencySummary
+        """
+        now = self._clock()
+        result: Dict[str, Dict[str, LatencySummary]] = {}
+        with self._lock:
+            for (outcome, size), histogram in self._matching(window, None, None, now):
+                if histogram.count:
+                    result.setdefault(outcome, {})[size] = histogram.summary()
+        return result
+
+    def render_prometheus(self, name: str) -> List[str]:
+        """
+        Render the recorder in Prometheus text exposition format.
+
+        The all-time histograms are exported as a histogram metric, the
+        rolling-window percentiles as a summary labelled by window, and
+        the rolling-window maximum as a gauge.
+
+        Args:
+            name: Metric name, e.g. "summarizer_request_duration_seconds"
+
+        Returns:
+            Exposition lines, without a trailing newline
+        """
+        lines = [
+            f"# HELP {name} Summarization request latency.",
+            f"# TYPE {name} histogram",
+        ]
+        bucket_labels = [_format_float(bound) for bound in self.bounds] + ["+Inf"]
+        now = self._clock()
+        with self._lock:
+            series = sorted(self._series.items())
+            for (outcome, size), entry in series:
+                labels = f'outcome="{_escape(outcome)}",input_size="{size}"'
+                cumulative = 0
+                for le, count in zip(bucket_labels, entry.total.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {_format_float(entry.total.sum)}")
+                lines.append(f"{name}_count{{{labels}}} {entry.total.count}")
+
+            windowed = f"{name}_window"
+            maximum: List[str] = []
+            lines.append(f"# HELP {windowed} Latency percentiles over rolling windows.")
+            lines.append(f"# TYPE {windowed} summary")
+            for (outcome, size), entry in series:
+                labels = f'outcome="{_escape(outcome)}",input_size="{size}"'
+                for window in self.windows:
+                    histogram = entry.rolling.window(window, now)
+                    if not histogram.count:
+                        continue
+                    window_labels = f'{labels},window="{_window_label(window)}"'
+                    for q in QUANTILES:
+                        lines.append(
+                            f'{windowed}{{{window_labels},quantile="{q}"}} '
+                            f"{_format_float(histogram.quantile(q))}"
+                        )
+                    lines.append(
+                        f"{windowed}_sum{{{window_labels}}} {_format_float(histogram.sum)}"
+                    )
+                    lines.append(f"{windowed}_count{{{window_labels}}} {histogram.count}")
+                    maximum.append(
+                        f"{name}_window_max{{{window_labels}}} {_format_float(histogram.max)}"
+                    )
+            lines.append(f"# HELP {name}_window_max Slowest request in each rolling window.")
+            lines.append(f"# TYPE {name}_window_max gauge")
+            lines.extend(maximum)
+        return lines
+
+
+def _format_float(value: float) -> str:
+    return repr(round(value, 6))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,544 @@
+"""
+HTTP Server - JSON API for summarization, health and metrics.
+
+Usage:
+    python -m src.ai_summarizer.server --host 0.0.0.0 --port 8000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from dataclasses import asdict
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .core.scheduling import BATCH, INTERACTIVE, PRIORITIES, WorkContext, carry_work, work_context
+from .health import HealthChecker, health_checker
+from .utils.validators import normalize_text
+
+if TYPE_CHECKING:
+    from .core.summarizer import SummarizerService, SummaryResult
+
+logger = logging.getLogger(__name__)
+
+MAX_REQUEST_LINE = 8192
+MAX_HEADERS = 100
+MAX_TENANT_LENGTH = 128
+
+# Worst-case UTF-8 bytes per character of JSON-encoded text, plus room for
+# the other fields of a request body
+_BYTES_PER_CHAR = 4
+_BODY_OVERHEAD = 1024
+
+
+class HttpError(Exception):
+    """An error answered with a JSON body and the given status."""
+
+    def __init__(self, status: int, message: str, close: bool = False):
+        self.status = status
+        self.message = message
+        self.close = close
+        super().__init__(message)
+
+
+class Request:
+    """A parsed HTTP request."""
+
+    def __init__(
+        self,
+        method: str,
+        target: str,
+        version: str,
+        headers: Dict[str, str],
+        body: bytes = b""
+    ):
+        self.method = method
+        split = urlsplit(target)
+        self.path = split.path
+        self.query = parse_qs(split.query)
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        """Whether the client wants the connection kept open."""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self) -> Any:
+        """Decode the body as a JSON object."""
+        try:
+            payload = json.loads(self.body)
+        except ValueError as e:
+            raise HttpError(400, f"Invalid JSON: {e}") from e
+        if not isinstance(payload, dict):
+            raise HttpError(400, "Request body must be a JSON object")
+        return payload
+
+
+class SummaryServer:
+    """
+    Asyncio HTTP/1.1 server in front of a SummarizerService.
+
+    Routes:
+        POST /summarize        {"text", "max_length"?, "min_length"?, "priority"?}
+        POST /summarize/batch  {"texts": [...], "max_length"?, "min_length"?, "priority"?}
+        GET  /health           Health status as JSON
+        GET  /metrics          Prometheus text, or JSON with ?format=json
+
+    Bodies larger than the text limit allows are refused before they are
+    read, and summarize requests beyond ``max_concurrency`` are answered
+    with 503 instead of queueing without bound. Single texts default to
+    the interactive priority class and batches to the batch class; the
+    X-Tenant header names the tenant they are queued under.
+    """
+
+    def __init__(
+        self,
+        service: "SummarizerService",
+        health: Optional[HealthChecker] = None,
+        min_text_length: int = 50,
+        max_text_length: int = 50000,
+        max_concurrency: int = 64,
+        max_batch_size: int = 32,
+        request_timeout: Optional[float] = None,
+        keep_alive_timeout: float = 5.0,
+        read_timeout: float = 10.0
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            service: Service that performs the summarization
+            health: Health checker fed with request outcomes; defaults to
+                the package's shared checker
+            min_text_length: Shortest text accepted, in characters
+            max_text_length: Longest text accepted, in characters; also
+                bounds the request body size
+            max_concurrency: Summarize requests handled at once
+            max_batch_size: Most texts accepted by /summarize/batch
+            request_timeout: Seconds allowed per summarize call
+            keep_alive_timeout: Seconds an idle connection is kept open
+            read_timeout: Seconds allowed to receive a request's headers
+                and body once its request line has arrived
+        """
+        self.service = service
+        self.health = health or health_checker
+        self.min_text_length = min_text_length
+        self.max_text_length = max_text_length
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.request_timeout = request_timeout
+        self.keep_alive_timeout = keep_alive_timeout
+        self.read_timeout = read_timeout
+        self.max_body_bytes = max_text_length * _BYTES_PER_CHAR + _BODY_OVERHEAD
+        self._active = 0
+        self._rejected = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes = {
+            ("POST", "/summarize"): self._summarize,
+            ("POST", "/summarize/batch"): self._summarize_batch,
+            ("GET", "/health"): self._health,
+            ("GET", "/metrics"): self._metrics,
+        }
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """
+        Start listening.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind; 0 picks a free one
+        """
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_REQUEST_LINE
+        )
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host and port the server is bound to."""
+        assert self._server is not None, "Server not started"
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        assert self._server is not None, "Server not started"
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections and release the service's clients."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.service.aclose()
+
+    def _body_limit(self, path: str) -> int:
+        if path == "/summarize/batch":
+            return self.max_body_bytes * self.max_batch_size
+        return self.max_body_bytes
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        """Read one request; None when the client closed an idle connection."""
+        try:
+            line = await asyncio.wait_for(reader.readline(), self.keep_alive_timeout)
+        except asyncio.TimeoutError:
+            return None
+        except (ValueError, asyncio.LimitOverrunError):
+            raise HttpError(414, "Request line too long", close=True)
+        if not line:
+            return None
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            raise HttpError(400, "Malformed request line", close=True)
+        method, target, version = parts
+        request = Request(method, target, version, {})
+        try:
+            await asyncio.wait_for(self._read_message(reader, request), self.read_timeout)
+        except asyncio.TimeoutError:
+            raise HttpError(408, "Request timed out", close=True)
+        return request
+
+    async def _read_message(self, reader: asyncio.StreamReader, request: Request) -> None:
+        """Read the headers and body that follow a request line."""
+        headers = request.headers
+        for _ in range(MAX_HEADERS + 1):
+            try:
+                line = await reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                raise HttpError(431, "Header line too long", close=True)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HttpError(431, "Too many headers", close=True)
+
+        if "transfer-encoding" in headers:
+            raise HttpError(501, "Chunked request bodies are not supported", close=True)
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "Invalid Content-Length", close=True)
+        if length < 0:
+            raise HttpError(400, "Invalid Content-Length", close=True)
+        if length > self._body_limit(request.path):
+            raise HttpError(413, "Request body too large", close=True)
+        if length:
+            request.body = await reader.readexactly(length)
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests on one keep-alive connection."""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    keep_alive = request.keep_alive
+                    status, body, content_type, headers = await self._dispatch(request)
+                except HttpError as e:
+                    keep_alive = not e.close
+                    status, body, content_type, headers = _error(e)
+                writer.write(_response(status, body, content_type, keep_alive, headers))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _dispatch(self, request: Request) -> Tuple[int, bytes, str, Dict[str, str]]:
+        """Route a request to its handler."""
+        handler = self._routes.get((request.method, request.path))
+        if handler is None:
+            if any(path == request.path for _, path in self._routes):
+                raise HttpError(405, f"Method {request.method} not allowed")
+            raise HttpError(404, f"No route for {request.path}")
+        try:
+            return await handler(request)
+        except HttpError:
+            raise
+        except Exception:
+            logger.exception("Unhandled error serving %s %s", request.method, request.path)
+            raise HttpError(500, "Internal server error")
+
+    def _admit(self) -> None:
+        """Take a summarize slot or shed the request."""
+        if self._active >= self.max_concurrency:
+            self._rejected += 1
+            raise HttpError(503, "Server busy, retry later")
+        self._active += 1
+
+    def _work(
+        self,
+        request: Request,
+        payload: Dict[str, Any],
+        default: str
+    ) -> ContextManager[WorkContext]:
+        """Schedule a request by its "priority" field and X-Tenant header."""
+        priority = payload.get("priority", default)
+        if priority not in PRIORITIES:
+            raise HttpError(400, f'Field "priority" must be one of {", ".join(PRIORITIES)}')
+        tenant = request.headers.get("x-tenant") or None
+        if tenant is not None and len(tenant) > MAX_TENANT_LENGTH:
+            raise HttpError(400, "X-Tenant header too long")
+        return work_context(priority, tenant, self.request_timeout)
+
+    def _lengths(self, payload: Dict[str, Any]) -> Tuple[int, int]:
+        max_length = payload.get("max_length", 150)
+        min_length = payload.get("min_length", 30)
+        if not all(
+            isinstance(n, int) and not isinstance(n, bool) for n in (max_length, min_length)
+        ):
+            raise HttpError(400, "max_length and min_length must be integers")
+        if not 0 < min_length <= max_length:
+            raise HttpError(400, "Require 0 < min_length <= max_length")
+        return max_length, min_length
+
+    async def _summarize(self, request: Request) -> Tuple[int, bytes, str, Dict[str, str]]:
+        payload = request.json()
+        text = payload.get("text")
+        if not isinstance(text, str):
+            raise HttpError(400, 'Field "text" must be a string')
+        max_length, min_length = self._lengths(payload)
+        work = self._work(request, payload, INTERACTIVE)
+        normalized = normalize_text(text, self.min_text_length, self.max_text_length)
+        if not normalized.is_valid:
+            raise HttpError(422, normalized.error or "Invalid text")
+
+        self._admit()
+        started = time.perf_counter()
+        try:
+            with work:
+                result = await self.service.asummarize(
+                    normalized.text, max_length, min_length, deadline=self.request_timeout
+                )
+        finally:
+            self._active -= 1
+        self._record(result, time.perf_counter() - started, len(normalized.text))
+
+        if result.success:
+            status = 200
+        elif result.error == "Deadline exceeded":
+            status = 504
+        else:
+            status = 502
+        return _json(status, _result_dict(result))
+
+    async def _summarize_batch(
+        self,
+        request: Request
+    ) -> Tuple[int, bytes, str, Dict[str, str]]:
+        payload = request.json()
+        texts = payload.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise HttpError(400, 'Field "texts" must be a list of strings')
+        if len(texts) > self.max_batch_size:
+            raise HttpError(413, f"At most {self.max_batch_size} texts per batch")
+        max_length, min_length = self._lengths(payload)
+        work = self._work(request, payload, BATCH)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        valid: List[int] = []
+        normalized = [
+            normalize_text(text, self.min_text_length, self.max_text_length)
+            for text in texts
+        ]
+        for index, item in enumerate(normalized):
+            if item.is_valid:
+                valid.append(index)
+            else:
+                results[index] = {"success": False, "error": item.error}
+
+        if valid:
+            self._admit()
+            started = time.perf_counter()
+            try:
+                # summarize_many packs texts into shared upstream requests
+                loop = asyncio.get_running_loop()
+                with work:
+                    summarize_many = carry_work(self.service.summarize_many)
+                summaries = await loop.run_in_executor(None, partial(
+                    summarize_many,
+                    [normalized[i].text for i in valid],
+                    max_length,
+                    min_length
+                ))
+            finally:
+                self._active -= 1
+            elapsed = time.perf_counter() - started
+            for index, result in zip(valid, summaries):
+                self._record(result, elapsed, len(normalized[index].text))
+                results[index] = _result_dict(result)
+        return _json(200, {"results": results})
+
+    async def _health(self, request: Request) -> Tuple[int, bytes, str, Dict[str, str]]:
+        status = self.health.check_health()
+        # Take an instance out of rotation only while requests fail fast
+        return _json(503 if status.status == "unhealthy" else 200, asdict(status))
+
+    async def _metrics(self, request: Request) -> Tuple[int, bytes, str, Dict[str, str]]:
+        if request.query.get("format") == ["json"]:
+            metrics = self.health.get_metrics()
+            metrics["server"] = {"active": self._active, "rejected": self._rejected}
+            if self.service.endpoints is not None:
+                metrics["endpoints"] = [asdict(s) for s in self.service.endpoints.stats]
+            if self.service.scheduler is not None:
+                metrics["scheduler"] = [asdict(s) for s in self.service.scheduler.stats]
+            return _json(200, metrics)
+        prefix = f"{self.health.METRIC_PREFIX}_server"
+        body = self.health.export_prometheus() + "".join(
+            f"# HELP {prefix}_{name} {help_text}\n"
+            f"# TYPE {prefix}_{name} {kind}\n"
+            f"{prefix}_{name} {value}\n"
+            for name, kind, help_text, value in (
+                ("active_requests", "gauge", "Summarize requests in progress.", self._active),
+                ("rejected_total", "counter", "Requests shed with 503.", self._rejected),
+            )
+        )
+        for source in (self.service.endpoints, self.service.scheduler):
+            if source is not None:
+                lines = source.render_prometheus(self.health.METRIC_PREFIX)
+                body += "\n".join(lines) + "\n"
+        return 200, body.encode(), "text/plain; version=0.0.4", {}
+
+    def _record(self, result: "SummaryResult", latency: float, input_chars: int) -> None:
+        if result.success:
+            self.health.record_request(latency, input_chars)
+        else:
+            self.health.record_error(latency, input_chars)
+
+
+def _result_dict(result: "SummaryResult") -> Dict[str, Any]:
+    data = asdict(result)
+    data["word_reduction_percent"] = result.word_reduction_percent
+    return data
+
+
+def _json(status: int, payload: Any) -> Tuple[int, bytes, str, Dict[str, str]]:
+    return status, json.dumps(payload).encode(), "application/json", {}
+
+
+def _error(error: HttpError) -> Tuple[int, bytes, str, Dict[str, str]]:
+    status, body, content_type, headers = _json(
+        error.status, {"success": False, "error": error.message}
+    )
+    if error.status == 503:
+        headers = {"Retry-After": "1"}
+    return status, body, content_type, headers
+
+
+def _response(
+    status: int,
+    body: bytes,
+    content_type: str,
+    keep_alive: bool,
+    headers: Dict[str, str]
+) -> bytes:
+    """Serialize a complete HTTP/1.1 response."""
+    head = [
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    head.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def serve(server: SummaryServer, host: str, port: int) -> None:
+    """Run a server until cancelled, then close it."""
+    await server.start(host, port)
+    bound_host, bound_port = server.address
+    logger.info("Serving on http://%s:%s", bound_host, bound_port)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Serve the summarizer over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--request-timeout", type=float, default=None)
+    parser.add_argument(
+        "--fallback",
+        action="store_true",
+        help="Use the extractive engine when the API fails"
+    )
+    args = parser.parse_args(argv)
+
+    from .config import get_settings
+    from .core.breaker import CircuitBreaker
+    from .core.cache import SummaryCache
+    from .core.codec import WireCodec
+    from .core.hedging import Hedger
+    from .core.routing import EndpointPool
+    from .core.scheduling import PriorityScheduler
+    from .core.summarizer import SummarizerService
+
+    settings = get_settings()
+    if not settings.is_configured and not args.fallback:
+        print("HUGGINGFACE_API_KEY is not set", file=sys.stderr)
+        return 2
+    logging.basicConfig(level=logging.INFO)
+
+    breaker = None
+    if settings.circuit_failure_threshold:
+        breaker = CircuitBreaker(
+            settings.circuit_failure_threshold, settings.circuit_reset_seconds
+        )
+    service = SummarizerService(
+        api_key=settings.huggingface_api_key,
+        api_url=settings.api_url,
+        timeout=settings.api_timeout,
+        cache=SummaryCache(),
+        endpoints=EndpointPool(settings.api_urls) if settings.api_urls else None,
+        hedger=Hedger(max_fraction=settings.hedge_fraction) if settings.hedge_fraction else None,
+        max_concurrency=args.max_concurrency,
+        fallback=args.fallback,
+        breaker=breaker,
+        codec=WireCodec(compression=settings.request_compression or None),
+        scheduler=PriorityScheduler(tenant_weights=dict(settings.tenant_weights))
+    )
+    server = SummaryServer(
+        service,
+        health=HealthChecker(settings.app_version, breaker=breaker),
+        min_text_length=settings.min_text_length,
+        max_text_length=settings.max_text_length,
+        max_concurrency=args.max_concurrency,
+        max_batch_size=args.max_batch_size,
+        request_timeout=args.request_timeout
+    )
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
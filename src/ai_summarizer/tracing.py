@@ -0,0 +1,341 @@
+"""
+Tracing Module - Lightweight per-stage spans with pluggable exporters.
+"""
+
+import functools
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current_span: "ContextVar[Optional[Span]]" = ContextVar(
+    "ai_summarizer_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """One timed stage of a request."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = 0.0
+    duration: float = 0.0
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes to the span."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the span to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+class _NoopSpan:
+    """Stand-in span handed out while tracing is disabled."""
+
+    trace_id = None
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+class _NoopContext:
+    """Reusable context manager that records nothing."""
+
+    def __enter__(self) -> _NoopSpan:
+        return _NOOP_SPAN
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+_NOOP_CONTEXT = _NoopContext()
+
+
+class _SpanContext:
+    """Times a span and makes it current for the duration of a block."""
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        self._span = Span(
+            name=self._name,
+            trace_id=parent.trace_id if parent is not None else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent is not None else None,
+            start_time=time.time(),
+            attributes=self._attributes
+        )
+        self._token = _current_span.set(self._span)
+        self._started = time.perf_counter()
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self._span.duration = time.perf_counter() - self._started
+        if exc_type is not None:
+            self._span.error = exc_type.__name__
+        _current_span.reset(self._token)
+        self._tracer._export(self._span)
+
+
+class SpanExporter:
+    """Base class for span destinations."""
+
+    def export(self, span: Span) -> None:
+        """Receive a finished span."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the exporter."""
+
+
+class RingBufferExporter(SpanExporter):
+    """Keep the most recent spans in memory."""
+
+    def __init__(self, capacity: int = 1024):
+        self._spans: Deque[Span] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """
+        Return buffered spans, oldest first.
+
+        Args:
+            trace_id: Only return spans of this trace
+
+        Returns:
+            List of spans
+        """
+        with self._lock:
+            return [s for s in self._spans if trace_id is None or s.trace_id == trace_id]
+
+    def clear(self) -> None:
+        """Drop all buffered spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    """Append each span as one JSON object per line to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class SlowRequestLog(SpanExporter):
+    """
+    Log a per-stage breakdown of requests slower than a threshold.
+
+    Child spans are held until their root span finishes; a sampled
+    fraction of slow roots is logged with the time spent in each stage.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float = 1.0,
+        sample_rate: float = 1.0,
+        logger: Optional[logging.Logger] = None,
+        max_pending: int = 1024,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize the slow request log.
+
+        Args:
+            threshold_seconds: Root spans at least this long are slow
+            sample_rate: Fraction of slow requests to log
+            logger: Destination logger; defaults to "ai_summarizer.slow"
+            max_pending: Most traces buffered while awaiting their root
+            rng: Random source for sampling
+        """
+        self.threshold_seconds = threshold_seconds
+        self.sample_rate = sample_rate
+        self.logger = logger or logging.getLogger("ai_summarizer.slow")
+        self.max_pending = max_pending
+        self._rng = rng or random.Random()
+        self._pending: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            if span.parent_id is not None:
+                children = self._pending.get(span.trace_id)
+                if children is None:
+                    if len(self._pending) >= self.max_pending:
+                        self._pending.popitem(last=False)
+                    children = self._pending[span.trace_id] = []
+                children.append(span)
+                return
+            children = self._pending.pop(span.trace_id, [])
+
+        if span.duration < self.threshold_seconds:
+            return
+        if self._rng.random() >= self.sample_rate:
+            return
+
+        stages: Dict[str, float] = {}
+        for child in children:
+            stages[child.name] = stages.get(child.name, 0.0) + child.duration
+        breakdown = " ".join(f"{name}={seconds:.3f}s" for name, seconds in stages.items())
+        self.logger.warning(
+            "Slow request %s %.3fs trace=%s %s",
+            span.name, span.duration, span.trace_id, breakdown,
+            extra={
+                "trace_id": span.trace_id,
+                "latency_seconds": span.duration,
+                "stages": stages,
+                "attributes": span.attributes
+            }
+        )
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to the exporters.
+
+    With no exporters the tracer is disabled and span() returns a shared
+    no-op context manager, so instrumented code pays for one attribute
+    check and an empty with-block.
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None):
+        self._exporters: List[SpanExporter] = list(exporters or [])
+        self.enabled = bool(self._exporters)
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        """Start sending spans to an exporter."""
+        self._exporters = [*self._exporters, exporter]
+        self.enabled = True
+
+    def clear_exporters(self) -> None:
+        """Close and remove all exporters, disabling the tracer."""
+        exporters, self._exporters = self._exporters, []
+        self.enabled = False
+        for exporter in exporters:
+            exporter.close()
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        """
+        Time a block as a span, nested under the current span if any.
+
+        Args:
+            name: Stage name
+            **attributes: Attributes recorded on the span
+
+        Returns:
+            Context manager yielding the Span
+        """
+        if not self.enabled:
+            return _NOOP_CONTEXT
+        return _SpanContext(self, name, attributes)
+
+    @staticmethod
+    def current_trace_id() -> Optional[str]:
+        """Trace ID of the current span, or None outside a trace."""
+        span = _current_span.get()
+        return span.trace_id if span is not None else None
+
+    def wrap(self, fn: F) -> F:
+        """
+        Carry the current span into calls made on worker threads.
+
+        Args:
+            fn: Function to be run by a thread pool
+
+        Returns:
+            fn itself when disabled, else a wrapper that restores the
+            caller's span around each call
+        """
+        if not self.enabled:
+            return fn
+        parent = _current_span.get()
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _current_span.set(parent)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _current_span.reset(token)
+
+        return wrapper  # type: ignore[return-value]
+
+    def _export(self, span: Span) -> None:
+        for exporter in self._exporters:
+            try:
+                exporter.export(span)
+            except Exception:
+                logging.getLogger(__name__).exception("Span exporter failed")
+
+
+_default_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Return the tracer shared by the package.
+
+    Returns:
+        The process-wide Tracer, disabled until an exporter is added
+    """
+    return _default_tracer
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """
+    Record calls to a function as spans of the shared tracer.
+
+    Args:
+        name: Stage name
+
+    Returns:
+        Decorator that calls straight through while tracing is disabled
+    """
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _default_tracer.enabled:
+                return fn(*args, **kwargs)
+            with _SpanContext(_default_tracer, name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
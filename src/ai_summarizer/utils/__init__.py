@@ -2,14 +2,25 @@
 Utilities module - Helper functions and validators.
 """
 
-from .helpers import count_words, count_characters, estimate_reading_time, truncate_text
-from .validators import validate_text, ValidationResult
+from .helpers import (
+    TextStats,
+    count_characters,
+    count_words,
+    estimate_reading_time,
+    text_stats,
+    truncate_text,
+)
+from .validators import NormalizedText, normalize_text, validate_text, ValidationResult
 
 __all__ = [
     "count_words",
     "count_characters", 
     "estimate_reading_time",
     "truncate_text",
+    "text_stats",
+    "TextStats",
     "validate_text",
     "ValidationResult",
+    "normalize_text",
+    "NormalizedText",
 ]
@@ -2,8 +2,14 @@
 Helper Functions - Utility functions for text processing.
 """
 
-import re
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Optional
+
+from ..tracing import traced
+
+_SENTENCE_TERMINATORS = (".", "!", "?")
 
 
 def count_words(text: str) -> int:
@@ -50,7 +56,20 @@ def estimate_reading_time(text: str, wpm: int = 200) -> str:
     Returns:
         Formatted reading time string
     """
-    word_count = count_words(text)
+    return format_reading_time(count_words(text), wpm)
+
+
+def format_reading_time(word_count: int, wpm: int = 200) -> str:
+    """
+    Format the reading time for a number of words.
+    
+    Args:
+        word_count: Number of words to read
+        wpm: Words per minute reading speed
+        
+    Returns:
+        Formatted reading time string
+    """
     minutes = word_count / wpm
     
     if minutes < 1:
@@ -61,6 +80,73 @@ def estimate_reading_time(text: str, wpm: int = 200) -> str:
         return f"~{int(minutes)} mins"
 
 
+@dataclass(frozen=True)
+class TextStats:
+    """Word, character, sentence and reading-time figures for a text."""
+    words: int
+    characters: int
+    characters_no_spaces: int
+    sentences: int
+    wpm: int = 200
+    
+    @property
+    def reading_time(self) -> str:
+        """Formatted reading time, as returned by estimate_reading_time."""
+        return format_reading_time(self.words, self.wpm)
+
+
+@lru_cache(maxsize=64)
+def text_stats(text: str, wpm: int = 200) -> TextStats:
+    """
+    Compute all statistics for a text in one pass.
+    
+    The text is split once; sentence ends are counted on the resulting
+    tokens rather than by rescanning the text. Results are memoized by
+    text, so Streamlit reruns over the same input cost a hash lookup.
+    
+    Args:
+        text: The text to analyze
+        wpm: Words per minute reading speed
+        
+    Returns:
+        TextStats for the text
+    """
+    if not text:
+        return TextStats(0, 0, 0, 0, wpm)
+    return stats_from_words(text.split(), len(text), len(text) - text.count(" "), wpm)
+
+
+def stats_from_words(
+    words: List[str],
+    characters: int,
+    characters_no_spaces: int,
+    wpm: int = 200
+) -> TextStats:
+    """
+    Build TextStats from a text that has already been split into words.
+    
+    Args:
+        words: Result of str.split() on the text
+        characters: Length of the text
+        characters_no_spaces: Length of the text without space characters
+        wpm: Words per minute reading speed
+        
+    Returns:
+        TextStats for the text
+    """
+    sentences = sum(map(str.endswith, words, repeat(_SENTENCE_TERMINATORS)))
+    if words and not words[-1].endswith(_SENTENCE_TERMINATORS):
+        sentences += 1
+    
+    return TextStats(
+        words=len(words),
+        characters=characters,
+        characters_no_spaces=characters_no_spaces,
+        sentences=sentences,
+        wpm=wpm
+    )
+
+
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """
     Truncate text to a maximum length with a suffix.
@@ -78,16 +164,18 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+@traced("sanitize_text")
 def sanitize_text(text: str) -> str:
     """
     Sanitize input text by normalizing whitespace.
     
+    Strips the text and collapses every whitespace run to one space, like
+    ``re.sub(r"\\s+", " ", text.strip())`` but in a single C-level pass.
+    
     Args:
         text: The text to sanitize
         
     Returns:
         Sanitized text
     """
-    text = text.strip()
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    return " ".join(text.split())
@@ -2,9 +2,19 @@
 Validators - Input validation functions.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
+from ..tracing import traced
+from .helpers import TextStats, stats_from_words
+
+_NORMALIZED_CACHE_SIZE = 64
+_normalized: "OrderedDict[str, NormalizedText]" = OrderedDict()
+_normalized_lock = threading.Lock()
+
 
 @dataclass
 class ValidationResult:
@@ -13,6 +23,7 @@ class ValidationResult:
     error: Optional[str] = None
 
 
+@traced("validate_text")
 def validate_text(
     text: str,
     min_length: int = 50,
@@ -52,6 +63,84 @@ def validate_text(
     return ValidationResult(is_valid=True)
 
 
+@dataclass(frozen=True)
+class NormalizedText:
+    """Whitespace-normalized text with its content hash and statistics."""
+    text: str
+    digest: str
+    stats: TextStats
+    error: Optional[str] = None
+    
+    @property
+    def is_valid(self) -> bool:
+        """Whether the text passed validation."""
+        return self.error is None
+
+
+def _normalize(text: str) -> NormalizedText:
+    """Collapse whitespace, hash and count a text, memoizing the result."""
+    with _normalized_lock:
+        hit = _normalized.get(text)
+        if hit is not None:
+            _normalized.move_to_end(text)
+            return hit
+    
+    words = text.split()
+    normalized = " ".join(words)
+    characters = len(normalized)
+    result = NormalizedText(
+        text=normalized,
+        digest=hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest(),
+        stats=stats_from_words(
+            words, characters, characters - max(len(words) - 1, 0)
+        )
+    )
+    
+    with _normalized_lock:
+        # Normalizing is idempotent, so the output is its own cache entry
+        # and a second pass over already-normalized text is a lookup
+        _normalized[text] = result
+        _normalized[normalized] = result
+        while len(_normalized) > _NORMALIZED_CACHE_SIZE:
+            _normalized.popitem(last=False)
+    return result
+
+
+@traced("normalize_text")
+def normalize_text(
+    text: str,
+    min_length: int = 1,
+    max_length: Optional[int] = None
+) -> NormalizedText:
+    """
+    Validate and normalize input text in a single pass.
+    
+    The text is split once: the words give the whitespace-collapsed text
+    (as sanitize_text returns it), its statistics and, through the joined
+    text, a blake2b content hash. Length bounds apply to the normalized
+    text, which is what gets summarized.
+    
+    Args:
+        text: The text to normalize
+        min_length: Minimum allowed length
+        max_length: Maximum allowed length, or None for no limit
+        
+    Returns:
+        NormalizedText, with error set if validation failed
+    """
+    normalized = _normalize(text or "")
+    length = normalized.stats.characters
+    if not length:
+        error: Optional[str] = "Please enter some text to summarize."
+    elif length < min_length:
+        error = f"Text is too short. Minimum {min_length} characters required."
+    elif max_length is not None and length > max_length:
+        error = f"Text is too long. Maximum {max_length} characters allowed."
+    else:
+        return normalized
+    return NormalizedText(normalized.text, normalized.digest, normalized.stats, error)
+
+
 def validate_api_key(api_key: str) -> ValidationResult:
     """
     Validate that an API key is configured.
@@ -3,12 +3,16 @@ Summarizer Module
 Handles text summarization using Hugging Face Inference API
 """
 
-import os
+import time
+from typing import Optional, Tuple
+
 import requests
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from logger import log_api_request, log_api_response, log_summarization
+from src.ai_summarizer.config import get_settings
+from src.ai_summarizer.core.breaker import CircuitBreaker
+from src.ai_summarizer.core.outcomes import ERROR, OK
+from src.ai_summarizer.core.transport import PooledTransport
 
 # Hugging Face API configuration
 API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
@@ -17,10 +21,25 @@ API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
 MIN_TEXT_LENGTH = 50  # Minimum characters
 MAX_TEXT_LENGTH = 50000  # Maximum characters
 
+# Shared keep-alive connection pool for every summarize_text call
+_transport = PooledTransport()
+
+
+def _make_breaker() -> Optional[CircuitBreaker]:
+    """Build the circuit breaker configured in settings, if enabled."""
+    settings = get_settings()
+    if not settings.circuit_failure_threshold:
+        return None
+    return CircuitBreaker(settings.circuit_failure_threshold, settings.circuit_reset_seconds)
+
+
+# Fails calls fast while the API is down instead of waiting out the timeout
+_breaker = _make_breaker()
+
 
 def get_api_key():
-    """Get the Hugging Face API key from environment variables."""
-    return os.getenv("HUGGINGFACE_API_KEY", "")
+    """Get the Hugging Face API key from the settings loaded at startup."""
+    return get_settings().huggingface_api_key
 
 
 def validate_input(text: str) -> dict:
@@ -73,6 +92,31 @@ def summarize_text(text: str, max_length: int = 150, min_length: int = 30) -> di
             "error": "API key not configured. Please set HUGGINGFACE_API_KEY in .env file."
         }
     
+    if _breaker is not None and not _breaker.allow():
+        return {
+            "success": False,
+            "error": "Service temporarily unavailable. Please try again later."
+        }
+    
+    try:
+        result, backend_failed = _request_summary(api_key, text, max_length, min_length)
+    except BaseException:
+        # Always report back, or a half-open trial slot is never returned
+        if _breaker is not None:
+            _breaker.record(ERROR)
+        raise
+    if _breaker is not None:
+        _breaker.record(ERROR if backend_failed else OK)
+    return result
+
+
+def _request_summary(
+    api_key: str,
+    text: str,
+    max_length: int,
+    min_length: int
+) -> Tuple[dict, bool]:
+    """Call the API; also return whether the failure implicates the backend."""
     headers = {
         "Authorization": f"Bearer {api_key}"
     }
@@ -87,7 +131,11 @@ def summarize_text(text: str, max_length: int = 150, min_length: int = 30) -> di
     }
     
     try:
-        response = requests.post(API_URL, headers=headers, json=payload, timeout=30)
+        log_api_request(API_URL)
+        started = time.perf_counter()
+        response = _transport.post(API_URL, headers=headers, json_body=payload, timeout=30)
+        latency = time.perf_counter() - started
+        log_api_response(response.status_code, latency, attempts=1)
         response.raise_for_status()
         
         result = response.json()
@@ -98,51 +146,59 @@ def summarize_text(text: str, max_length: int = 150, min_length: int = 30) -> di
                 return {
                     "success": False,
                     "error": "Model is loading. Please try again in a few seconds."
-                }
+                }, True
             return {
                 "success": False,
                 "error": result["error"]
-            }
+            }, False
         
         if isinstance(result, list) and len(result) > 0:
+            summary = result[0].get("summary_text", "")
+            log_summarization(len(text), len(summary), latency, cache_hit=False, attempts=1)
             return {
                 "success": True,
-                "summary": result[0].get("summary_text", "")
-            }
+                "summary": summary
+            }, False
         else:
             return {
                 "success": False,
                 "error": "Unexpected response format from API"
-            }
+            }, False
     
     except requests.exceptions.Timeout:
         return {
             "success": False,
             "error": "Request timed out. Please try again."
-        }
+        }, True
     except requests.exceptions.ConnectionError:
         return {
             "success": False,
             "error": "Connection failed. Please check your internet connection."
-        }
+        }, True
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 401:
             return {
                 "success": False,
                 "error": "Invalid API key. Please check your HUGGINGFACE_API_KEY."
-            }
+            }, False
         elif e.response.status_code == 503:
             return {
                 "success": False,
                 "error": "Service temporarily unavailable. Please try again later."
-            }
+            }, True
         return {
             "success": False,
             "error": f"HTTP error: {str(e)}"
-        }
+        }, e.response.status_code >= 500
+    except ValueError:
+        # A 200 that is not JSON, such as an HTML page from a proxy
+        return {
+            "success": False,
+            "error": "Unexpected response format from API"
+        }, False
     except requests.exceptions.RequestException as e:
         return {
             "success": False,
             "error": f"API request failed: {str(e)}"
-        }
+        }, False
 
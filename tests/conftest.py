@@ -2,6 +2,13 @@
 Pytest configuration and fixtures.
 """
 
+import gzip
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from src.ai_summarizer.core.summarizer import SummarizerService
 from src.ai_summarizer.config.settings import Settings
@@ -37,3 +44,96 @@ def mock_settings():
 def summarizer_service():
     """Create a summarizer service with a test API key."""
     return SummarizerService(api_key="test_api_key")
+
+
+class StubInferenceHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the inference endpoint."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        status, headers, payload = self.server.responder(self, body)
+        if hasattr(payload, "__next__"):
+            self._stream(status, headers, payload)
+            return
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _stream(self, status, headers, events):
+        """Send each event as a server-sent event in its own chunk."""
+        self.send_response(status)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        for event in events:
+            data = event if isinstance(event, bytes) else f"data:{json.dumps(event)}\n\n".encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def default_responder(handler, body):
+    """Echo the first 20 characters of the input back as its summary."""
+    inputs = json.loads(body)["inputs"]
+    if isinstance(inputs, list):
+        return 200, {}, [{"summary_text": text[:20]} for text in inputs]
+    return 200, {}, [{"summary_text": inputs[:20]}]
+
+
+def sse_responder(tokens, delay=0.0):
+    """Build a responder that streams tokens like a text-generation server."""
+    def respond(handler, body):
+        def events():
+            for index, text in enumerate(tokens):
+                if delay:
+                    time.sleep(delay)
+                yield {"token": {"id": index, "text": text, "special": False}}
+            yield {
+                "token": {"id": len(tokens), "text": "</s>", "special": True},
+                "generated_text": "".join(tokens)
+            }
+        return 200, {}, events()
+    return respond
+
+
+def start_stub_server(responder=default_responder):
+    """Start a local inference stand-in on a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubInferenceHandler)
+    server.daemon_threads = True
+    server.responder = responder
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/models/test"
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    return server
+
+
+def stop_stub_server(server):
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    """Start a local inference stand-in; set .responder to customize it."""
+    server = start_stub_server()
+    yield server
+    stop_stub_server(server)
@@ -0,0 +1,96 @@
+"""
+Tests for the asyncio summarizer API.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+pytest.importorskip("httpx")
+
+
+class ConcurrencyTracker:
+    """Responder that records the peak number of concurrent requests."""
+    
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+    
+    def __call__(self, handler, body):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        inputs = json.loads(body)["inputs"]
+        return 200, {}, [{"summary_text": inputs[:20]}]
+
+
+class TestAsyncSummarize:
+    """Tests for SummarizerService.asummarize."""
+    
+    def test_matches_sync_result(self, stub_server, sample_text):
+        """Test that async and sync calls return identical results."""
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        
+        async def run():
+            async with service:
+                return await service.asummarize(sample_text)
+        
+        assert asyncio.run(run()) == service.summarize(sample_text)
+    
+    def test_missing_api_key(self):
+        """Test that a missing key fails without a request."""
+        result = asyncio.run(SummarizerService(api_key="").asummarize("text"))
+        assert result.success is False
+    
+    def test_error_status(self, stub_server, sample_text):
+        """Test that HTTP errors map to the same message as the sync API."""
+        stub_server.responder = lambda handler, body: (503, {}, {"error": "down"})
+        service = SummarizerService(
+            api_key="key",
+            api_url=stub_server.url,
+            retry_policy=RetryPolicy.disabled()
+        )
+        result = asyncio.run(service.asummarize(sample_text))
+        assert result.success is False
+        assert result.error.startswith("HTTP error: 503")
+    
+    def test_deadline_exceeded(self, stub_server, sample_text):
+        """Test that a call past its deadline fails fast."""
+        stub_server.responder = ConcurrencyTracker(delay=0.5)
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        started = time.perf_counter()
+        result = asyncio.run(service.asummarize(sample_text, deadline=0.1))
+        assert result.success is False
+        assert result.error == "Deadline exceeded"
+        assert time.perf_counter() - started < 0.5
+
+
+class TestAsyncSummarizeMany:
+    """Tests for SummarizerService.asummarize_many."""
+    
+    def test_bounded_concurrency(self, stub_server):
+        """Test that in-flight requests never exceed max_concurrency."""
+        tracker = ConcurrencyTracker()
+        stub_server.responder = tracker
+        service = SummarizerService(
+            api_key="key", api_url=stub_server.url, max_concurrency=3
+        )
+        texts = [f"Document number {i} " * 5 for i in range(12)]
+        
+        async def run():
+            async with service:
+                return await service.asummarize_many(texts)
+        
+        results = asyncio.run(run())
+        assert [r.summary for r in results] == [t[:20] for t in texts]
+        assert 1 < tracker.peak <= 3
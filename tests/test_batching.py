@@ -0,0 +1,122 @@
+"""
+Tests for batched multi-document summarization.
+"""
+
+import json
+
+import pytest
+from src.ai_summarizer.core.batching import pack_batches
+from src.ai_summarizer.core.breaker import OPEN, CircuitBreaker
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+
+class TestPackBatches:
+    """Tests for pack_batches function."""
+    
+    def test_respects_batch_size(self):
+        """Test that batches hold at most batch_size documents."""
+        assert pack_batches([1] * 5, batch_size=2) == [[0, 1], [2, 3], [4]]
+    
+    def test_respects_token_budget(self):
+        """Test that batches stay within the token budget."""
+        assert pack_batches([4, 4, 4], batch_tokens=8) == [[0, 1], [2]]
+    
+    def test_oversized_document_alone(self):
+        """Test that a document over budget gets its own batch."""
+        assert pack_batches([1, 20, 1], batch_tokens=10) == [[0], [1], [2]]
+    
+    def test_empty_input(self):
+        """Test that no documents produce no batches."""
+        assert pack_batches([]) == []
+    
+    def test_invalid_budget(self):
+        """Test that non-positive budgets are rejected."""
+        with pytest.raises(ValueError):
+            pack_batches([1], batch_size=0)
+
+
+class TestSummarizeMany:
+    """Tests for SummarizerService.summarize_many."""
+    
+    def test_packs_into_few_requests(self, stub_server):
+        """Test that many texts are sent in few requests, in order."""
+        texts = [f"Document {i} has some content to summarize." for i in range(20)]
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        results = service.summarize_many(texts, batch_size=10)
+        
+        assert [r.summary for r in results] == [t[:20] for t in texts]
+        assert all(r.success for r in results)
+        assert service.transport.stats.requests == 2
+    
+    def test_empty_text_isolated(self, stub_server):
+        """Test that an empty document fails alone."""
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        results = service.summarize_many(["Some real text here.", "   "])
+        assert results[0].success is True
+        assert results[1].success is False
+    
+    def test_item_error_isolated(self, stub_server):
+        """Test that a per-item error does not fail its neighbours."""
+        def responder(handler, body):
+            inputs = json.loads(body)["inputs"]
+            return 200, {}, [
+                {"error": "bad input"} if "bad" in text else {"summary_text": "ok"}
+                for text in inputs
+            ]
+        
+        stub_server.responder = responder
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        results = service.summarize_many(["good one", "bad one", "good two"])
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "bad input"
+    
+    def test_rejected_batch_falls_back(self, stub_server):
+        """Test that a rejected batch is retried item by item."""
+        def responder(handler, body):
+            inputs = json.loads(body)["inputs"]
+            if isinstance(inputs, list):
+                return 400, {}, {"error": "batching unsupported"}
+            return 200, {}, [{"summary_text": inputs[:4]}]
+        
+        stub_server.responder = responder
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        results = service.summarize_many(["alpha text", "beta text"])
+        assert [r.summary for r in results] == ["alph", "beta"]
+        assert service.transport.stats.requests == 3
+    
+    def test_transient_batch_failure_retried(self, stub_server):
+        """Test that a 503 on a batch is retried as a batch."""
+        calls = []
+        
+        def responder(handler, body):
+            calls.append(json.loads(body)["inputs"])
+            if len(calls) == 1:
+                return 503, {}, {"error": "unavailable"}
+            return 200, {}, [{"summary_text": text[:4]} for text in calls[-1]]
+        
+        stub_server.responder = responder
+        service = SummarizerService(
+            api_key="key",
+            api_url=stub_server.url,
+            retry_policy=RetryPolicy(base_delay=0.01, jitter=0)
+        )
+        results = service.summarize_many(["alpha text", "beta text"])
+        assert [r.summary for r in results] == ["alph", "beta"]
+        assert [r.attempts for r in results] == [2, 2]
+        assert all(isinstance(inputs, list) for inputs in calls)
+    
+    def test_breaker_counts_batch_failures(self, stub_server):
+        """Test that a failed batch request is reported to the circuit breaker."""
+        stub_server.responder = lambda handler, body: (500, {}, {"error": "down"})
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        service = SummarizerService(
+            api_key="key",
+            api_url=stub_server.url,
+            retry_policy=RetryPolicy(max_retries=0),
+            breaker=breaker
+        )
+        results = service.summarize_many(["alpha text", "beta text"])
+        assert not any(r.success for r in results)
+        assert breaker.state == OPEN
+        assert service.transport.stats.requests == 1
@@ -0,0 +1,81 @@
+"""
+Tests for the hot path benchmark harness.
+"""
+
+import json
+import os
+
+import pytest
+from benchmarks.hotpaths import compare, main, make_input, run
+from benchmarks.imports import DEFAULT_BUDGETS, app_imports, measure
+
+
+def results(**cases):
+    return {"results": cases}
+
+
+class TestMakeInput:
+    """Tests for make_input function."""
+    
+    def test_exact_length(self):
+        """Test that inputs have the requested length for every kind."""
+        for kind in ("ascii", "unicode", "whitespace"):
+            assert len(make_input(kind, 5000)) == 5000
+
+
+class TestCompare:
+    """Tests for compare function."""
+    
+    def test_flags_slowdown_beyond_threshold(self):
+        """Test that only slowdowns past the threshold are reported."""
+        baseline = results(fast=100.0, slow=100.0)
+        current = results(fast=110.0, slow=200.0)
+        regressions = compare(baseline, current, threshold=0.25)
+        assert [case for case, *_ in regressions] == ["slow"]
+        assert regressions[0][3] == 1.0
+    
+    def test_ignores_new_cases(self):
+        """Test that cases missing from the baseline are skipped."""
+        assert compare(results(), results(new=1.0)) == []
+
+
+class TestRun:
+    """Tests for running the benchmark matrix."""
+    
+    def test_machine_readable_output(self, tmp_path):
+        """Test that results are written as JSON and compare cleanly."""
+        output = tmp_path / "results.json"
+        assert main([
+            "--function", "truncate_text", "--repeat", "1", "--output", str(output)
+        ]) == 0
+        data = json.loads(output.read_text())
+        assert data["unit"] == "ns_per_call"
+        assert "truncate_text[unicode-50000]" in data["results"]
+    
+    def test_regression_fails(self, tmp_path):
+        """Test that compare mode exits non-zero on a regression."""
+        baseline = run(["count_words"], repeat=1, min_time=0.001)
+        baseline["results"] = {case: ns / 10 for case, ns in baseline["results"].items()}
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps(baseline))
+        assert main([
+            "--function", "count_words", "--repeat", "1", "--compare", str(path)
+        ]) == 1
+
+
+class TestImportBenchmarks:
+    """Tests for the import time benchmark."""
+    
+    def test_app_imports_only(self):
+        """Test that only the app's import statements are extracted."""
+        code = app_imports()
+        assert "import streamlit as st" in code
+        assert "st.set_page_config" not in code
+    
+    @pytest.mark.skipif(
+        not os.getenv("RUN_BENCHMARKS"),
+        reason="wall-clock budget; set RUN_BENCHMARKS=1 or run make bench-import"
+    )
+    def test_package_within_budget(self):
+        """Test that the package target stays within its budget."""
+        assert measure("package", repeat=3) <= DEFAULT_BUDGETS["package"]
@@ -0,0 +1,204 @@
+"""
+Tests for the circuit breaker.
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+from src.ai_summarizer.core.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.ai_summarizer.core.outcomes import CANCELLED, ERROR, OK
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+TEXT = "The inference backend is down and every request keeps timing out."
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def tripped(failure_threshold=2, **kwargs):
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=failure_threshold, reset_timeout=10, clock=clock, **kwargs
+    )
+    for _ in range(failure_threshold):
+        assert breaker.allow()
+        breaker.record(ERROR)
+    return breaker, clock
+
+
+def unavailable(handler, body):
+    return 503, {}, {"error": "Service unavailable"}
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that only an unbroken run of failures opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        for outcome in (ERROR, OK, ERROR):
+            breaker.record(outcome)
+        assert breaker.state == CLOSED
+        breaker.record(ERROR)
+        assert breaker.state == OPEN
+
+    def test_open_rejects(self):
+        """Test that an open circuit rejects and counts requests."""
+        breaker, _ = tripped()
+        assert not breaker.allow()
+        stats = breaker.stats
+        assert (stats.rejected, stats.opened, stats.retry_after) == (1, 1, 10.0)
+
+    def test_half_open_limits_trials(self):
+        """Test that only half_open_max_calls trials run at once."""
+        breaker, clock = tripped(half_open_max_calls=2)
+        clock.now = 10.0
+        assert breaker.state == HALF_OPEN
+        assert [breaker.allow() for _ in range(3)] == [True, True, False]
+
+    def test_trial_success_closes(self):
+        """Test that enough trial successes close the circuit."""
+        breaker, clock = tripped(success_threshold=2)
+        clock.now = 10.0
+        for _ in range(2):
+            assert breaker.allow()
+            breaker.record(OK)
+        assert breaker.state == CLOSED
+
+    def test_trial_failure_reopens(self):
+        """Test that a failed trial opens the circuit for another period."""
+        breaker, clock = tripped()
+        clock.now = 10.0
+        assert breaker.allow()
+        breaker.record(ERROR)
+        assert breaker.state == OPEN
+        assert breaker.stats.retry_after == 10.0
+        assert breaker.stats.opened == 2
+
+    def test_cancelled_trial_frees_slot(self):
+        """Test that an abandoned trial lets another one through."""
+        breaker, clock = tripped()
+        clock.now = 10.0
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record(CANCELLED)
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+
+    def test_rejects_invalid_thresholds(self):
+        """Test that zero thresholds are refused."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+    def test_standalone_import(self):
+        """Test that the breaker does not pull in the endpoint pool."""
+        code = (
+            "import sys; import src.ai_summarizer.core.breaker;"
+            "assert 'src.ai_summarizer.core.routing' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestServiceBreaker:
+    """Tests for SummarizerService with a circuit breaker."""
+
+    def test_fails_fast_when_open(self, stub_server):
+        """Test that an open circuit skips the network entirely."""
+        calls = []
+
+        def respond(handler, body):
+            calls.append(body)
+            return unavailable(handler, body)
+
+        stub_server.responder = respond
+        breaker = CircuitBreaker(failure_threshold=2)
+        service = SummarizerService(
+            api_key="key",
+            api_url=stub_server.url,
+            retry_policy=RetryPolicy.disabled(),
+            breaker=breaker
+        )
+        with service:
+            for i in range(2):
+                assert not service.summarize(f"{TEXT} {i}").success
+            started = time.perf_counter()
+            result = service.summarize(f"{TEXT} again")
+            elapsed = time.perf_counter() - started
+        assert len(calls) == 2
+        assert "unavailable" in result.error
+        assert elapsed < 0.05
+        assert breaker.stats.rejected == 1
+
+    def test_open_circuit_uses_fallback(self, stub_server):
+        """Test that rejected requests go to the extractive engine."""
+        breaker, _ = tripped()
+        service = SummarizerService(
+            api_key="key", api_url=stub_server.url, breaker=breaker, fallback=True
+        )
+        text = " ".join(f"Sentence {i} explains why fallbacks matter." for i in range(6))
+        result = service.summarize(text)
+        assert result.success
+        assert result.engine == "extractive"
+
+    def test_client_errors_do_not_trip(self, stub_server):
+        """Test that 4xx responses leave the circuit closed."""
+        stub_server.responder = lambda handler, body: (400, {}, {"error": "bad input"})
+        breaker = CircuitBreaker(failure_threshold=1)
+        service = SummarizerService(api_key="key", api_url=stub_server.url, breaker=breaker)
+        assert not service.summarize(TEXT).success
+        assert breaker.state == CLOSED
+
+    def test_trial_request_closes_circuit(self, stub_server):
+        """Test that a successful trial restores normal traffic."""
+        breaker, clock = tripped()
+        clock.now = 10.0
+        service = SummarizerService(api_key="key", api_url=stub_server.url, breaker=breaker)
+        assert service.summarize(TEXT).success
+        assert breaker.state == CLOSED
+
+    def test_async_fails_fast(self, stub_server):
+        """Test that asummarize also short-circuits."""
+        pytest.importorskip("httpx")
+        breaker, _ = tripped()
+
+        async def run():
+            async with SummarizerService(
+                api_key="key", api_url=stub_server.url, breaker=breaker
+            ) as service:
+                return await service.asummarize(TEXT)
+
+        assert not asyncio.run(run()).success
+        assert breaker.stats.rejected == 1
+
+
+class TestLegacySummarizeText:
+    """Tests for the breaker in the root summarizer module."""
+
+    def test_exception_during_trial_reopens(self, monkeypatch):
+        """Test that a trial request that raises still returns its slot."""
+        import summarizer
+
+        def broken(*args):
+            raise RuntimeError("unexpected")
+
+        breaker, clock = tripped()
+        monkeypatch.setattr(summarizer, "_breaker", breaker)
+        monkeypatch.setattr(summarizer, "get_api_key", lambda: "key")
+        monkeypatch.setattr(summarizer, "_request_summary", broken)
+        clock.now = 10.0
+        with pytest.raises(RuntimeError):
+            summarizer.summarize_text(TEXT)
+        assert breaker.state == OPEN
+        clock.now = 20.0
+        assert breaker.allow()
@@ -0,0 +1,104 @@
+"""
+Tests for the summary cache.
+"""
+
+import pytest
+from src.ai_summarizer.core.cache import SummaryCache, make_cache_key
+from src.ai_summarizer.core.summarizer import SummaryResult
+
+URL = "https://example.test/model"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_result(summary="A short summary."):
+    return SummaryResult(success=True, summary=summary)
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key function."""
+    
+    def test_whitespace_differences_match(self):
+        """Test that whitespace-only differences share a key."""
+        first = make_cache_key("Hello   world\n\n", 150, 30, URL)
+        second = make_cache_key("  Hello world", 150, 30, URL)
+        assert first == second
+    
+    def test_parameters_change_key(self):
+        """Test that every generation setting is part of the key."""
+        base = make_cache_key("Hello world", 150, 30, URL)
+        assert base != make_cache_key("Hello world", 100, 30, URL)
+        assert base != make_cache_key("Hello world", 150, 20, URL)
+        assert base != make_cache_key("Hello world", 150, 30, URL + "2")
+        assert base != make_cache_key("Hello world", 150, 30, URL, {"do_sample": True})
+
+
+class TestSummaryCache:
+    """Tests for SummaryCache."""
+    
+    def test_hit_and_miss(self):
+        """Test that stored results are returned and marked cached."""
+        cache = SummaryCache()
+        assert cache.get("k") is None
+        cache.put("k", make_result())
+        result = cache.get("k")
+        assert result.summary == "A short summary."
+        assert result.cached is True
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+    
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        clock = FakeClock()
+        cache = SummaryCache(ttl_seconds=10, clock=clock)
+        cache.put("k", make_result())
+        clock.now = 11
+        assert cache.get("k") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+    
+    def test_byte_budget_evicts_lru(self):
+        """Test that the least recently used entry is evicted first."""
+        entry_size = SummaryCache._entry_size("a", make_result())
+        cache = SummaryCache(max_bytes=entry_size * 2)
+        cache.put("a", make_result())
+        cache.put("b", make_result())
+        cache.get("a")
+        cache.put("c", make_result())
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats.evictions == 1
+        assert cache.stats.current_bytes <= cache.max_bytes
+    
+    def test_oversized_entry_not_stored(self):
+        """Test that an entry larger than the budget is skipped."""
+        cache = SummaryCache(max_bytes=100)
+        cache.put("k", make_result("x" * 1000))
+        assert len(cache) == 0
+
+
+class TestServiceCaching:
+    """Tests for caching in SummarizerService."""
+    
+    def test_repeat_request_served_from_cache(self, stub_server, sample_text):
+        """Test that whitespace variants of a text hit one cache entry."""
+        from src.ai_summarizer.core.summarizer import SummarizerService
+        
+        service = SummarizerService(
+            api_key="key", api_url=stub_server.url, cache=SummaryCache()
+        )
+        first = service.summarize(sample_text)
+        second = service.summarize("  " + sample_text.replace(" ", "  "))
+        
+        assert first.cached is False
+        assert second.cached is True
+        assert second.summary == first.summary
+        assert service.transport.stats.requests == 1
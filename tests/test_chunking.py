@@ -0,0 +1,63 @@
+"""
+Tests for long-document chunking.
+"""
+
+import pytest
+from src.ai_summarizer.core.chunking import (
+    CHARS_PER_TOKEN,
+    estimate_tokens,
+    split_into_chunks,
+)
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens function."""
+    
+    def test_empty_text(self):
+        """Test that empty text has no tokens."""
+        assert estimate_tokens("") == 0
+    
+    def test_rounds_up(self):
+        """Test that partial tokens round up."""
+        assert estimate_tokens("a" * (CHARS_PER_TOKEN + 1)) == 2
+
+
+class TestSplitIntoChunks:
+    """Tests for split_into_chunks function."""
+    
+    def test_short_text_single_chunk(self):
+        """Test that text within budget stays in one chunk."""
+        assert split_into_chunks("One sentence. Two sentences.", 100) == [
+            "One sentence. Two sentences."
+        ]
+    
+    def test_chunks_respect_budget(self):
+        """Test that every chunk fits the character budget."""
+        text = " ".join(["This is a sentence about nothing."] * 200)
+        chunks = split_into_chunks(text, max_tokens=50)
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 50 * CHARS_PER_TOKEN for chunk in chunks)
+    
+    def test_splits_on_sentence_boundaries(self):
+        """Test that chunks end on sentence boundaries."""
+        text = " ".join(["This is a sentence about nothing."] * 200)
+        for chunk in split_into_chunks(text, max_tokens=50):
+            assert chunk.endswith(".")
+    
+    def test_keeps_paragraphs_together(self):
+        """Test that paragraphs that fit are not split."""
+        first = "First paragraph sentence one. Sentence two."
+        second = "Second paragraph here."
+        chunks = split_into_chunks(f"{first}\n\n{second}", max_tokens=12)
+        assert chunks == [first, second]
+    
+    def test_long_word_is_cut(self):
+        """Test that a word longer than the budget is hard-split."""
+        chunks = split_into_chunks("x" * 30, max_tokens=2)
+        assert all(len(chunk) <= 2 * CHARS_PER_TOKEN for chunk in chunks)
+        assert "".join(chunks) == "x" * 30
+    
+    def test_invalid_budget(self):
+        """Test that a non-positive budget is rejected."""
+        with pytest.raises(ValueError):
+            split_into_chunks("text", max_tokens=0)
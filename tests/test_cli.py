@@ -0,0 +1,324 @@
+"""
+Tests for the batch summarization command.
+"""
+
+import io
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from src.ai_summarizer.batch import (
+    BatchRunner,
+    BatchStats,
+    Document,
+    ProgressReporter,
+    RateLimiter,
+    count_documents,
+    iter_documents,
+    load_checkpoint,
+)
+from src.ai_summarizer.cli import main
+from src.ai_summarizer.config import Settings
+from src.ai_summarizer.core.concurrency import AdaptiveLimiter
+from src.ai_summarizer.core.scheduling import PriorityScheduler
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+TEXTS = [
+    "The first document talks about batch processing of large corpora.",
+    "The second document describes resumable jobs and checkpoint files.",
+    "The first document talks about batch processing of large corpora.",
+]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A JSONL corpus containing one duplicate document."""
+    path = tmp_path / "corpus.jsonl"
+    path.write_text("".join(
+        json.dumps({"id": f"doc-{i}", "text": text}) + "\n"
+        for i, text in enumerate(TEXTS)
+    ))
+    return path
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    """Settings with an API key, as the command reads them."""
+    monkeypatch.setattr(
+        "src.ai_summarizer.config.get_settings",
+        lambda: Settings(huggingface_api_key="test_api_key")
+    )
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestIterDocuments:
+    """Tests for input readers."""
+
+    def test_jsonl_objects_and_strings(self, tmp_path):
+        """Test that JSONL records may be objects or bare strings."""
+        path = tmp_path / "in.jsonl"
+        path.write_text('{"id": "a", "text": "one"}\n\n"two"\nnot json\n{"body": "x"}\n')
+        docs = list(iter_documents(str(path)))
+        assert [(d.id, d.text, d.error) for d in docs] == [
+            ("a", "one", None),
+            ("3", "two", None),
+            ("4", "", "Invalid JSON"),
+            ("5", "", "Missing field: text"),
+        ]
+
+    def test_csv_with_custom_fields(self, tmp_path):
+        """Test that CSV rows are read by column name."""
+        path = tmp_path / "in.csv"
+        path.write_text('key,body\nk1,"multi\nline"\n,plain\n')
+        docs = list(iter_documents(str(path), text_field="body", id_field="key"))
+        assert [(d.id, d.text) for d in docs] == [("k1", "multi\nline"), ("2", "plain")]
+        assert count_documents(str(path)) == 2
+
+    def test_directory_of_text_files(self, tmp_path):
+        """Test that text files are read recursively in sorted order."""
+        (tmp_path / "b.txt").write_text("second")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.md").write_text("nested")
+        (tmp_path / "a.txt").write_text("first")
+        (tmp_path / "skip.bin").write_text("ignored")
+        docs = list(iter_documents(str(tmp_path)))
+        assert [d.id for d in docs] == ["a.txt", "b.txt", "sub/a.md"]
+        assert count_documents(str(tmp_path)) == 3
+
+
+class TestLoadCheckpoint:
+    """Tests for load_checkpoint."""
+
+    def test_truncates_partial_line(self, tmp_path):
+        """Test that an interrupted final write is cut off."""
+        path = tmp_path / "out.jsonl"
+        path.write_text(
+            '{"id": "a", "success": true, "digest": "d1"}\n'
+            '{"id": "b", "success": false, "digest": "d2"}\n'
+            '{"id": "c", "succ'
+        )
+        done, finished = load_checkpoint(str(path))
+        assert done == {"a"}
+        assert list(finished) == ["d1"]
+        assert path.read_text().endswith('"d2"}\n')
+
+    def test_missing_file(self, tmp_path):
+        """Test that a fresh output starts with nothing done."""
+        assert load_checkpoint(str(tmp_path / "none.jsonl")) == (set(), {})
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_spaces_acquisitions(self):
+        """Test that acquisitions beyond the burst wait for tokens."""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+        waits = [limiter.acquire() for _ in range(4)]
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1)
+        assert clock.now == pytest.approx(0.2)
+
+    def test_disabled(self):
+        """Test that a zero rate never waits."""
+        assert RateLimiter(rate=0).acquire() == 0.0
+
+
+class TestProgressReporter:
+    """Tests for ProgressReporter."""
+
+    def test_line_has_throughput_and_eta(self):
+        """Test that the ETA follows from the observed rate."""
+        clock = FakeClock()
+        reporter = ProgressReporter(total=100, stream=io.StringIO(), clock=clock)
+        clock.now = 10.0
+        line = reporter.line(BatchStats(succeeded=20, skipped=30))
+        assert "50/100 (50.0%)" in line
+        assert "2.0 docs/s" in line
+        assert "ETA 0:00:25" in line
+
+
+class TestBatchRunner:
+    """Tests for BatchRunner."""
+
+    def test_duplicates_summarized_once(self, stub_server, corpus):
+        """Test that identical inputs are sent upstream only once."""
+        calls = []
+
+        def counting(handler, body):
+            inputs = json.loads(body)["inputs"]
+            inputs = inputs if isinstance(inputs, list) else [inputs]
+            calls.extend(inputs)
+            return 200, {}, [{"summary_text": "summary"} for _ in inputs]
+
+        stub_server.responder = counting
+        output = io.StringIO()
+        with SummarizerService(api_key="key", api_url=stub_server.url) as service:
+            stats = BatchRunner(service, workers=4).run(
+                iter_documents(str(corpus)), output
+            )
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert len(calls) == 2
+        assert stats.succeeded == 3
+        assert stats.duplicates == 1
+        duplicate = next(r for r in records if r["id"] == "doc-2")
+        assert duplicate["duplicate_of"] == "doc-0"
+        assert duplicate["summary"] == "summary"
+
+    def test_runs_at_batch_priority(self, stub_server, corpus):
+        """Test that worker-thread requests are scheduled in the batch class."""
+        scheduler = PriorityScheduler(AdaptiveLimiter())
+        service = SummarizerService(api_key="key", api_url=stub_server.url, scheduler=scheduler)
+        with service:
+            BatchRunner(service, workers=2, tenant="nightly").run(
+                iter_documents(str(corpus)), io.StringIO()
+            )
+        stats = {s.priority: s for s in scheduler.stats}
+        assert stats["batch"].dispatched == 1
+        assert stats["interactive"].dispatched == 0
+
+    def test_short_documents_batched(self, stub_server, tmp_path):
+        """Test that single-chunk documents share requests and long ones are chunked."""
+        bodies = []
+
+        def recording(handler, body):
+            inputs = json.loads(body)["inputs"]
+            bodies.append(inputs)
+            if isinstance(inputs, list):
+                return 200, {}, [{"summary_text": text[:20]} for text in inputs]
+            return 200, {}, [{"summary_text": inputs[:20]}]
+
+        stub_server.responder = recording
+        long_text = " ".join(f"Sentence {i} of the long report." for i in range(100))
+        texts = [f"Short document number {i} about batching." for i in range(5)]
+        path = tmp_path / "mixed.jsonl"
+        path.write_text("".join(json.dumps(text) + "\n" for text in texts + [long_text]))
+        output = io.StringIO()
+        service = SummarizerService(api_key="key", api_url=stub_server.url, chunk_tokens=100)
+        with service:
+            stats = BatchRunner(service, workers=2, batch_size=4).run(
+                iter_documents(str(path)), output
+            )
+        records = {r["id"]: r for r in map(json.loads, output.getvalue().splitlines())}
+        assert stats.succeeded == 6
+        assert records["1"]["summary"] == texts[0][:20]
+        assert [len(b) for b in bodies if isinstance(b, list)] == [4]
+        assert texts[4] in bodies
+        assert sum(isinstance(b, str) for b in bodies) > 2
+
+    def test_partial_group_sent_while_input_stalls(self, stub_server):
+        """Test that documents already read are written while the input is idle."""
+        written = threading.Event()
+
+        class Output(io.StringIO):
+            def flush(self):
+                if self.getvalue().count("\n") >= 2:
+                    written.set()
+
+        output = Output()
+
+        def slow_input():
+            yield Document("a", "The first short document of a slow stream.")
+            yield Document("b", "The second short document of a slow stream.")
+            written.wait(5)
+            yield Document("c", "A third document sent after the pause.")
+
+        def slow(handler, body):
+            time.sleep(0.01)
+            inputs = json.loads(body)["inputs"]
+            inputs = inputs if isinstance(inputs, list) else [inputs]
+            return 200, {}, [{"summary_text": text[:20]} for text in inputs]
+
+        stub_server.responder = slow
+        with SummarizerService(api_key="key", api_url=stub_server.url) as service:
+            BatchRunner(service, max_linger=0.05).run(slow_input(), output)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert written.is_set()
+        assert [r["id"] for r in records] == ["a", "b", "c"]
+        assert all(r["elapsed_seconds"] > 0 for r in records)
+
+
+class TestMain:
+    """Tests for the ai-summarizer command."""
+
+    def test_writes_jsonl(self, stub_server, corpus, tmp_path, configured):
+        """Test a full run against the local inference stand-in."""
+        out = tmp_path / "out.jsonl"
+        code = main([str(corpus), "-o", str(out), "--api-url", stub_server.url])
+        records = read_jsonl(out)
+        assert code == 0
+        assert sorted(r["id"] for r in records) == ["doc-0", "doc-1", "doc-2"]
+        assert all(r["success"] for r in records)
+
+    def test_resume_skips_finished(self, stub_server, corpus, tmp_path, configured):
+        """Test that a rerun only redoes documents that failed."""
+        out = tmp_path / "out.jsonl"
+        state = {"fail": True}
+
+        def flaky(handler, body):
+            inputs = json.loads(body)["inputs"]
+            texts = inputs if isinstance(inputs, list) else [inputs]
+            if state["fail"] and any(text.startswith("The second") for text in texts):
+                return 400, {}, {"error": "bad request"}
+            return 200, {}, [{"summary_text": text[:20]} for text in texts]
+
+        stub_server.responder = flaky
+        args = [str(corpus), "-o", str(out), "--api-url", stub_server.url]
+        assert main(args) == 1
+        state["fail"] = False
+        assert main(args) == 0
+
+        records = read_jsonl(out)
+        assert len(records) == 4
+        assert records[-1]["id"] == "doc-1"
+        assert records[-1]["success"]
+
+    def test_extractive_backend_offline(self, tmp_path, monkeypatch):
+        """Test that the local engine needs no API key."""
+        monkeypatch.setattr("src.ai_summarizer.config.get_settings", lambda: Settings())
+        source = tmp_path / "in.jsonl"
+        source.write_text(json.dumps(" ".join(
+            f"Sentence {i} discusses offline summarization." for i in range(8)
+        )) + "\n")
+        out = tmp_path / "out.jsonl"
+        assert main([str(source), "-o", str(out), "--backend", "extractive"]) == 0
+        assert read_jsonl(out)[0]["engine"] == "extractive"
+
+    def test_requires_api_key(self, corpus, tmp_path, monkeypatch):
+        """Test that the API backend refuses to run without a key."""
+        monkeypatch.setattr("src.ai_summarizer.config.get_settings", lambda: Settings())
+        monkeypatch.delenv("HUGGINGFACE_API_KEY", raising=False)
+        assert main([str(corpus), "-o", str(tmp_path / "out.jsonl")]) == 2
+
+    def test_startup_defers_http_stack(self):
+        """Test that parsing arguments does not import requests."""
+        code = (
+            "import sys; from src.ai_summarizer.cli import build_parser;"
+            "build_parser().parse_args(['in.jsonl', '-o', 'out.jsonl']);"
+            "assert 'requests' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_package_entry_point(self):
+        """Test that the console script target resolves."""
+        import src.ai_summarizer as package
+        assert package.main is main
@@ -0,0 +1,159 @@
+"""
+Tests for request body encoding and byte accounting.
+"""
+
+import gzip
+import json
+import zlib
+
+import pytest
+from src.ai_summarizer.core import codec as codec_module
+from src.ai_summarizer.core.cache import SummaryCache
+from src.ai_summarizer.core.codec import WireCodec, dumps, loads
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+LONG_TEXT = "Compression pays off on long repetitive inputs. " * 100
+
+
+def recording(calls, summary="ok"):
+    def respond(handler, body):
+        calls.append((handler.headers.get("Content-Encoding"), json.loads(body)))
+        return 200, {}, [{"summary_text": summary}]
+    return respond
+
+
+class TestDumps:
+    """Tests for the JSON encoder."""
+
+    def test_compact_and_utf8(self, monkeypatch):
+        """Test that the stdlib path drops whitespace and keeps non-ASCII text."""
+        monkeypatch.setattr(codec_module, "orjson", None)
+        data = dumps({"inputs": "café", "n": [1, 2]})
+        assert data == '{"inputs":"café","n":[1,2]}'.encode("utf-8")
+        assert loads(data) == {"inputs": "café", "n": [1, 2]}
+
+    def test_lone_surrogate_is_escaped(self, monkeypatch):
+        """Test that text that is not valid UTF-8 still encodes."""
+        monkeypatch.setattr(codec_module, "orjson", None)
+        assert dumps({"inputs": "\ud800"}) == b'{"inputs":"\\ud800"}'
+
+    def test_orjson_matches_stdlib(self, monkeypatch):
+        """Test that orjson, when installed, produces equivalent JSON."""
+        pytest.importorskip("orjson")
+        value = {"inputs": "naïve 東京", "parameters": {"max_length": 150}}
+        fast = dumps(value)
+        monkeypatch.setattr(codec_module, "orjson", None)
+        assert loads(fast) == loads(dumps(value)) == value
+
+
+class TestWireCodec:
+    """Tests for WireCodec compression and counters."""
+
+    def test_plain_by_default(self):
+        """Test that bodies are not compressed unless configured."""
+        body = WireCodec().encode({"inputs": LONG_TEXT})
+        assert not body.compressed
+        assert body.headers == {"Content-Type": "application/json"}
+
+    @pytest.mark.parametrize("compression,decompress", [
+        ("gzip", gzip.decompress),
+        ("deflate", zlib.decompress),
+    ])
+    def test_large_bodies_compressed(self, compression, decompress):
+        """Test that bodies over the threshold are compressed and labelled."""
+        body = WireCodec(compression=compression).encode({"inputs": LONG_TEXT})
+        assert body.headers["Content-Encoding"] == compression
+        assert len(body.content) < body.json_size / 5
+        assert loads(decompress(body.content)) == {"inputs": LONG_TEXT}
+
+    def test_small_bodies_sent_plain(self):
+        """Test that compression is skipped below min_size."""
+        codec = WireCodec(compression="gzip", min_size=1024)
+        assert not codec.encode({"inputs": "short"}).compressed
+
+    def test_gzip_is_deterministic(self):
+        """Test that identical bodies compress to identical bytes."""
+        codec = WireCodec(compression="gzip")
+        assert codec.encode(LONG_TEXT).content == codec.encode(LONG_TEXT).content
+
+    def test_plain_urls_remembered(self):
+        """Test that an endpoint marked plain no longer gets compressed bodies."""
+        codec = WireCodec(compression="gzip")
+        codec.send_plain("http://a")
+        assert not codec.encode(LONG_TEXT, "http://a").compressed
+        assert codec.encode(LONG_TEXT, "http://b").compressed
+
+    def test_stats(self):
+        """Test that counters and the compression ratio reflect recorded bodies."""
+        codec = WireCodec(compression="gzip")
+        body = codec.encode(LONG_TEXT)
+        codec.record(body, 120)
+        stats = codec.stats
+        assert (stats.requests, stats.compressed_requests) == (1, 1)
+        assert stats.bytes_sent == len(body.content)
+        assert stats.bytes_received == 120
+        assert stats.compression_ratio < 0.2
+
+    def test_unknown_compression(self):
+        """Test that an unsupported encoding is rejected."""
+        with pytest.raises(ValueError):
+            WireCodec(compression="br")
+
+
+class TestServiceEncoding:
+    """Tests for SummarizerService with a wire codec."""
+
+    def test_compressed_request(self, stub_server):
+        """Test that the upstream receives a gzip body it can decode."""
+        calls = []
+        stub_server.responder = recording(calls)
+        codec = WireCodec(compression="gzip")
+        with SummarizerService(api_key="key", api_url=stub_server.url, codec=codec) as service:
+            result = service.summarize(LONG_TEXT)
+        assert result.success
+        assert calls[0][0] == "gzip"
+        assert calls[0][1]["inputs"] == LONG_TEXT.strip()
+        assert 0 < result.bytes_sent < len(LONG_TEXT) / 5
+        assert result.bytes_received == len(b'[{"summary_text": "ok"}]')
+
+    def test_refused_compression_falls_back(self, stub_server):
+        """Test that a 415 is retried plain and the endpoint remembered."""
+        calls = []
+        record = recording(calls)
+
+        def respond(handler, body):
+            if handler.headers.get("Content-Encoding"):
+                calls.append(("gzip", None))
+                return 415, {}, {"error": "unsupported encoding"}
+            return record(handler, body)
+
+        stub_server.responder = respond
+        codec = WireCodec(compression="gzip")
+        with SummarizerService(api_key="key", api_url=stub_server.url, codec=codec) as service:
+            assert service.summarize(LONG_TEXT).success
+            assert service.summarize(LONG_TEXT + " Again.").success
+        assert [encoding for encoding, _ in calls] == ["gzip", None, None]
+        assert codec.stats.requests == 3
+
+    def test_compressed_response_counted_on_wire(self, stub_server):
+        """Test that bytes_received counts the compressed response size."""
+        payload = json.dumps([{"summary_text": "x" * 5000}]).encode()
+        compressed = gzip.compress(payload)
+        stub_server.responder = (
+            lambda handler, body: (200, {"Content-Encoding": "gzip"}, compressed)
+        )
+        with SummarizerService(api_key="key", api_url=stub_server.url) as service:
+            result = service.summarize(LONG_TEXT)
+        assert result.summary == "x" * 5000
+        assert result.bytes_received == len(compressed)
+
+    def test_cache_hit_sends_nothing(self, stub_server):
+        """Test that a cached result reports no bytes on the wire."""
+        stub_server.responder = recording([])
+        service = SummarizerService(api_key="key", api_url=stub_server.url, cache=SummaryCache())
+        with service:
+            first = service.summarize(LONG_TEXT)
+            second = service.summarize(LONG_TEXT)
+        assert first.bytes_sent > 0
+        assert second.cached
+        assert (second.bytes_sent, second.bytes_received) == (0, 0)
@@ -0,0 +1,164 @@
+"""
+Tests for the adaptive concurrency limiter.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from src.ai_summarizer.core.concurrency import (
+    FAILURE,
+    OVERLOAD,
+    SUCCESS,
+    AdaptiveLimiter,
+    get_default_limiter,
+)
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveLimiter:
+    """Tests for AdaptiveLimiter."""
+    
+    def test_additive_increase(self):
+        """Test that a window of healthy requests adds about one slot."""
+        limiter = AdaptiveLimiter(initial_limit=4, clock=FakeClock())
+        for _ in range(5):
+            limiter.acquire().release(SUCCESS)
+        assert limiter.limit == 5
+    
+    def test_multiplicative_decrease(self):
+        """Test that overload halves the limit."""
+        limiter = AdaptiveLimiter(initial_limit=8, clock=FakeClock())
+        limiter.acquire().release(OVERLOAD)
+        assert limiter.limit == 4
+        assert limiter.stats.decreases == 1
+    
+    def test_one_decrease_per_window(self):
+        """Test that failures from requests started before a cut are ignored."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=8, clock=clock)
+        permits = [limiter.acquire() for _ in range(4)]
+        clock.now = 1.0
+        for permit in permits:
+            permit.release(OVERLOAD)
+        assert limiter.limit == 4
+    
+    def test_respects_bounds(self):
+        """Test that the limit stays within min and max."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=1, max_limit=2, clock=clock)
+        for _ in range(5):
+            clock.now += 1
+            limiter.acquire().release(OVERLOAD)
+        assert limiter.limit == 1
+        for _ in range(5):
+            limiter.acquire().release(SUCCESS)
+        assert limiter.limit == 2
+    
+    def test_slow_success_holds_limit(self):
+        """Test that latency far above the best seen stops growth."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=4, clock=clock)
+        limiter.acquire().release(SUCCESS)
+        grown = limiter.stats.increases
+        permit = limiter.acquire()
+        clock.now += 10
+        permit.release(SUCCESS)
+        assert limiter.stats.increases == grown
+    
+    def test_failure_leaves_limit(self):
+        """Test that non-overload failures neither grow nor cut the limit."""
+        limiter = AdaptiveLimiter(initial_limit=4)
+        limiter.acquire().release(FAILURE)
+        assert limiter.limit == 4
+    
+    def test_blocks_at_limit(self):
+        """Test that acquire waits for a slot and times out."""
+        limiter = AdaptiveLimiter(initial_limit=1)
+        permit = limiter.acquire()
+        assert limiter.acquire(timeout=0.01) is None
+        assert limiter.stats.timed_out == 1
+        
+        acquired = []
+        thread = threading.Thread(target=lambda: acquired.append(limiter.acquire()))
+        thread.start()
+        while limiter.stats.queue_depth == 0:
+            pass
+        permit.release(FAILURE)
+        thread.join(timeout=1)
+        assert acquired and acquired[0] is not None
+        assert limiter.stats.in_flight == 1
+    
+    def test_async_acquire(self):
+        """Test that coroutines queue behind the limit without blocking."""
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        peak = 0
+        
+        async def worker():
+            nonlocal peak
+            permit = await limiter.acquire_async()
+            peak = max(peak, limiter.stats.in_flight)
+            await asyncio.sleep(0.01)
+            permit.release(SUCCESS)
+        
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(6)))
+        
+        asyncio.run(run())
+        assert peak == 2
+        assert limiter.stats.in_flight == 0
+        assert limiter.stats.acquired == 6
+    
+    def test_async_cancel_leaves_queue(self):
+        """Test that a cancelled waiter does not leak a slot."""
+        limiter = AdaptiveLimiter(initial_limit=1)
+        
+        async def run():
+            permit = await limiter.acquire_async()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(limiter.acquire_async(), 0.01)
+            permit.release(SUCCESS)
+        
+        asyncio.run(run())
+        assert limiter.stats.queue_depth == 0
+        assert limiter.stats.in_flight == 0
+    
+    def test_invalid_limits(self):
+        """Test that inconsistent bounds are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=10, max_limit=5)
+
+
+class TestServiceLimiter:
+    """Tests for the limiter in SummarizerService."""
+    
+    def test_default_limiter_is_shared(self):
+        """Test that services share the process-wide limiter."""
+        first = SummarizerService(api_key="key")
+        second = SummarizerService(api_key="key")
+        assert first.limiter is second.limiter is get_default_limiter()
+    
+    def test_rate_limit_cuts_limit(self, stub_server, sample_text):
+        """Test that 429 responses shrink the allowed concurrency."""
+        stub_server.responder = lambda handler, body: (429, {}, {"error": "slow"})
+        limiter = AdaptiveLimiter(initial_limit=8)
+        service = SummarizerService(
+            api_key="key",
+            api_url=stub_server.url,
+            limiter=limiter,
+            retry_policy=RetryPolicy.disabled()
+        )
+        service.summarize(sample_text)
+        assert limiter.limit == 4
+        assert limiter.stats.in_flight == 0
@@ -0,0 +1,74 @@
+"""
+Tests for configuration loading and lazy package imports.
+"""
+
+import dataclasses
+import subprocess
+import sys
+
+import pytest
+from src.ai_summarizer.config import Settings, get_settings
+from src.ai_summarizer.exceptions import ConfigurationError
+from src.ai_summarizer.health import HealthChecker
+
+
+class TestSettings:
+    """Tests for Settings and get_settings."""
+    
+    def test_loaded_once(self):
+        """Test that every call returns the same instance."""
+        assert get_settings() is get_settings()
+    
+    def test_immutable(self):
+        """Test that settings cannot be changed after loading."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            get_settings().api_timeout = 1
+    
+    def test_health_check_uses_settings(self, monkeypatch):
+        """Test that the API check reads the loaded settings."""
+        monkeypatch.setattr(
+            "src.ai_summarizer.health.get_settings",
+            lambda: Settings(huggingface_api_key="key")
+        )
+        assert HealthChecker().check_health().checks["api_configured"] is True
+
+    def test_tenant_weights(self, monkeypatch):
+        """Test that TENANT_WEIGHTS is parsed into a weight per tenant."""
+        monkeypatch.setenv("TENANT_WEIGHTS", "acme=2, trial=0.5,,broken")
+        settings = Settings()
+        assert settings.tenant_weights == (("acme", 2.0), ("trial", 0.5))
+        hash(settings)
+    
+    @pytest.mark.parametrize("name,value", [
+        ("HEDGE_FRACTION", "ten percent"),
+        ("CIRCUIT_FAILURE_THRESHOLD", "5.5"),
+        ("SLOW_REQUEST_SECONDS", ""),
+        ("TENANT_WEIGHTS", "acme=heavy"),
+        ("TENANT_WEIGHTS", "acme=0"),
+    ])
+    def test_malformed_values_name_the_variable(self, monkeypatch, name, value):
+        """Test that a bad environment value raises a ConfigurationError for it."""
+        monkeypatch.setenv(name, value)
+        with pytest.raises(ConfigurationError, match=name) as excinfo:
+            Settings()
+        assert excinfo.value.config_key == name
+
+
+class TestLazyImports:
+    """Tests for deferred package imports."""
+    
+    def test_package_import_is_light(self):
+        """Test that importing the package does not load the HTTP stack."""
+        code = (
+            "import sys, src.ai_summarizer as p;"
+            "assert 'requests' not in sys.modules;"
+            "p.SummarizerService;"
+            "assert 'requests' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+    
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        import src.ai_summarizer as package
+        with pytest.raises(AttributeError):
+            package.missing
@@ -0,0 +1,112 @@
+"""
+Tests for the local extractive summarization engine.
+"""
+
+import asyncio
+import time
+
+import pytest
+from src.ai_summarizer.core.extractive import ExtractiveSummarizer
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.summarizer import SummarizerService
+from src.ai_summarizer.exceptions import ConfigurationError
+
+DOCUMENT = (
+    "Solar power capacity grew quickly across Europe last year. "
+    "Cheap solar panels and new solar subsidies drove the growth in power capacity. "
+    "My cat enjoys sleeping in the afternoon sun. "
+    "Analysts expect solar power capacity to keep growing as panel prices fall."
+)
+
+
+class TestExtractiveSummarizer:
+    """Tests for ExtractiveSummarizer."""
+    
+    def test_picks_central_sentences(self):
+        """Test that off-topic sentences rank lowest."""
+        engine = ExtractiveSummarizer()
+        sentences = engine.split_sentences(DOCUMENT)
+        scores = engine.rank(sentences)
+        assert scores.argmin() == 2
+    
+    def test_respects_length_budget(self):
+        """Test that the summary stays within max_length tokens."""
+        result = ExtractiveSummarizer().summarize(DOCUMENT * 20, max_length=40, min_length=5)
+        assert result.success is True
+        assert result.output_length <= 40 * 4
+        assert result.engine == "extractive"
+    
+    def test_keeps_document_order(self):
+        """Test that selected sentences appear in their original order."""
+        sentences = ExtractiveSummarizer.split_sentences(DOCUMENT)
+        summary = ExtractiveSummarizer().summarize(DOCUMENT, max_length=60).summary
+        positions = [sentences.index(s) for s in sentences if s in summary]
+        assert positions == sorted(positions)
+    
+    def test_single_sentence(self):
+        """Test that a one-sentence text is returned whole."""
+        result = ExtractiveSummarizer().summarize("Just one sentence here.")
+        assert result.summary == "Just one sentence here."
+    
+    def test_empty_text(self):
+        """Test that empty text fails cleanly."""
+        assert ExtractiveSummarizer().summarize("   ").success is False
+    
+    def test_max_length_document_is_fast(self):
+        """Test that a 50,000-character document is summarized quickly."""
+        text = (DOCUMENT + " ") * (50000 // (len(DOCUMENT) + 1))
+        started = time.perf_counter()
+        result = ExtractiveSummarizer().summarize(text)
+        assert result.success is True
+        assert time.perf_counter() - started < 1.0
+
+
+class TestServiceBackends:
+    """Tests for extractive backend selection and fallback."""
+    
+    def test_extractive_backend_needs_no_key(self):
+        """Test that the extractive backend works offline."""
+        service = SummarizerService(api_key="", backend="extractive")
+        result = service.summarize(DOCUMENT)
+        assert result.success is True
+        assert result.engine == "extractive"
+    
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ConfigurationError):
+            SummarizerService(api_key="key", backend="magic")
+    
+    def test_fallback_on_upstream_failure(self, stub_server):
+        """Test that a failed upstream call falls back to the local engine."""
+        stub_server.responder = lambda handler, body: (500, {}, {"error": "boom"})
+        service = SummarizerService(
+            api_key="key",
+            api_url=stub_server.url,
+            retry_policy=RetryPolicy.disabled(),
+            fallback=True
+        )
+        result = service.summarize(DOCUMENT)
+        assert result.success is True
+        assert result.engine == "extractive"
+    
+    def test_no_fallback_by_default(self, stub_server):
+        """Test that failures surface when fallback is off."""
+        stub_server.responder = lambda handler, body: (500, {}, {"error": "boom"})
+        service = SummarizerService(
+            api_key="key", api_url=stub_server.url, retry_policy=RetryPolicy.disabled()
+        )
+        assert service.summarize(DOCUMENT).success is False
+    
+    def test_async_fallback_on_deadline(self, stub_server):
+        """Test that a missed deadline falls back on the async path."""
+        pytest.importorskip("httpx")
+        
+        def slow(handler, body):
+            time.sleep(0.3)
+            return 200, {}, [{"summary_text": "late"}]
+        
+        stub_server.responder = slow
+        service = SummarizerService(api_key="key", api_url=stub_server.url, fallback=True)
+        result = asyncio.run(service.asummarize(DOCUMENT, deadline=0.05))
+        assert result.success is True
+        assert result.engine == "extractive"
@@ -0,0 +1,157 @@
+"""
+Tests for latency metrics and the health checker.
+"""
+
+import random
+import threading
+
+import pytest
+from src.ai_summarizer.core.breaker import CircuitBreaker
+from src.ai_summarizer.core.outcomes import ERROR
+from src.ai_summarizer.health import HealthChecker
+from src.ai_summarizer.metrics import LatencyHistogram, LatencyRecorder, size_bucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram class."""
+    
+    def test_quantiles_track_true_values(self):
+        """Test that estimates stay within the bucket resolution."""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-1, 1) for _ in range(5000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.observe(value)
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * len(values)) - 1]
+            assert histogram.quantile(q) == pytest.approx(exact, rel=0.2)
+        assert histogram.max == values[-1]
+    
+    def test_empty(self):
+        """Test that an empty histogram reports zeros."""
+        summary = LatencyHistogram().summary()
+        assert summary.count == 0
+        assert summary.p99 == 0.0
+
+
+class TestSizeBucket:
+    """Tests for size_bucket function."""
+    
+    def test_labels(self):
+        """Test bucket boundaries and the open-ended last bucket."""
+        assert size_bucket(0) == "0-1k"
+        assert size_bucket(1000) == "0-1k"
+        assert size_bucket(1001) == "1k-5k"
+        assert size_bucket(40000) == "20k-50k"
+        assert size_bucket(60000) == "50k+"
+
+
+class TestLatencyRecorder:
+    """Tests for LatencyRecorder class."""
+    
+    def test_breakdown_by_outcome_and_size(self):
+        """Test that series are split by outcome and input size."""
+        recorder = LatencyRecorder(clock=FakeClock())
+        recorder.observe(0.1, "success", 500)
+        recorder.observe(2.0, "success", 40000)
+        recorder.observe(5.0, "error", 40000)
+        breakdown = recorder.breakdown()
+        assert set(breakdown) == {"success", "error"}
+        assert set(breakdown["success"]) == {"0-1k", "20k-50k"}
+        assert recorder.percentiles(input_size="20k-50k").count == 2
+        assert recorder.percentiles(outcome="success").max == 2.0
+    
+    def test_rolling_window_expires(self):
+        """Test that old observations leave the window but not the totals."""
+        clock = FakeClock()
+        recorder = LatencyRecorder(windows=(60, 300), slice_seconds=10, clock=clock)
+        recorder.observe(1.0)
+        clock.now = 100.0
+        recorder.observe(0.2)
+        assert recorder.percentiles(window=60).count == 1
+        assert recorder.percentiles(window=300).count == 2
+        clock.now = 1000.0
+        assert recorder.percentiles(window=300).count == 0
+        assert recorder.percentiles().count == 2
+    
+    def test_concurrent_observe(self):
+        """Test that no observation is lost across threads."""
+        recorder = LatencyRecorder()
+        
+        def work():
+            for _ in range(1000):
+                recorder.observe(0.05)
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert recorder.percentiles().count == 8000
+
+
+class TestHealthChecker:
+    """Tests for HealthChecker class."""
+    
+    def test_metrics_include_latency(self):
+        """Test that get_metrics reports counters and window percentiles."""
+        checker = HealthChecker(latency=LatencyRecorder(clock=FakeClock()))
+        checker.record_request(0.5, 2000)
+        checker.record_error(1.5, 2000)
+        checker.record_request()
+        metrics = checker.get_metrics()
+        assert metrics["total_requests"] == 2
+        assert metrics["total_errors"] == 1
+        assert metrics["latency"]["60s"]["count"] == 2
+        assert metrics["latency"]["60s"]["max"] == 1.5
+    
+    def test_prometheus_export(self):
+        """Test the exposition format of counters and histograms."""
+        checker = HealthChecker(latency=LatencyRecorder(clock=FakeClock()))
+        checker.record_request(0.3, 40000)
+        text = checker.export_prometheus()
+        labels = 'outcome="success",input_size="20k-50k"'
+        assert text.endswith("\n")
+        assert "summarizer_requests_total 1" in text
+        assert "# TYPE summarizer_request_duration_seconds histogram" in text
+        assert f'summarizer_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"summarizer_request_duration_seconds_count{{{labels}}} 1" in text
+        assert f'{labels},window="1m",quantile="0.99"}}' in text
+        assert "# TYPE summarizer_request_duration_seconds_window summary" in text
+        assert f'summarizer_request_duration_seconds_window_count{{{labels},window="1m"}} 1' in text
+        assert f'summarizer_request_duration_seconds_window_max{{{labels},window="1m"}} 0.3' in text
+        assert 'quantile="1"' not in text
+    
+    def test_status_follows_circuit_breaker(self):
+        """Test that an open circuit reports unhealthy, then degraded."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        checker = HealthChecker(breaker=breaker)
+        assert checker.check_health().status == "healthy"
+        breaker.record(ERROR)
+        health = checker.check_health()
+        assert health.status == "unhealthy"
+        assert health.checks["backend_available"] is False
+        clock.now = 10.0
+        assert checker.check_health().status == "degraded"
+    
+    def test_circuit_metrics(self):
+        """Test that breaker state is exported in both metric formats."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        checker = HealthChecker(breaker=breaker)
+        breaker.record(ERROR)
+        breaker.allow()
+        assert checker.get_metrics()["circuit"]["rejected"] == 1
+        text = checker.export_prometheus()
+        assert "summarizer_circuit_state 2" in text
+        assert "summarizer_circuit_opened_total 1" in text
@@ -0,0 +1,213 @@
+"""
+Tests for hedged upstream requests.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.ai_summarizer.core.concurrency import AdaptiveLimiter
+from src.ai_summarizer.core.hedging import Hedger
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.routing import EndpointPool
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class StallFirst:
+    """Responder whose first request for each text stalls."""
+
+    def __init__(self, stall=1.0):
+        self.stall = stall
+        self.calls = 0
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, handler, body):
+        text = json.loads(body)["inputs"]
+        with self._lock:
+            self.calls += 1
+            first = text not in self._seen
+            self._seen.add(text)
+        if first:
+            time.sleep(self.stall)
+        return 200, {}, [{"summary_text": text[:20]}]
+
+
+def warm(hedger, latency=0.01, samples=1):
+    for _ in range(samples):
+        hedger.observe(latency)
+    return hedger
+
+
+class TestHedger:
+    """Tests for Hedger delay and budget."""
+
+    def test_no_delay_until_warm(self):
+        """Test that hedging waits for enough latency samples."""
+        hedger = Hedger(min_samples=3, clock=FakeClock())
+        warm(hedger, samples=2)
+        assert hedger.delay() is None
+        warm(hedger)
+        assert hedger.delay() is not None
+
+    def test_delay_follows_percentile(self):
+        """Test that the delay tracks the configured latency quantile."""
+        hedger = Hedger(percentile=0.9, min_samples=1, min_delay=0.0, clock=FakeClock())
+        for i in range(100):
+            hedger.observe(0.1 if i < 90 else 2.0)
+        assert 0.05 < hedger.delay() <= 0.5
+
+    def test_delay_floor(self):
+        """Test that very fast upstreams are not hedged immediately."""
+        hedger = warm(Hedger(min_samples=1, min_delay=0.2, clock=FakeClock()), 0.001)
+        assert hedger.delay() == 0.2
+
+    def test_old_latencies_expire(self):
+        """Test that the delay only reflects the recent window."""
+        clock = FakeClock()
+        hedger = warm(Hedger(min_samples=1, window_seconds=60, clock=clock))
+        clock.now = 200.0
+        assert hedger.delay() is None
+
+    def test_budget_caps_hedge_fraction(self):
+        """Test that hedges stay within max_fraction of requests."""
+        hedger = Hedger(max_fraction=0.25, burst=1.0, clock=FakeClock())
+        allowed = 0
+        for _ in range(100):
+            hedger.delay()
+            allowed += hedger.try_hedge()
+        stats = hedger.stats
+        assert allowed == 25
+        assert stats.hedge_ratio == 0.25
+        assert stats.denied == 75
+
+    def test_burst_limits_saved_budget(self):
+        """Test that a quiet period cannot bank more than burst hedges."""
+        hedger = Hedger(max_fraction=0.5, burst=2.0, clock=FakeClock())
+        for _ in range(50):
+            hedger.delay()
+        assert [hedger.try_hedge() for _ in range(3)] == [True, True, False]
+
+
+class TestHedgedRequests:
+    """Tests for SummarizerService with a hedger."""
+
+    def test_hedge_answers_stalled_request(self, stub_server):
+        """Test that a stalled request is answered by its duplicate."""
+        responder = StallFirst()
+        stub_server.responder = responder
+        hedger = warm(Hedger(max_fraction=1.0, min_samples=1, min_delay=0.05))
+        with SummarizerService(api_key="key", api_url=stub_server.url, hedger=hedger) as service:
+            started = time.perf_counter()
+            result = service.summarize("A request that stalls the first time.")
+            elapsed = time.perf_counter() - started
+        assert result.success
+        assert elapsed < responder.stall / 2
+        assert responder.calls == 2
+        assert hedger.stats.hedge_wins == 1
+
+    def test_fast_request_not_hedged(self, stub_server):
+        """Test that a request answered within the delay is sent once."""
+        calls = []
+        stub_server.responder = (
+            lambda handler, body: calls.append(body) or (200, {}, [{"summary_text": "ok"}])
+        )
+        hedger = warm(Hedger(max_fraction=1.0, min_samples=1, min_delay=0.5))
+        with SummarizerService(api_key="key", api_url=stub_server.url, hedger=hedger) as service:
+            assert service.summarize("A request that answers quickly.").success
+        assert len(calls) == 1
+        assert hedger.stats.hedges == 0
+
+    def test_no_hedge_without_budget(self, stub_server):
+        """Test that a slow request waits for its primary once the budget is spent."""
+        responder = StallFirst(stall=0.3)
+        stub_server.responder = responder
+        hedger = warm(Hedger(max_fraction=0.0, min_samples=1, min_delay=0.05))
+        with SummarizerService(api_key="key", api_url=stub_server.url, hedger=hedger) as service:
+            assert service.summarize("A slow request with no budget left.").success
+        assert responder.calls == 1
+        assert hedger.stats.denied == 1
+
+    def test_failed_primary_waits_for_hedge(self, stub_server):
+        """Test that an error from one copy does not beat a good response."""
+        state = {"calls": 0}
+        lock = threading.Lock()
+
+        def respond(handler, body):
+            with lock:
+                state["calls"] += 1
+                call = state["calls"]
+            if call == 1:
+                time.sleep(0.2)
+                return 503, {}, {"error": "unavailable"}
+            time.sleep(0.3)
+            return 200, {}, [{"summary_text": "hedged"}]
+
+        stub_server.responder = respond
+        hedger = warm(Hedger(max_fraction=1.0, min_samples=1, min_delay=0.05))
+        service = SummarizerService(
+            api_key="key",
+            api_url=stub_server.url,
+            hedger=hedger,
+            retry_policy=RetryPolicy.disabled()
+        )
+        with service:
+            result = service.summarize("A request whose first copy fails.")
+        assert result.summary == "hedged"
+        assert hedger.stats.hedge_wins == 1
+
+    def test_send_threads_bounded_by_limiter(self, stub_server):
+        """Test that concurrent hedged requests share a pool sized to the limiter."""
+        def send_threads():
+            return {t for t in threading.enumerate() if t.name.startswith("summarizer-send")}
+
+        earlier = send_threads()
+        seen = []
+        responder = StallFirst(stall=0.2)
+
+        def counting(handler, body):
+            seen.append(len(send_threads() - earlier))
+            return responder(handler, body)
+
+        stub_server.responder = counting
+        hedger = warm(Hedger(max_fraction=1.0, min_samples=1, min_delay=0.05))
+        limiter = AdaptiveLimiter(min_limit=1, initial_limit=2, max_limit=2)
+        service = SummarizerService(
+            api_key="key", api_url=stub_server.url, hedger=hedger, limiter=limiter
+        )
+        texts = [f"Concurrent hedged request number {i}." for i in range(6)]
+        with service, ThreadPoolExecutor(max_workers=len(texts)) as pool:
+            results = list(pool.map(service.summarize, texts))
+        assert all(result.success for result in results)
+        assert max(seen) <= 2
+
+    def test_async_loser_cancelled(self, stub_server):
+        """Test that the async API cancels the losing request."""
+        pytest.importorskip("httpx")
+        stub_server.responder = StallFirst()
+        pool = EndpointPool([stub_server.url])
+        hedger = warm(Hedger(max_fraction=1.0, min_samples=1, min_delay=0.05))
+
+        async def run():
+            async with SummarizerService(api_key="key", endpoints=pool, hedger=hedger) as service:
+                return await service.asummarize("An async request that stalls once.")
+
+        assert asyncio.run(run()).success
+        stats = pool.stats[0]
+        assert stats.outstanding == 0
+        # The cancelled primary is not counted against the endpoint
+        assert stats.requests == 1
+        assert hedger.stats.hedge_wins == 1
@@ -0,0 +1,96 @@
+"""
+Tests for the logging configuration.
+"""
+
+import io
+import json
+import logging
+import queue
+import uuid
+
+from logger import DroppingQueueHandler, queue_stats, setup_logger, shutdown_logging
+
+
+def fresh_name():
+    return f"test_logger.{uuid.uuid4().hex}"
+
+
+class TestSetupLogger:
+    """Tests for setup_logger function."""
+    
+    def test_json_lines_with_fields(self):
+        """Test that extra fields are emitted as JSON keys."""
+        stream = io.StringIO()
+        logger = setup_logger(fresh_name(), json_lines=True, stream=stream)
+        logger.info("Summarization: %s chars", 120, extra={"cache_hit": True, "attempts": 2})
+        entry = json.loads(stream.getvalue())
+        assert entry["message"] == "Summarization: 120 chars"
+        assert entry["level"] == "INFO"
+        assert entry["cache_hit"] is True
+        assert entry["attempts"] == 2
+    
+    def test_queued_mode_writes_on_listener(self):
+        """Test that queued records reach the stream after shutdown."""
+        stream = io.StringIO()
+        logger = setup_logger(fresh_name(), json_lines=True, queued=True, stream=stream)
+        for i in range(5):
+            logger.info("record %s", i)
+        shutdown_logging()
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == [
+            f"record {i}" for i in range(5)
+        ]
+        assert queue_stats(logger).enqueued == 5
+    
+    def test_disabled_level_is_not_formatted(self):
+        """Test that records below the level never format their arguments."""
+        class Explosive:
+            def __str__(self):
+                raise AssertionError("formatted")
+        
+        logger = setup_logger(fresh_name(), level=logging.WARNING, stream=io.StringIO())
+        logger.info("value %s", Explosive())
+
+
+class TestDroppingQueueHandler:
+    """Tests for DroppingQueueHandler class."""
+    
+    def test_drops_when_full(self):
+        """Test that a full queue drops and counts instead of blocking."""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+        logger = logging.getLogger(fresh_name())
+        logger.addHandler(handler)
+        logger.propagate = False
+        for i in range(5):
+            logger.warning("record %s", i)
+        stats = handler.stats
+        assert (stats.enqueued, stats.dropped, stats.queue_depth) == (2, 3, 2)
+
+
+class TestSummarizationRecords:
+    """Tests for the records emitted by the summarize path."""
+    
+    def test_legacy_summary_logged(self, stub_server, monkeypatch):
+        """Test that a summary emits a JSON record with its statistics."""
+        import logger as logger_module
+        import summarizer
+        
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logger_module.JsonFormatter())
+        logger_module.logger.addHandler(handler)
+        monkeypatch.setattr(summarizer, "API_URL", stub_server.url)
+        monkeypatch.setattr(summarizer, "get_api_key", lambda: "key")
+        monkeypatch.setattr(summarizer, "_breaker", None)
+        text = "A long enough text for the legacy summarizer to log."
+        try:
+            assert summarizer.summarize_text(text)["success"]
+        finally:
+            logger_module.logger.removeHandler(handler)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        response, summary = records[-2:]
+        assert response["attempts"] == 1
+        assert summary["input_length"] == len(text)
+        assert summary["output_length"] == 20
+        assert summary["cache_hit"] is False
+        assert summary["latency_seconds"] > 0
@@ -0,0 +1,135 @@
+"""
+Tests for the retry policy.
+"""
+
+import asyncio
+import random
+
+import pytest
+import requests
+from src.ai_summarizer.core.retry import RetryPolicy, parse_retry_after
+from src.ai_summarizer.core.summarizer import SummarizerService
+from src.ai_summarizer.exceptions import ModelLoadingError, RateLimitError
+
+
+class SequenceResponder:
+    """Responder that replays a list of responses, then succeeds."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+    
+    def __call__(self, handler, body):
+        self.calls += 1
+        if self.responses:
+            return self.responses.pop(0)
+        return 200, {}, [{"summary_text": "done"}]
+
+
+def fast_policy(**kwargs):
+    return RetryPolicy(base_delay=0.001, rng=random.Random(0), **kwargs)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after function."""
+    
+    def test_seconds(self):
+        """Test a delay given in seconds."""
+        assert parse_retry_after({"Retry-After": "7"}) == 7.0
+    
+    def test_http_date_in_past(self):
+        """Test that a past HTTP date means no wait."""
+        assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    
+    def test_missing_or_invalid(self):
+        """Test that absent or garbage headers give None."""
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+    
+    def test_backoff_grows_and_caps(self):
+        """Test exponential growth up to max_delay."""
+        policy = RetryPolicy(base_delay=1, jitter=0, max_delay=5)
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+    
+    def test_backoff_jitter_bounds(self):
+        """Test that jitter stays within the configured spread."""
+        policy = RetryPolicy(base_delay=2, jitter=0.5, rng=random.Random(1))
+        delays = [policy.backoff(1) for _ in range(100)]
+        assert all(1.0 <= d <= 3.0 for d in delays)
+    
+    def test_hints_override_backoff(self):
+        """Test that upstream wait hints are honored."""
+        policy = RetryPolicy()
+        assert policy.next_delay(ModelLoadingError(12.5), 1, 0) == 12.5
+        assert policy.next_delay(RateLimitError(4), 1, 0) == 4
+    
+    def test_gives_up(self):
+        """Test exhaustion, deadline and non-retryable errors."""
+        policy = RetryPolicy(max_retries=2, deadline=10)
+        assert policy.next_delay(requests.exceptions.Timeout(), 3, 0) is None
+        assert policy.next_delay(ModelLoadingError(20), 1, 0) is None
+        assert policy.next_delay(ValueError(), 1, 0) is None
+    
+    def test_disabled(self):
+        """Test that the disabled policy never retries."""
+        assert RetryPolicy.disabled().next_delay(
+            requests.exceptions.Timeout(), 1, 0
+        ) is None
+
+
+class TestServiceRetries:
+    """Tests for retries in SummarizerService."""
+    
+    def make_service(self, stub_server, **kwargs):
+        return SummarizerService(
+            api_key="key", api_url=stub_server.url, retry_policy=fast_policy(**kwargs)
+        )
+    
+    def test_model_loading_retried(self, stub_server, sample_text):
+        """Test that a loading model is waited for using estimated_time."""
+        stub_server.responder = SequenceResponder(
+            (503, {}, {"error": "Model is currently loading", "estimated_time": 0.01})
+        )
+        result = self.make_service(stub_server).summarize(sample_text)
+        assert result.success is True
+        assert result.attempts == 2
+    
+    def test_rate_limit_retried(self, stub_server, sample_text):
+        """Test that 429 responses are retried after Retry-After."""
+        stub_server.responder = SequenceResponder(
+            (429, {"Retry-After": "0"}, {"error": "slow down"}),
+            (429, {"Retry-After": "0"}, {"error": "slow down"}),
+        )
+        result = self.make_service(stub_server).summarize(sample_text)
+        assert result.success is True
+        assert result.attempts == 3
+    
+    def test_exhausted_retries_fail(self, stub_server, sample_text):
+        """Test that persistent server errors fail after max_retries."""
+        responder = SequenceResponder(*[(502, {}, {"error": "bad gateway"})] * 5)
+        stub_server.responder = responder
+        result = self.make_service(stub_server, max_retries=2).summarize(sample_text)
+        assert result.success is False
+        assert result.attempts == 3
+        assert responder.calls == 3
+    
+    def test_client_error_not_retried(self, stub_server, sample_text):
+        """Test that 4xx errors other than 429 are final."""
+        stub_server.responder = SequenceResponder((400, {}, {"error": "bad"}))
+        result = self.make_service(stub_server).summarize(sample_text)
+        assert result.success is False
+        assert result.attempts == 1
+    
+    def test_async_retries(self, stub_server, sample_text):
+        """Test that the async path applies the same policy."""
+        pytest.importorskip("httpx")
+        stub_server.responder = SequenceResponder(
+            (503, {}, {"error": "Model is currently loading", "estimated_time": 0.01})
+        )
+        result = asyncio.run(self.make_service(stub_server).asummarize(sample_text))
+        assert result.success is True
+        assert result.attempts == 2
@@ -0,0 +1,221 @@
+"""
+Tests for endpoint pool routing.
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.routing import CANCELLED, ERROR, OK, EndpointPool
+from src.ai_summarizer.core.summarizer import SummarizerService
+from tests.conftest import default_responder, start_stub_server, stop_stub_server
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pool(urls=("a", "b"), **kwargs):
+    clock = FakeClock()
+    pool = EndpointPool(urls, clock=clock, rng=random.Random(0), **kwargs)
+    return pool, clock
+
+
+def by_url(pool):
+    return {endpoint.url: endpoint for endpoint in pool.endpoints}
+
+
+def slow_responder(delay):
+    def respond(handler, body):
+        time.sleep(delay)
+        return default_responder(handler, body)
+    return respond
+
+
+def counting(respond, calls, name):
+    def wrapper(handler, body):
+        calls[name] += 1
+        return respond(handler, body)
+    return wrapper
+
+
+@pytest.fixture
+def stub_servers():
+    """Start several inference stand-ins; stopped after the test."""
+    servers = []
+
+    def start(*responders):
+        servers.extend(start_stub_server(responder) for responder in responders)
+        return servers[-len(responders):]
+
+    yield start
+    for server in servers:
+        stop_stub_server(server)
+
+
+class TestEndpointPool:
+    """Tests for EndpointPool selection and ejection."""
+
+    def test_untried_endpoints_first(self):
+        """Test that an endpoint with no samples is chosen before measured ones."""
+        pool, _ = make_pool()
+        first = pool.acquire()
+        pool.release(first, 0.01)
+        assert pool.acquire() is not first
+
+    def test_prefers_lower_latency(self):
+        """Test that the endpoint with the lower latency average wins."""
+        pool, _ = make_pool()
+        endpoints = by_url(pool)
+        pool.release(pool.acquire(), 0)
+        endpoints["a"].ewma_latency, endpoints["b"].ewma_latency = 0.1, 0.5
+        chosen = [pool.acquire() for _ in range(3)]
+        assert [e.url for e in chosen] == ["a", "a", "a"]
+
+    def test_outstanding_requests_raise_cost(self):
+        """Test that a busy fast endpoint sheds load to an idle slower one."""
+        pool, _ = make_pool()
+        endpoints = by_url(pool)
+        endpoints["a"].ewma_latency, endpoints["b"].ewma_latency = 0.1, 0.35
+        assert [pool.acquire().url for _ in range(4)] == ["a", "a", "a", "b"]
+
+    def test_error_rate_raises_cost(self):
+        """Test that errors steer traffic away from an endpoint."""
+        pool, _ = make_pool(failure_threshold=10)
+        endpoints = by_url(pool)
+        for url, outcome in (("a", ERROR), ("b", OK)):
+            endpoints[url].outstanding += 1
+            pool.release(endpoints[url], 0.1, outcome)
+        assert endpoints["a"].error_rate == pytest.approx(0.3)
+        assert pool.acquire().url == "b"
+
+    def test_ejection_and_probe(self):
+        """Test that a failing endpoint is ejected, probed once, and restored."""
+        pool, clock = make_pool(failure_threshold=2, eject_seconds=10)
+        a = by_url(pool)["a"]
+        for _ in range(2):
+            a.outstanding += 1
+            pool.release(a, 0.1, ERROR)
+        assert not a.healthy
+        assert {pool.acquire().url for _ in range(5)} == {"b"}
+
+        clock.now = 10.0
+        probe = pool.acquire()
+        assert probe is a
+        # Only one trial request at a time
+        assert pool.acquire().url == "b"
+        pool.release(probe, 0.05, OK)
+        assert a.healthy
+        assert a.error_rate == 0.0
+
+    def test_failed_probe_doubles_ejection(self):
+        """Test that each failed trial request backs off further."""
+        pool, clock = make_pool(failure_threshold=1, eject_seconds=10, max_eject_seconds=30)
+        a = by_url(pool)["a"]
+        a.outstanding += 1
+        pool.release(a, 0.1, ERROR)
+        for now, until in ((10.0, 30.0), (30.0, 60.0), (60.0, 90.0)):
+            clock.now = now
+            probe = pool.acquire()
+            assert probe is a
+            pool.release(probe, 0.1, ERROR)
+            assert a.ejected_until == until
+        assert a.ejections == 4
+
+    def test_fails_open_when_all_ejected(self):
+        """Test that the endpoint due back soonest is used when none are healthy."""
+        pool, clock = make_pool(failure_threshold=1, eject_seconds=10)
+        endpoints = by_url(pool)
+        for url in ("b", "a"):
+            endpoints[url].outstanding += 1
+            pool.release(endpoints[url], 0.1, ERROR)
+            clock.now += 1
+        assert pool.acquire().url == "b"
+
+    def test_cancelled_records_nothing(self):
+        """Test that an abandoned request leaves latency and counters untouched."""
+        pool, _ = make_pool(urls=("a",))
+        endpoint = pool.acquire()
+        pool.release(endpoint, 5.0, CANCELLED)
+        stats = pool.stats[0]
+        assert (stats.outstanding, stats.requests, stats.ewma_latency) == (0, 0, 0.0)
+
+    def test_render_prometheus(self):
+        """Test that per-endpoint series carry an endpoint label."""
+        pool, _ = make_pool()
+        pool.release(pool.acquire(), 0.25)
+        text = "\n".join(pool.render_prometheus("summarizer"))
+        assert "# TYPE summarizer_endpoint_requests_total counter" in text
+        assert 'summarizer_endpoint_healthy{endpoint="a"} 1' in text
+        assert "# TYPE summarizer_endpoint_latency_seconds summary" in text
+        assert 'summarizer_endpoint_latency_seconds{endpoint="b",quantile="0.99"}' in text
+        assert 'summarizer_endpoint_latency_seconds_sum{endpoint="b"} 0.25' in text
+        assert 'summarizer_endpoint_latency_seconds_count{endpoint="b"} 1' in text
+
+    def test_requires_urls(self):
+        """Test that an empty pool is rejected."""
+        with pytest.raises(ValueError):
+            EndpointPool([])
+
+
+class TestServiceRouting:
+    """Tests for SummarizerService with an endpoint pool."""
+
+    def test_traffic_shifts_to_fast_endpoint(self, stub_servers):
+        """Test that a slow endpoint only gets its first request."""
+        calls = {"slow": 0, "fast": 0}
+        slow, fast = stub_servers(
+            counting(slow_responder(0.1), calls, "slow"),
+            counting(default_responder, calls, "fast")
+        )
+        pool = EndpointPool([slow.url, fast.url])
+        with SummarizerService(api_key="key", endpoints=pool) as service:
+            for i in range(12):
+                assert service.summarize(f"Request number {i} for routing.").success
+        assert calls == {"slow": 1, "fast": 11}
+        assert service.api_url == slow.url
+
+    def test_retry_goes_to_another_endpoint(self, stub_servers):
+        """Test that a failing endpoint is ejected and its request retried elsewhere."""
+        down, up = stub_servers(
+            lambda handler, body: (503, {}, {"error": "unavailable"}),
+            default_responder
+        )
+        pool = EndpointPool([down.url, up.url], failure_threshold=1)
+        service = SummarizerService(
+            api_key="key",
+            endpoints=pool,
+            retry_policy=RetryPolicy(base_delay=0.01, jitter=0)
+        )
+        with service:
+            results = [service.summarize(f"Text {i} to summarize here.") for i in range(5)]
+        assert all(r.success for r in results)
+        stats = {s.url: s for s in pool.stats}
+        assert stats[down.url].requests == 1
+        assert not stats[down.url].healthy
+        assert stats[up.url].requests == 5
+
+    def test_async_requests_are_released(self, stub_servers):
+        """Test that asummarize routes through the pool and releases endpoints."""
+        pytest.importorskip("httpx")
+        servers = stub_servers(default_responder, default_responder)
+        pool = EndpointPool([server.url for server in servers])
+
+        async def run():
+            async with SummarizerService(api_key="key", endpoints=pool) as service:
+                return await asyncio.gather(*(
+                    service.asummarize(f"Concurrent text {i} to route.") for i in range(6)
+                ))
+
+        assert all(r.success for r in asyncio.run(run()))
+        assert sum(s.requests for s in pool.stats) == 6
+        assert all(s.outstanding == 0 for s in pool.stats)
+
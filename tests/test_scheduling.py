@@ -0,0 +1,272 @@
+"""
+Tests for priority scheduling of upstream requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.ai_summarizer.core.concurrency import FAILURE, AdaptiveLimiter
+from src.ai_summarizer.core.scheduling import (
+    BACKGROUND,
+    BATCH,
+    INTERACTIVE,
+    PriorityScheduler,
+    WorkContext,
+    carry_work,
+    current_work,
+    work_context,
+)
+from src.ai_summarizer.core.summarizer import SummarizerService
+from src.ai_summarizer.exceptions import DeadlineExceededError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler(clock=None, **kwargs):
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1)
+    return PriorityScheduler(limiter, clock=clock or FakeClock(), **kwargs)
+
+
+def by_priority(scheduler):
+    return {stats.priority: stats for stats in scheduler.stats}
+
+
+async def serve_in_order(scheduler, jobs):
+    """Queue jobs behind a held slot and return the order they are served in."""
+    held = await scheduler.acquire_async()
+    order = []
+
+    async def job(name, work):
+        permit = await scheduler.acquire_async(work)
+        order.append(name)
+        permit.release(FAILURE)
+
+    tasks = [asyncio.ensure_future(job(name, work)) for name, work in jobs]
+    await asyncio.sleep(0)
+    held.release(FAILURE)
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestWorkContext:
+    """Tests for tagging requests with a work context."""
+
+    def test_defaults_to_interactive(self):
+        """Test that untagged requests are interactive for the default tenant."""
+        assert current_work() == WorkContext()
+
+    def test_nested_contexts_inherit(self):
+        """Test that inner blocks inherit unset fields and keep the nearer deadline."""
+        with work_context(BATCH, "acme", timeout=1.0) as outer:
+            with work_context(tenant="other", timeout=60.0) as inner:
+                assert inner.priority == BATCH
+                assert inner.tenant == "other"
+                assert inner.deadline == outer.deadline
+        assert current_work() == WorkContext()
+
+    def test_unknown_priority(self):
+        """Test that an unsupported class is rejected."""
+        with pytest.raises(ValueError):
+            with work_context("urgent"):
+                pass
+
+    def test_carried_to_worker_threads(self):
+        """Test that carry_work restores the caller's context on a pool thread."""
+        with work_context(BACKGROUND, "acme"):
+            task = carry_work(current_work)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(task).result().tenant == "acme"
+            assert pool.submit(current_work).result() == WorkContext()
+
+
+class TestPriorityScheduler:
+    """Tests for PriorityScheduler ordering and dropping."""
+
+    def test_free_slot_taken_immediately(self):
+        """Test that an idle scheduler hands out a slot without queueing."""
+        scheduler = make_scheduler()
+        permit = scheduler.acquire(WorkContext(BATCH))
+        stats = by_priority(scheduler)[BATCH]
+        assert (stats.dispatched, stats.queue_depth, stats.wait.max) == (1, 0, 0.0)
+        permit.release()
+
+    def test_higher_priority_served_first(self):
+        """Test that classes are served strictly by priority, FIFO within one."""
+        scheduler = make_scheduler()
+        order = asyncio.run(serve_in_order(scheduler, [
+            ("batch-1", WorkContext(BATCH)),
+            ("background", WorkContext(BACKGROUND)),
+            ("interactive", WorkContext(INTERACTIVE)),
+            ("batch-2", WorkContext(BATCH)),
+        ]))
+        assert order == ["interactive", "batch-1", "batch-2", "background"]
+
+    def test_tenants_share_fairly(self):
+        """Test that a tenant's backlog does not delay another tenant's requests."""
+        scheduler = make_scheduler()
+        jobs = [(f"a{i}", WorkContext(BATCH, "a")) for i in range(4)]
+        jobs += [(f"b{i}", WorkContext(BATCH, "b")) for i in range(2)]
+        order = asyncio.run(serve_in_order(scheduler, jobs))
+        assert order == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+    def test_tenant_weights(self):
+        """Test that a tenant with twice the weight gets twice the slots."""
+        scheduler = make_scheduler(tenant_weights={"a": 2})
+        jobs = [(f"a{i}", WorkContext(BATCH, "a")) for i in range(4)]
+        jobs += [(f"b{i}", WorkContext(BATCH, "b")) for i in range(2)]
+        order = asyncio.run(serve_in_order(scheduler, jobs))
+        assert order == ["a0", "a1", "b0", "a2", "a3", "b1"]
+
+    def test_expired_work_dropped_at_dispatch(self):
+        """Test that a request past its deadline is dropped instead of sent."""
+        clock = FakeClock()
+        scheduler = make_scheduler(clock)
+
+        async def run():
+            held = await scheduler.acquire_async()
+            expiring = asyncio.ensure_future(
+                scheduler.acquire_async(WorkContext(BATCH, deadline=5.0))
+            )
+            waiting = asyncio.ensure_future(scheduler.acquire_async(WorkContext(BATCH)))
+            await asyncio.sleep(0)
+            clock.now = 10.0
+            held.release(FAILURE)
+            with pytest.raises(DeadlineExceededError):
+                await expiring
+            (await waiting).release(FAILURE)
+
+        asyncio.run(run())
+        stats = by_priority(scheduler)[BATCH]
+        assert (stats.dispatched, stats.dropped, stats.queue_depth) == (1, 1, 0)
+        assert stats.wait.max == 10.0
+
+    def test_expired_on_arrival(self):
+        """Test that work whose deadline already passed is never queued."""
+        clock = FakeClock()
+        clock.now = 5.0
+        scheduler = make_scheduler(clock)
+        with pytest.raises(DeadlineExceededError):
+            scheduler.acquire(WorkContext(deadline=1.0))
+        assert by_priority(scheduler)[INTERACTIVE].dropped == 1
+
+    def test_blocking_wait_times_out(self):
+        """Test that a thread stops waiting at its deadline."""
+        scheduler = make_scheduler(time.monotonic)
+        held = scheduler.acquire()
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            scheduler.acquire(WorkContext(BATCH, deadline=started + 0.05))
+        assert time.monotonic() - started < 1.0
+        assert by_priority(scheduler)[BATCH].queue_depth == 0
+        held.release(FAILURE)
+
+    def test_cancelled_waiter_gives_up_its_place(self):
+        """Test that a cancelled async request is removed from the queue."""
+        scheduler = make_scheduler()
+
+        async def run():
+            held = await scheduler.acquire_async()
+            cancelled = asyncio.ensure_future(scheduler.acquire_async(WorkContext(BATCH)))
+            waiting = asyncio.ensure_future(scheduler.acquire_async(WorkContext(BATCH)))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            held.release(FAILURE)
+            (await waiting).release(FAILURE)
+
+        asyncio.run(run())
+        stats = by_priority(scheduler)[BATCH]
+        assert (stats.dispatched, stats.dropped) == (1, 1)
+        assert scheduler.limiter.stats.in_flight == 0
+
+    def test_slots_freed_by_threads(self):
+        """Test that blocked threads are woken as other threads release slots."""
+        scheduler = make_scheduler(time.monotonic)
+        served = []
+        lock = threading.Lock()
+
+        def job(i):
+            with work_context(BATCH if i % 2 else INTERACTIVE):
+                permit = scheduler.acquire()
+            with lock:
+                served.append(i)
+            time.sleep(0.001)
+            permit.release(FAILURE)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(job, range(16)))
+        assert sorted(served) == list(range(16))
+        assert sum(s.dispatched for s in scheduler.stats) == 16
+
+    def test_render_prometheus(self):
+        """Test that per-class series carry a priority label."""
+        scheduler = make_scheduler()
+        scheduler.acquire().release()
+        text = "\n".join(scheduler.render_prometheus("summarizer"))
+        assert "# TYPE summarizer_scheduler_queue_depth gauge" in text
+        assert 'summarizer_scheduler_dispatched_total{priority="interactive"} 1' in text
+        assert "# TYPE summarizer_scheduler_wait_seconds summary" in text
+        assert 'summarizer_scheduler_wait_seconds{priority="background",quantile="0.99"}' in text
+        assert 'summarizer_scheduler_wait_seconds_count{priority="interactive"} 1' in text
+        assert 'summarizer_scheduler_wait_seconds_sum{priority="interactive"} 0' in text
+
+
+class TestServiceScheduling:
+    """Tests for SummarizerService with a scheduler."""
+
+    def test_requests_tagged_by_context(self, stub_server):
+        """Test that chunk requests on worker threads keep the caller's class."""
+        scheduler = make_scheduler()
+        text = " ".join(["Sentence number filler goes here."] * 100)
+        service = SummarizerService(
+            api_key="key", api_url=stub_server.url, chunk_tokens=100, scheduler=scheduler
+        )
+        with service, work_context(BACKGROUND, "reports"):
+            assert service.summarize_long(text).success
+        stats = by_priority(scheduler)
+        assert stats[BACKGROUND].dispatched > 1
+        assert stats[INTERACTIVE].dispatched == 0
+        assert service.limiter is scheduler.limiter
+
+    def test_expired_request_not_sent(self, stub_server):
+        """Test that work whose caller gave up fails without an upstream call."""
+        calls = []
+        stub_server.responder = (
+            lambda handler, body: calls.append(body) or (200, {}, [{"summary_text": "ok"}])
+        )
+        scheduler = make_scheduler(time.monotonic)
+        service = SummarizerService(api_key="key", api_url=stub_server.url, scheduler=scheduler)
+        with service, work_context(timeout=0):
+            result = service.summarize("A request nobody is waiting for any more.")
+        assert result.error == "Deadline exceeded"
+        assert result.attempts == 1
+        assert calls == []
+
+    def test_async_requests_scheduled(self, stub_server):
+        """Test that asummarize waits in the scheduler's queue."""
+        pytest.importorskip("httpx")
+        scheduler = make_scheduler()
+
+        async def run():
+            async with SummarizerService(
+                api_key="key", api_url=stub_server.url, scheduler=scheduler
+            ) as service:
+                with work_context(BATCH, "acme"):
+                    return await asyncio.gather(*(
+                        service.asummarize(f"Concurrent text {i} to schedule.") for i in range(4)
+                    ))
+
+        assert all(r.success for r in asyncio.run(run()))
+        assert by_priority(scheduler)[BATCH].dispatched == 4
+        assert scheduler.limiter.stats.in_flight == 0
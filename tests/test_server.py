@@ -0,0 +1,261 @@
+"""
+Tests for the HTTP API server.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from src.ai_summarizer.core.breaker import CircuitBreaker
+from src.ai_summarizer.core.concurrency import AdaptiveLimiter
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.routing import ERROR, EndpointPool
+from src.ai_summarizer.core.scheduling import PriorityScheduler
+from src.ai_summarizer.core.summarizer import SummarizerService
+from src.ai_summarizer.health import HealthChecker
+from src.ai_summarizer.server import SummaryServer
+
+pytest.importorskip("httpx")
+
+TEXT = "An HTTP endpoint lets other services summarize without the UI."
+
+
+@pytest.fixture
+def api_server(stub_server):
+    """Run a SummaryServer on a background event loop."""
+    service = SummarizerService(
+        api_key="key",
+        api_url=stub_server.url,
+        retry_policy=RetryPolicy.disabled()
+    )
+    server = SummaryServer(
+        service,
+        health=HealthChecker(),
+        min_text_length=10,
+        max_text_length=200,
+        max_concurrency=2,
+        max_batch_size=3
+    )
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start("127.0.0.1", 0), loop).result()
+    host, port = server.address
+    server.url = f"http://{host}:{port}"
+    server.upstream = stub_server
+    yield server
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+    service.close()
+
+
+class TestSummarizeEndpoint:
+    """Tests for POST /summarize."""
+
+    def test_success(self, api_server):
+        """Test that a valid request returns the summary result."""
+        response = requests.post(f"{api_server.url}/summarize", json={"text": TEXT})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        assert body["summary"] == TEXT[:20]
+        assert api_server.health.get_metrics()["total_requests"] == 1
+
+    def test_text_too_short(self, api_server):
+        """Test that validation failures return 422 without an upstream call."""
+        response = requests.post(f"{api_server.url}/summarize", json={"text": "short"})
+        assert response.status_code == 422
+        assert "too short" in response.json()["error"]
+
+    def test_body_too_large(self, api_server):
+        """Test that oversized bodies are refused before being read."""
+        response = requests.post(
+            f"{api_server.url}/summarize", json={"text": "x" * 10000}
+        )
+        assert response.status_code == 413
+        assert response.headers["Connection"] == "close"
+
+    def test_invalid_json(self, api_server):
+        """Test that a malformed body returns 400."""
+        response = requests.post(f"{api_server.url}/summarize", data=b"{not json")
+        assert response.status_code == 400
+
+    def test_invalid_lengths(self, api_server):
+        """Test that inconsistent length bounds return 400."""
+        response = requests.post(
+            f"{api_server.url}/summarize",
+            json={"text": TEXT, "max_length": 10, "min_length": 20}
+        )
+        assert response.status_code == 400
+
+    def test_boolean_lengths_rejected(self, api_server):
+        """Test that JSON booleans are not accepted as lengths."""
+        response = requests.post(
+            f"{api_server.url}/summarize",
+            json={"text": TEXT, "max_length": True, "min_length": True}
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("partial", [
+        b"POST /summarize HTTP/1.1\r\nHost: x\r\n",
+        b"POST /summarize HTTP/1.1\r\nContent-Length: 50\r\n\r\n{\"text\": ",
+    ])
+    def test_stalled_request_times_out(self, api_server, partial):
+        """Test that a client stalling after the request line gets 408."""
+        api_server.read_timeout = 0.2
+        with socket.create_connection(api_server.address, timeout=2) as sock:
+            sock.sendall(partial)
+            reply = sock.makefile("rb").read()
+        assert reply.startswith(b"HTTP/1.1 408")
+        assert b"Connection: close" in reply
+
+    def test_invalid_priority(self, api_server):
+        """Test that an unknown priority class returns 400."""
+        response = requests.post(
+            f"{api_server.url}/summarize", json={"text": TEXT, "priority": "urgent"}
+        )
+        assert response.status_code == 400
+        assert "interactive" in response.json()["error"]
+
+    def test_upstream_failure(self, api_server):
+        """Test that an upstream error maps to 502 and counts as an error."""
+        api_server.upstream.responder = lambda handler, body: (400, {}, {"error": "bad"})
+        response = requests.post(f"{api_server.url}/summarize", json={"text": TEXT})
+        assert response.status_code == 502
+        assert response.json()["success"] is False
+        assert api_server.health.get_metrics()["total_errors"] == 1
+
+    def test_sheds_load_over_concurrency_limit(self, api_server):
+        """Test that requests beyond max_concurrency get 503 with Retry-After."""
+        def slow(handler, body):
+            time.sleep(0.3)
+            return 200, {}, [{"summary_text": "slow"}]
+
+        api_server.upstream.responder = slow
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(pool.map(
+                lambda i: requests.post(
+                    f"{api_server.url}/summarize", json={"text": f"{TEXT} {i}"}
+                ),
+                range(4)
+            ))
+        statuses = sorted(r.status_code for r in responses)
+        assert statuses == [200, 200, 503, 503]
+        rejected = next(r for r in responses if r.status_code == 503)
+        assert rejected.headers["Retry-After"] == "1"
+
+
+class TestBatchEndpoint:
+    """Tests for POST /summarize/batch."""
+
+    def test_mixed_results(self, api_server):
+        """Test that invalid texts fail individually."""
+        response = requests.post(
+            f"{api_server.url}/summarize/batch",
+            json={"texts": [TEXT, "short", TEXT + " again"]}
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[0]["summary"] == TEXT[:20]
+
+    def test_too_many_texts(self, api_server):
+        """Test that batches over max_batch_size are rejected."""
+        response = requests.post(
+            f"{api_server.url}/summarize/batch", json={"texts": [TEXT] * 4}
+        )
+        assert response.status_code == 413
+
+    def test_scheduled_as_batch(self, api_server):
+        """Test that batches default to the batch class under the X-Tenant tenant."""
+        scheduler = PriorityScheduler(AdaptiveLimiter())
+        api_server.service.scheduler = scheduler
+        response = requests.post(
+            f"{api_server.url}/summarize/batch",
+            json={"texts": [TEXT, TEXT + " again"]},
+            headers={"X-Tenant": "acme"}
+        )
+        assert response.status_code == 200
+        stats = {s.priority: s for s in scheduler.stats}
+        assert stats["batch"].dispatched == 1
+        assert stats["interactive"].dispatched == 0
+
+
+class TestOperationalEndpoints:
+    """Tests for routing, /health and /metrics."""
+
+    def test_health(self, api_server):
+        """Test that /health returns the health status."""
+        body = requests.get(f"{api_server.url}/health").json()
+        assert body["status"] == "healthy"
+        assert "api_configured" in body["checks"]
+
+    def test_health_unavailable_while_circuit_open(self, api_server):
+        """Test that /health returns 503 while requests fail fast."""
+        api_server.health.breaker = CircuitBreaker(failure_threshold=1)
+        api_server.health.breaker.record(ERROR)
+        response = requests.get(f"{api_server.url}/health")
+        assert response.status_code == 503
+        assert response.json()["status"] == "unhealthy"
+
+    def test_metrics_prometheus(self, api_server):
+        """Test that /metrics serves Prometheus text with server gauges."""
+        requests.post(f"{api_server.url}/summarize", json={"text": TEXT})
+        response = requests.get(f"{api_server.url}/metrics")
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert "summarizer_requests_total 1" in response.text
+        assert "summarizer_server_rejected_total 0" in response.text
+
+    def test_metrics_json(self, api_server):
+        """Test that /metrics?format=json returns the metrics dictionary."""
+        body = requests.get(f"{api_server.url}/metrics?format=json").json()
+        assert body["server"] == {"active": 0, "rejected": 0}
+        assert "60s" in body["latency"]
+
+    def test_metrics_include_endpoints(self, api_server):
+        """Test that a routed service adds per-endpoint series."""
+        api_server.service.endpoints = EndpointPool([api_server.upstream.url])
+        requests.post(f"{api_server.url}/summarize", json={"text": TEXT})
+        text = requests.get(f"{api_server.url}/metrics").text
+        assert f'summarizer_endpoint_requests_total{{endpoint="{api_server.upstream.url}"}} 1' in text
+        body = requests.get(f"{api_server.url}/metrics?format=json").json()
+        assert body["endpoints"][0]["requests"] == 1
+
+    def test_metrics_include_scheduler(self, api_server):
+        """Test that a scheduled service adds per-class queue series."""
+        api_server.service.scheduler = PriorityScheduler(AdaptiveLimiter())
+        requests.post(f"{api_server.url}/summarize", json={"text": TEXT})
+        text = requests.get(f"{api_server.url}/metrics").text
+        assert 'summarizer_scheduler_dispatched_total{priority="interactive"} 1' in text
+        body = requests.get(f"{api_server.url}/metrics?format=json").json()
+        assert body["scheduler"][0]["queue_depth"] == 0
+
+    def test_unknown_route_and_method(self, api_server):
+        """Test 404 for unknown paths and 405 for wrong methods."""
+        assert requests.get(f"{api_server.url}/nope").status_code == 404
+        assert requests.get(f"{api_server.url}/summarize").status_code == 405
+
+    def test_keep_alive(self, api_server):
+        """Test that several requests share one connection."""
+        host, port = api_server.address
+        request = (
+            f"GET /health HTTP/1.1\r\nHost: {host}\r\n\r\n"
+        ).encode()
+        with socket.create_connection((host, port), timeout=2) as sock:
+            reader = sock.makefile("rb")
+            for _ in range(3):
+                sock.sendall(request)
+                assert reader.readline().startswith(b"HTTP/1.1 200")
+                headers = {}
+                for line in iter(reader.readline, b"\r\n"):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.lower()] = value.strip()
+                assert headers["connection"] == "keep-alive"
+                json.loads(reader.read(int(headers["content-length"])))
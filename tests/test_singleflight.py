@@ -0,0 +1,139 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.ai_summarizer.core.singleflight import SingleFlight
+from src.ai_summarizer.core.summarizer import SummarizerService
+
+
+def slow_responder(delay):
+    def responder(handler, body):
+        time.sleep(delay)
+        return 200, {}, [{"summary_text": "shared summary"}]
+    return responder
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+    
+    def test_concurrent_calls_coalesce(self):
+        """Test that callers during an in-flight call share its result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        
+        def fn():
+            calls.append(1)
+            release.wait(1)
+            return "value"
+        
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(flight.do, "k", fn) for _ in range(5)]
+            while flight.stats.coalesced < 4:
+                time.sleep(0.001)
+            release.set()
+            outcomes = [f.result() for f in futures]
+        
+        assert len(calls) == 1
+        assert [value for value, _ in outcomes] == ["value"] * 5
+        assert sorted(shared for _, shared in outcomes) == [False] + [True] * 4
+        assert flight.stats.in_flight == 0
+    
+    def test_sequential_calls_not_coalesced(self):
+        """Test that a finished call is not reused."""
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == (1, False)
+        assert flight.do("k", lambda: 2) == (2, False)
+        assert flight.stats.leaders == 2
+    
+    def test_error_shared(self):
+        """Test that followers receive the leader's exception."""
+        flight = SingleFlight()
+        release = threading.Event()
+        
+        def fn():
+            release.wait(1)
+            raise RuntimeError("upstream down")
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(flight.do, "k", fn) for _ in range(2)]
+            while flight.stats.coalesced < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError):
+                    future.result()
+    
+    def test_async_coalesce(self):
+        """Test that coroutines share one call."""
+        flight = SingleFlight()
+        calls = []
+        
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+        
+        async def run():
+            return await asyncio.gather(*(flight.ado("k", fn) for _ in range(4)))
+        
+        outcomes = asyncio.run(run())
+        assert len(calls) == 1
+        assert [shared for _, shared in outcomes] == [False, True, True, True]
+    
+    def test_cancelled_waiter_keeps_call_alive(self):
+        """Test that a waiter's deadline does not cancel the shared call."""
+        flight = SingleFlight()
+        calls = []
+        
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+        
+        async def run():
+            impatient = asyncio.wait_for(flight.ado("k", fn), 0.01)
+            patient = flight.ado("k", fn)
+            return await asyncio.gather(impatient, patient, return_exceptions=True)
+        
+        impatient, patient = asyncio.run(run())
+        assert isinstance(impatient, asyncio.TimeoutError)
+        assert patient[0] == "value"
+        assert len(calls) == 1
+
+
+class TestServiceCoalescing:
+    """Tests for coalescing in SummarizerService."""
+    
+    def test_identical_requests_share_one_call(self, stub_server, sample_text):
+        """Test that concurrent identical summaries make one upstream call."""
+        stub_server.responder = slow_responder(0.1)
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(lambda _: service.summarize(sample_text), range(6)))
+        
+        assert all(r.summary == "shared summary" for r in results)
+        assert service.transport.stats.requests == 1
+        assert sum(r.coalesced for r in results) == 5
+        assert service.single_flight.stats.coalesced == 5
+    
+    def test_async_identical_requests(self, stub_server, sample_text):
+        """Test coalescing on the async path."""
+        pytest.importorskip("httpx")
+        stub_server.responder = slow_responder(0.05)
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        
+        async def run():
+            async with service:
+                return await service.asummarize_many([sample_text] * 4)
+        
+        results = asyncio.run(run())
+        assert sum(r.coalesced for r in results) == 3
+        assert service.single_flight.stats.leaders == 1
@@ -0,0 +1,296 @@
+"""
+Tests for streaming summaries.
+"""
+
+import json
+
+import pytest
+from src.ai_summarizer.core.cache import SummaryCache
+from src.ai_summarizer.core.concurrency import AdaptiveLimiter
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.streaming import (
+    StreamEvent,
+    SummaryStream,
+    parse_sse,
+    token_segments,
+)
+from src.ai_summarizer.core.summarizer import SummarizerService
+from src.ai_summarizer.core.transport import PooledTransport
+from src.ai_summarizer.exceptions import APIError
+from tests.conftest import sse_responder
+
+TEXT = "Streaming lets the reader start on the summary before it is finished."
+
+
+def make_service(stub_server, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0.01, jitter=0))
+    return SummarizerService(
+        api_key="test_api_key",
+        api_url=stub_server.url,
+        stream_url=stub_server.url,
+        **kwargs
+    )
+
+
+class TestParseSse:
+    """Tests for parse_sse."""
+
+    def test_events_split_on_blank_lines(self):
+        """Test that data lines are dispatched at each blank line."""
+        lines = ["data: one", "", "data:two", "", ""]
+        assert [e.data for e in parse_sse(lines)] == ["one", "two"]
+
+    def test_multiline_data_and_event_name(self):
+        """Test that data fields accumulate and event names are kept."""
+        lines = ["event: error", "data: a", "data: b", ""]
+        assert list(parse_sse(lines)) == [StreamEvent(data="a\nb", event="error")]
+
+    def test_comments_and_unknown_fields_ignored(self):
+        """Test that keep-alive comments and other fields are skipped."""
+        lines = [": ping", "id: 7", "retry: 100", "data: x", ""]
+        assert [e.data for e in parse_sse(lines)] == ["x"]
+
+    def test_done_sentinel_stops(self):
+        """Test that a [DONE] event ends the stream."""
+        lines = ["data: x", "", "data: [DONE]", "", "data: y", ""]
+        assert [e.data for e in parse_sse(lines)] == ["x"]
+
+    def test_trailing_event_without_blank_line(self):
+        """Test that an event cut off at end of body is still dispatched."""
+        assert [e.data for e in parse_sse(["data: x"])] == ["x"]
+
+
+class TestTokenSegments:
+    """Tests for token_segments."""
+
+    def test_special_tokens_skipped(self):
+        """Test that only non-special token text is yielded."""
+        events = [
+            StreamEvent(json.dumps({"token": {"text": "Hi", "special": False}})),
+            StreamEvent(json.dumps({"token": {"text": "</s>", "special": True}})),
+        ]
+        assert list(token_segments(events)) == ["Hi"]
+
+    def test_error_event_raises(self):
+        """Test that an error reported in the stream raises APIError."""
+        events = [StreamEvent(json.dumps({"error": "overloaded"}))]
+        with pytest.raises(APIError, match="overloaded"):
+            list(token_segments(events))
+
+    def test_invalid_json_raises(self):
+        """Test that a malformed event raises APIError."""
+        with pytest.raises(APIError):
+            list(token_segments([StreamEvent("not json")]))
+
+
+class TestSummaryStream:
+    """Tests for SummaryStream."""
+
+    def test_result_set_after_iteration(self):
+        """Test that the generator's return value becomes the result."""
+        def segments():
+            yield "a"
+            yield "b"
+            return "done"
+
+        stream = SummaryStream(segments())
+        assert list(stream) == ["a", "b"]
+        assert stream.result == "done"
+        assert stream.first_segment_seconds is not None
+
+    def test_read_consumes_rest(self):
+        """Test that read() drains the stream and returns the result."""
+        def segments():
+            yield "a"
+            return "done"
+
+        assert SummaryStream(segments()).read() == "done"
+
+
+class TestSummarizeStream:
+    """Tests for SummarizerService.summarize_stream against a local server."""
+
+    def test_segments_arrive_in_order(self, stub_server):
+        """Test that tokens are yielded as streamed and summed into a result."""
+        stub_server.responder = sse_responder(["Stream", "ing", " works", "."])
+        with make_service(stub_server) as service:
+            stream = service.summarize_stream(TEXT)
+            segments = list(stream)
+        assert segments == ["Stream", "ing", " works", "."]
+        assert stream.result.success
+        assert stream.result.summary == "Streaming works."
+        assert stream.result.output_words == 2
+        assert stream.result.input_length == len(TEXT)
+
+    def test_payload_requests_streaming(self, stub_server):
+        """Test that the request asks a text-generation endpoint to stream."""
+        bodies = []
+        respond = sse_responder(["ok"])
+
+        def recording(handler, body):
+            bodies.append(json.loads(body))
+            return respond(handler, body)
+
+        stub_server.responder = recording
+        with make_service(stub_server) as service:
+            service.summarize_stream(TEXT, max_length=42).read()
+        assert bodies[0]["stream"] is True
+        assert bodies[0]["parameters"]["max_new_tokens"] == 42
+        assert TEXT in bodies[0]["inputs"]
+
+    def test_first_segment_before_stream_ends(self, stub_server):
+        """Test that the first segment is seen before generation finishes."""
+        stub_server.responder = sse_responder(["a", "b", "c", "d"], delay=0.1)
+        with make_service(stub_server) as service:
+            stream = service.summarize_stream(TEXT)
+            result = stream.read()
+        assert result.success
+        assert stream.first_segment_seconds < result.elapsed_seconds / 2
+
+    def test_retries_before_first_segment(self, stub_server):
+        """Test that a transient failure before streaming is retried."""
+        calls = []
+        respond = sse_responder(["ok"])
+
+        def flaky(handler, body):
+            calls.append(1)
+            if len(calls) == 1:
+                return 503, {}, {"error": "unavailable"}
+            return respond(handler, body)
+
+        stub_server.responder = flaky
+        with make_service(stub_server) as service:
+            result = service.summarize_stream(TEXT).read()
+        assert result.success
+        assert result.attempts == 2
+
+    def test_failure_mid_stream_keeps_partial(self, stub_server):
+        """Test that an error after some tokens returns the partial summary."""
+        def broken(handler, body):
+            def events():
+                yield {"token": {"text": "Partial", "special": False}}
+                yield {"error": "Model crashed"}
+            return 200, {}, events()
+
+        stub_server.responder = broken
+        with make_service(stub_server) as service:
+            stream = service.summarize_stream(TEXT)
+            segments = list(stream)
+        assert segments == ["Partial"]
+        assert not stream.result.success
+        assert stream.result.summary == "Partial"
+        assert "Model crashed" in stream.result.error
+        assert stream.result.attempts == 1
+
+    def test_fallback_when_nothing_streamed(self, stub_server):
+        """Test that the local engine covers an upstream that never streams."""
+        stub_server.responder = lambda handler, body: (400, {}, {"error": "bad"})
+        long_text = " ".join(
+            f"Sentence number {i} talks about streaming summaries." for i in range(10)
+        )
+        with make_service(stub_server, fallback=True) as service:
+            stream = service.summarize_stream(long_text)
+            segments = list(stream)
+        assert stream.result.success
+        assert stream.result.engine == "extractive"
+        assert segments == [stream.result.summary]
+
+    def test_empty_stream_is_a_failure(self, stub_server):
+        """Test that a 200 without token events falls back and is not cached."""
+        stub_server.responder = lambda handler, body: (200, {}, [{"summary_text": "x"}])
+        long_text = " ".join(
+            f"Sentence number {i} talks about streaming summaries." for i in range(10)
+        )
+        cache = SummaryCache()
+        with make_service(stub_server, fallback=True, cache=cache) as service:
+            stream = service.summarize_stream(long_text)
+            segments = list(stream)
+        assert stream.result.success
+        assert stream.result.engine == "extractive"
+        assert segments == [stream.result.summary]
+        assert len(cache) == 0
+
+    def test_cached_result_replayed(self, stub_server):
+        """Test that a repeated stream is served from the cache."""
+        calls = []
+        respond = sse_responder(["Cached", " once"])
+
+        def counting(handler, body):
+            calls.append(1)
+            return respond(handler, body)
+
+        stub_server.responder = counting
+        with make_service(stub_server, cache=SummaryCache()) as service:
+            service.summarize_stream(TEXT).read()
+            stream = service.summarize_stream(TEXT)
+            segments = list(stream)
+        assert len(calls) == 1
+        assert segments == ["Cached once"]
+        assert stream.result.cached
+
+    def test_close_releases_connection(self, stub_server):
+        """Test that abandoning a stream frees its limiter slot."""
+        stub_server.responder = sse_responder(["a", "b", "c"])
+        with make_service(stub_server, limiter=AdaptiveLimiter()) as service:
+            stream = service.summarize_stream(TEXT)
+            assert next(stream) == "a"
+            stream.close()
+            assert service.limiter.stats.in_flight == 0
+            assert service.summarize_stream(TEXT).read().summary == "abc"
+
+    def test_without_stream_url_yields_whole_summary(self, stub_server):
+        """Test that a service without a stream endpoint yields one segment."""
+        service = SummarizerService(api_key="test_api_key", api_url=stub_server.url)
+        stream = service.summarize_stream(TEXT)
+        assert list(stream) == [TEXT[:20]]
+        assert stream.result.success
+        service.close()
+
+    def test_long_input_reduced_before_summary(self, stub_server):
+        """Test that text over one chunk goes through map-reduce, not one prompt."""
+        bodies = []
+
+        def recording(handler, body):
+            bodies.append(json.loads(body))
+            return 200, {}, [{"summary_text": "Reduced part."}]
+
+        stub_server.responder = recording
+        long_text = "\n\n".join(
+            f"Paragraph {i} explains one more detail of the report." for i in range(60)
+        )
+        with make_service(stub_server, chunk_tokens=100) as service:
+            stream = service.summarize_stream(long_text)
+            segments = list(stream)
+        assert stream.result.success
+        assert stream.result.chunk_count > 1
+        assert segments == [stream.result.summary]
+        assert not any(body.get("stream") for body in bodies)
+
+    def test_invalid_input(self, stub_server):
+        """Test that invalid input fails without a request."""
+        with make_service(stub_server) as service:
+            stream = service.summarize_stream("   ")
+            assert list(stream) == []
+        assert not stream.result.success
+
+
+class TestPostStream:
+    """Tests for PooledTransport.post_stream."""
+
+    def test_lines_and_status(self, stub_server):
+        """Test that the body is exposed line by line."""
+        stub_server.responder = sse_responder(["x"])
+        with PooledTransport() as transport:
+            with transport.post_stream(stub_server.url, json_body={}) as stream:
+                lines = list(stream.iter_lines())
+        assert stream.status_code == 200
+        assert lines[0].startswith("data:")
+
+    def test_read_non_streaming_body(self, stub_server):
+        """Test that a plain error body can be read in full."""
+        stub_server.responder = lambda handler, body: (500, {}, {"error": "boom"})
+        with PooledTransport() as transport:
+            with transport.post_stream(stub_server.url, json_body={}) as stream:
+                response = stream.read()
+        assert response.status_code == 500
+        assert response.json() == {"error": "boom"}
@@ -0,0 +1,122 @@
+"""
+Tests for the summarizer service.
+"""
+
+import json
+
+import pytest
+from src.ai_summarizer.core.cache import SummaryCache
+from src.ai_summarizer.core.summarizer import SummarizerService, SummaryResult
+from src.ai_summarizer.core.transport import PooledTransport, TransportResponse
+
+
+@pytest.fixture
+def fake_post(monkeypatch):
+    """Replace the pooled transport with a recorder returning short summaries."""
+    calls = []
+    
+    def post(self, url, headers=None, json_body=None, timeout=None, content=None):
+        if content is not None:
+            json_body = json.loads(content)
+        calls.append(json_body)
+        summary = [{"summary_text": json_body["inputs"][:20]}]
+        return TransportResponse(200, json.dumps(summary).encode(), {}, url)
+    
+    monkeypatch.setattr(PooledTransport, "post", post)
+    return calls
+
+
+class TestSummarize:
+    """Tests for SummarizerService.summarize."""
+    
+    def test_missing_api_key(self):
+        """Test that a missing key fails without a request."""
+        result = SummarizerService(api_key="").summarize("text")
+        assert result.success is False
+        assert "API key" in result.error
+    
+    def test_success(self, summarizer_service, sample_text, fake_post):
+        """Test a successful single-request summary."""
+        result = summarizer_service.summarize(sample_text)
+        assert result.success is True
+        # Whitespace is collapsed before the text is sent
+        assert result.summary == " ".join(sample_text.split())[:20]
+        assert len(fake_post) == 1
+
+
+class TestSummarizeLong:
+    """Tests for SummarizerService.summarize_long."""
+    
+    def test_short_text_single_request(self, sample_text, fake_post):
+        """Test that text within budget is summarized in one call."""
+        service = SummarizerService(api_key="key", chunk_tokens=1000)
+        result = service.summarize_long(sample_text)
+        assert result.success is True
+        assert result.levels == []
+        assert len(fake_post) == 1
+    
+    def test_long_text_is_reduced(self, fake_post):
+        """Test that long text is chunked and reduced level by level."""
+        text = " ".join(["Sentence number filler goes here."] * 400)
+        service = SummarizerService(api_key="key", chunk_tokens=100)
+        result = service.summarize_long(text)
+        
+        assert result.success is True
+        assert result.input_length == len(text)
+        assert len(result.levels) >= 1
+        assert result.levels[0].chunk_count > 1
+        assert result.chunk_count == sum(l.chunk_count for l in result.levels)
+        assert len(fake_post) == result.chunk_count + 1
+        assert all(len(p["inputs"]) <= 400 for p in fake_post)
+    
+    def test_long_text_leaves_cache_intact(self, fake_post):
+        """Test that the document totals are not written into cached chunk results."""
+        text = " ".join(["Sentence number filler goes here."] * 400)
+        cache = SummaryCache()
+        stored = []
+        put = cache.put
+        cache.put = lambda key, result: stored.append(key) or put(key, result)
+        service = SummarizerService(api_key="key", chunk_tokens=100, cache=cache)
+        result = service.summarize_long(text)
+        
+        assert len(result.levels) >= 1
+        for key in stored:
+            entry = cache.get(key)
+            assert entry is not result
+            assert entry.levels == []
+            assert entry.chunk_count == 1
+            assert entry.input_length < len(text)
+    
+    def test_chunk_failure_fails_result(self, monkeypatch):
+        """Test that a failed chunk fails the whole document."""
+        service = SummarizerService(api_key="key", chunk_tokens=100)
+        monkeypatch.setattr(
+            service,
+            "summarize",
+            lambda *args: SummaryResult(success=False, error="boom")
+        )
+        result = service.summarize_long("Filler sentence here. " * 200)
+        assert result.success is False
+        assert result.error == "boom"
+
+
+class TestPooledTransportIntegration:
+    """Tests for the service running over a real pooled connection."""
+    
+    def test_connections_are_reused(self, stub_server, sample_text):
+        """Test that repeat summaries reuse one keep-alive connection."""
+        with SummarizerService(api_key="key", api_url=stub_server.url) as service:
+            for _ in range(3):
+                assert service.summarize(sample_text).success is True
+            stats = service.transport.stats
+        assert stats.requests == 3
+        assert stats.connections_opened == 1
+        assert stats.pool_hits == 2
+    
+    def test_http_error_status(self, stub_server, sample_text):
+        """Test that an error status becomes a failed result."""
+        stub_server.responder = lambda handler, body: (401, {}, {"error": "no"})
+        service = SummarizerService(api_key="key", api_url=stub_server.url)
+        result = service.summarize(sample_text)
+        assert result.success is False
+        assert "401" in result.error
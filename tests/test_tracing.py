@@ -0,0 +1,153 @@
+"""
+Tests for per-stage tracing spans.
+"""
+
+import json
+import logging
+
+import pytest
+from src.ai_summarizer.core.retry import RetryPolicy
+from src.ai_summarizer.core.summarizer import SummarizerService
+from src.ai_summarizer.tracing import (
+    JsonLinesExporter,
+    RingBufferExporter,
+    SlowRequestLog,
+    Tracer,
+    get_tracer,
+)
+from src.ai_summarizer.utils.helpers import sanitize_text
+from src.ai_summarizer.utils.validators import validate_text
+
+
+@pytest.fixture
+def buffer():
+    """Ring buffer attached to the shared tracer for one test."""
+    exporter = RingBufferExporter()
+    get_tracer().add_exporter(exporter)
+    yield exporter
+    get_tracer().clear_exporters()
+
+
+def traced_service(url, **kwargs):
+    exporter = RingBufferExporter()
+    service = SummarizerService(
+        api_key="key",
+        api_url=url,
+        retry_policy=RetryPolicy.disabled(),
+        tracer=Tracer([exporter]),
+        **kwargs
+    )
+    return service, exporter
+
+
+class TestTracer:
+    """Tests for Tracer class."""
+    
+    def test_disabled_is_noop(self):
+        """Test that a tracer without exporters records nothing."""
+        tracer = Tracer()
+        fn = lambda: None  # noqa: E731
+        with tracer.span("stage") as span:
+            span.set(ignored=True)
+            assert span.trace_id is None
+        assert tracer.wrap(fn) is fn
+    
+    def test_nested_spans_share_trace(self):
+        """Test parent links and trace propagation."""
+        exporter = RingBufferExporter()
+        tracer = Tracer([exporter])
+        with tracer.span("root") as root:
+            with tracer.span("child", size=3) as child:
+                assert tracer.current_trace_id() == root.trace_id
+        child_span, root_span = exporter.spans()
+        assert child_span.parent_id == root.span_id
+        assert child_span.trace_id == root_span.trace_id
+        assert child_span.attributes == {"size": 3}
+        assert root_span.duration >= child_span.duration
+    
+    def test_error_recorded(self):
+        """Test that an exception marks the span."""
+        exporter = RingBufferExporter()
+        tracer = Tracer([exporter])
+        with pytest.raises(ValueError):
+            with tracer.span("failing"):
+                raise ValueError("boom")
+        assert exporter.spans()[0].error == "ValueError"
+    
+    def test_traced_helpers(self, buffer):
+        """Test that validation and sanitization emit spans when enabled."""
+        with get_tracer().span("request"):
+            validate_text("x" * 100)
+            sanitize_text("  text  ")
+        names = [s.name for s in buffer.spans()]
+        assert names == ["validate_text", "sanitize_text", "request"]
+        assert len({s.trace_id for s in buffer.spans()}) == 1
+
+
+class TestExporters:
+    """Tests for span exporters."""
+    
+    def test_json_lines(self, tmp_path):
+        """Test that each span is written as one JSON line."""
+        path = tmp_path / "spans.jsonl"
+        exporter = JsonLinesExporter(str(path))
+        tracer = Tracer([exporter])
+        with tracer.span("a"):
+            with tracer.span("b"):
+                pass
+        tracer.clear_exporters()
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["name"] for r in records] == ["b", "a"]
+        assert records[0]["parent_id"] == records[1]["span_id"]
+    
+    def test_slow_request_log(self, caplog):
+        """Test that slow roots are logged with their stage breakdown."""
+        tracer = Tracer([SlowRequestLog(threshold_seconds=0.0)])
+        with caplog.at_level(logging.WARNING, logger="ai_summarizer.slow"):
+            with tracer.span("summarize"):
+                with tracer.span("upstream"):
+                    pass
+        assert "Slow request summarize" in caplog.text
+        assert "upstream=" in caplog.text
+    
+    def test_slow_request_log_sampling(self, caplog):
+        """Test that a zero sample rate logs nothing."""
+        tracer = Tracer([SlowRequestLog(threshold_seconds=0.0, sample_rate=0.0)])
+        with caplog.at_level(logging.WARNING, logger="ai_summarizer.slow"):
+            with tracer.span("summarize"):
+                pass
+        assert caplog.text == ""
+
+
+class TestServiceTracing:
+    """Tests for spans emitted by SummarizerService."""
+    
+    def test_summarize_stages(self, stub_server, sample_text):
+        """Test that one request is broken into its stages."""
+        service, exporter = traced_service(stub_server.url)
+        service.summarize(sample_text)
+        spans = {s.name: s for s in exporter.spans()}
+        assert set(spans) == {
+            "build_payload", "limiter.acquire", "upstream", "parse", "summarize"
+        }
+        assert spans["upstream"].attributes["status_code"] == 200
+        assert spans["summarize"].attributes["success"] is True
+        assert len({s.trace_id for s in spans.values()}) == 1
+    
+    def test_batch_shares_trace(self, stub_server):
+        """Test that batches on worker threads join the caller's trace."""
+        service, exporter = traced_service(stub_server.url)
+        service.summarize_many(["first text", "second text", "third text"], batch_size=1)
+        spans = exporter.spans()
+        assert sum(s.name == "batch" for s in spans) == 3
+        assert len({s.trace_id for s in spans}) == 1
+    
+    def test_chunked_shares_trace(self, stub_server, sample_text):
+        """Test that chunk summaries join the long-document trace."""
+        service, exporter = traced_service(stub_server.url, chunk_tokens=40)
+        result = service.summarize_long(sample_text * 3)
+        spans = exporter.spans()
+        root = spans[-1]
+        assert root.name == "summarize_long"
+        assert sum(s.name == "summarize" for s in spans) == result.chunk_count + 1
+        assert {s.trace_id for s in spans} == {root.trace_id}
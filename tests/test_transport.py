@@ -0,0 +1,84 @@
+"""
+Tests for the pooled HTTP transport.
+"""
+
+import pytest
+import requests
+from src.ai_summarizer.core.transport import (
+    PooledTransport,
+    TransportConfig,
+    TransportResponse,
+    TransportStats,
+)
+
+
+class TestPooledTransport:
+    """Tests for PooledTransport."""
+    
+    def test_post_returns_response(self, stub_server):
+        """Test that a POST returns the decoded body and status."""
+        with PooledTransport() as transport:
+            response = transport.post(stub_server.url, json_body={"inputs": "hello"})
+        assert response.status_code == 200
+        assert response.json() == [{"summary_text": "hello"}]
+    
+    def test_non_json_body(self, stub_server):
+        """Test that a non-JSON body raises a RequestException, as requests does."""
+        stub_server.responder = lambda handler, body: (200, {}, b"<html>proxy</html>")
+        with PooledTransport() as transport:
+            response = transport.post(stub_server.url, json_body={"inputs": "x"})
+        with pytest.raises(requests.exceptions.RequestException):
+            response.json()
+    
+    def test_legacy_summarize_text_non_json(self, stub_server, monkeypatch):
+        """Test that the root summarize_text reports a non-JSON 200 as a failure."""
+        import summarizer
+        
+        stub_server.responder = lambda handler, body: (200, {}, b"<html>proxy</html>")
+        monkeypatch.setattr(summarizer, "API_URL", stub_server.url)
+        monkeypatch.setattr(summarizer, "get_api_key", lambda: "key")
+        monkeypatch.setattr(summarizer, "_breaker", None)
+        result = summarizer.summarize_text("A long enough text for the legacy summarizer.")
+        assert result == {"success": False, "error": "Unexpected response format from API"}
+    
+    def test_keep_alive_reuses_connection(self, stub_server):
+        """Test that sequential requests share one connection."""
+        with PooledTransport() as transport:
+            for _ in range(5):
+                transport.post(stub_server.url, json_body={"inputs": "x"})
+            stats = transport.stats
+        assert stats.connections_opened == 1
+        assert stats.pool_hits == 4
+        assert stats.pool_misses == 1
+        assert stats.reuse_ratio == pytest.approx(0.8)
+    
+    def test_keep_alive_disabled(self, stub_server):
+        """Test that disabling keep-alive opens a connection per request."""
+        config = TransportConfig(keep_alive=False)
+        with PooledTransport(config) as transport:
+            for _ in range(3):
+                transport.post(stub_server.url, json_body={"inputs": "x"})
+            stats = transport.stats
+        assert stats.connections_opened == 3
+        assert stats.pool_hits == 0
+    
+    def test_connection_error(self):
+        """Test that an unreachable host raises ConnectionError."""
+        with PooledTransport() as transport:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                transport.post("http://127.0.0.1:9/", json_body={}, timeout=1)
+
+
+class TestTransportResponse:
+    """Tests for TransportResponse."""
+    
+    def test_raise_for_status(self):
+        """Test that error statuses raise HTTPError carrying the response."""
+        response = TransportResponse(503, b"{}", {}, "http://x")
+        with pytest.raises(requests.exceptions.HTTPError) as info:
+            response.raise_for_status()
+        assert info.value.response.status_code == 503
+    
+    def test_empty_stats_ratio(self):
+        """Test that an unused transport reports a zero reuse ratio."""
+        assert TransportStats(0, 0, 0, 0).reuse_ratio == 0.0
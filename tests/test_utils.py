@@ -9,6 +9,7 @@ from src.ai_summarizer.utils.helpers import (
     estimate_reading_time,
     truncate_text,
     sanitize_text,
+    text_stats,
 )
 
 
@@ -102,3 +103,38 @@ class TestSanitizeText:
         text = "Hello\n\n\nworld"
         result = sanitize_text(text)
         assert result == "Hello world"
+
+
+class TestTextStats:
+    """Tests for text_stats function."""
+    
+    def test_matches_individual_helpers(self):
+        """Test that figures agree with the single-purpose helpers."""
+        text = "  Hello world.\nThis is   a test! Is it? " * 40
+        stats = text_stats(text)
+        assert stats.words == count_words(text)
+        assert stats.characters == count_characters(text, include_spaces=True)
+        assert stats.characters_no_spaces == count_characters(text)
+        assert stats.reading_time == estimate_reading_time(text)
+    
+    def test_sentence_count(self):
+        """Test sentence counting with and without a final terminator."""
+        assert text_stats("One. Two! Three?").sentences == 3
+        assert text_stats("One. Two! Three").sentences == 3
+        assert text_stats("Wait... what?!").sentences == 2
+    
+    def test_empty(self):
+        """Test that empty text has zero figures."""
+        stats = text_stats("")
+        assert (stats.words, stats.characters, stats.sentences) == (0, 0, 0)
+        assert stats.reading_time == "Less than 1 min"
+    
+    def test_memoized(self):
+        """Test that repeated calls return the cached object."""
+        text = "Memoized text. " * 10
+        assert text_stats(text) is text_stats(text)
+    
+    def test_custom_wpm(self):
+        """Test that reading time uses the given speed."""
+        text = " ".join(["word"] * 600)
+        assert text_stats(text, wpm=100).reading_time == "~6 mins"
@@ -3,7 +3,9 @@ Tests for input validation functions.
 """
 
 import pytest
+from src.ai_summarizer.utils.helpers import sanitize_text, text_stats
 from src.ai_summarizer.utils.validators import (
+    normalize_text,
     validate_text,
     validate_api_key,
     ValidationResult,
@@ -89,3 +91,30 @@ class TestValidationResult:
         result = ValidationResult(is_valid=False, error="Test error")
         assert result.is_valid is False
         assert result.error == "Test error"
+
+
+class TestNormalizeText:
+    """Tests for normalize_text function."""
+    
+    def test_matches_separate_passes(self, sample_text):
+        """Test that one pass agrees with sanitize_text and text_stats."""
+        normalized = normalize_text(sample_text)
+        assert normalized.is_valid is True
+        assert normalized.text == sanitize_text(sample_text)
+        assert normalized.stats == text_stats(normalized.text)
+    
+    def test_digest_ignores_whitespace(self):
+        """Test that whitespace variants share a content hash."""
+        assert normalize_text("a  b\n\nc").digest == normalize_text(" a b c ").digest
+        assert normalize_text("a b c").digest != normalize_text("a b d").digest
+    
+    def test_bounds(self):
+        """Test emptiness and length checks on the normalized text."""
+        assert normalize_text("   \n ").error == "Please enter some text to summarize."
+        assert "too short" in normalize_text("a     b", min_length=5).error
+        assert "too long" in normalize_text("word " * 20, max_length=50).error
+    
+    def test_normalized_input_is_a_lookup(self):
+        """Test that normalizing normalized text reuses the first result."""
+        first = normalize_text("  repeated   input text  ")
+        assert normalize_text(first.text) is first
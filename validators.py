@@ -69,11 +69,5 @@ def sanitize_input(text: str) -> str:
     Returns:
         Sanitized text
     """
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
-    # Replace multiple spaces with single space
-    import re
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text
+    # Strip and collapse whitespace runs to single spaces in one pass
+    return " ".join(text.split())